@@ -0,0 +1,109 @@
+"""Compares the binary format to JSON for a scalar-heavy and an array-heavy dataset.
+
+Usage:
+    python benchmarks/bench_binary.py [n_objects]
+"""
+
+import sys
+import timeit
+
+import numpy as np
+
+from typing import List, Optional
+from numpy.typing import NDArray
+from pydantic import PrivateAttr
+from pydantic_xml import element
+
+from sdRDM import DataModel
+from sdRDM.base.listplus import ListPlus
+
+
+class Measurement(DataModel):
+    id: Optional[str] = None
+    temperature: Optional[float] = None
+    unit: Optional[str] = None
+    values: List[float] = element(tag="values", default_factory=ListPlus)
+
+    _repo: str = PrivateAttr(default="https://www.github.com/benchmark")
+
+
+class Spectrum(DataModel):
+    id: Optional[str] = None
+    signal: Optional[NDArray] = None
+
+    _repo: str = PrivateAttr(default="https://www.github.com/benchmark")
+
+
+class Dataset(DataModel):
+    name: Optional[str] = None
+    measurements: List[Measurement] = element(
+        tag="measurements", default_factory=ListPlus
+    )
+    spectra: List[Spectrum] = element(tag="spectra", default_factory=ListPlus)
+
+    _repo: str = PrivateAttr(default="https://www.github.com/benchmark")
+
+
+def _scalar_dataset(n_objects: int) -> Dataset:
+    return Dataset(
+        name="scalars",
+        measurements=[
+            Measurement(
+                id=f"m{index}",
+                temperature=float(index),
+                unit="K",
+                values=[float(value) for value in range(10)],
+            )
+            for index in range(n_objects)
+        ],
+    )
+
+
+def _array_dataset(n_objects: int) -> Dataset:
+    return Dataset(
+        name="arrays",
+        spectra=[
+            Spectrum(id=f"s{index}", signal=np.random.rand(10_000))
+            for index in range(max(n_objects // 100, 1))
+        ],
+    )
+
+
+def _best(function, repeat: int) -> float:
+    return min(timeit.repeat(function, number=1, repeat=repeat))
+
+
+def main(n_objects: int = 20_000, repeat: int = 3):
+    for label, dataset in [
+        ("Scalar-heavy", _scalar_dataset(n_objects)),
+        ("Array-heavy", _array_dataset(n_objects)),
+    ]:
+        # Arrays are exported as lists by the JSON export
+        content = dataset.json(mode="python")
+        buffer = dataset.to_binary()
+
+        print(f"{label} dataset")
+        print(f"  Size: json {len(content) / 1e6:.1f} MB, binary {len(buffer) / 1e6:.1f} MB")
+
+        print(
+            f"  Export: json {_best(lambda: dataset.json(mode='python'), repeat):.3f} s, "
+            f"binary {_best(dataset.to_binary, repeat):.3f} s"
+        )
+
+        for trusted in (False, True):
+            json_time = _best(
+                lambda: Dataset.from_json_string(content, trusted=trusted), repeat
+            )
+            binary_time = _best(
+                lambda: Dataset.from_binary(buffer, trusted=trusted), repeat
+            )
+            print(
+                f"  Import (trusted={trusted}): json {json_time:.3f} s, "
+                f"binary {binary_time:.3f} s"
+            )
+
+        print()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20_000)
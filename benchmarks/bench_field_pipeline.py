@@ -0,0 +1,142 @@
+"""Compares the validation time of the previous wildcard validators and the compiled field pipelines.
+
+Previously, four validators applied to every field of a data model, each
+looking up the field to decide whether it has anything to do. Now, each
+field is given a single pipeline before and after the type validation,
+composed of the steps relevant to its type, and none for e.g. strings.
+Both are applied to plain pydantic models here, such that only the
+validation itself is measured.
+
+Usage:
+    python benchmarks/bench_field_pipeline.py [n_objects]
+"""
+
+import sys
+import timeit
+import numpy as np
+
+from typing import List, Optional, get_args, get_origin
+from pydantic import BaseModel, field_validator
+
+from sdRDM.base.fieldpipeline import compile_field_pipelines
+from sdRDM.base.listplus import ListPlus
+
+
+class Fields(BaseModel):
+    id: Optional[str] = None
+    name: Optional[str] = None
+    description: Optional[str] = None
+    temperature: Optional[float] = None
+    unit: Optional[str] = None
+    replicates: Optional[int] = None
+    values: List[float] = []
+
+
+class Current(Fields):
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source, handler):
+        compile_field_pipelines(cls)
+
+        return super().__get_pydantic_core_schema__(source, handler)
+
+
+class Previous(Fields):
+    @field_validator("*")
+    @classmethod
+    def _convert_extended_list_and_numpy_strings(cls, value):
+        if isinstance(value, list):
+            return ListPlus(*[cls._convert_numpy_type(v) for v in value], in_setup=True)
+        elif isinstance(value, np.str_):
+            return str(value)
+        else:
+            return value
+
+    @field_validator("*", mode="before")
+    def _convert_lists_to_ndarray(cls, value, info):
+        annotation = cls.model_fields[info.field_name].annotation
+        is_ndarray = any(
+            getattr(dtype, "__name__", None) == "ndarray" for dtype in get_args(annotation)
+        )
+
+        if is_ndarray and isinstance(value, list):
+            return np.array(value)
+
+        return value
+
+    @staticmethod
+    def _convert_numpy_type(value):
+        if isinstance(value, np.str_):
+            return str(value)
+
+        return value
+
+    @field_validator("*")
+    @classmethod
+    def check_list_values(cls, values, info):
+        if not isinstance(values, (list, ListPlus)):
+            return values
+
+        field_type = cls.model_fields[info.field_name].annotation
+        field_type = get_args(field_type) or [field_type]
+
+        for value in values:
+            checks = [
+                (f"List element of type '{type(value)}' cannot be added. Expected type '{subtype}'",
+                 isinstance(value, subtype))
+                for subtype in field_type
+                if subtype is not type(None)
+            ]
+
+            if not any([check[1] for check in checks]):
+                raise TypeError("\n".join([msg for msg, check in checks if check is False]))
+
+        return values
+
+    @field_validator("*", mode="before")
+    @classmethod
+    def convert_numpy_to_appropriate_type(cls, value, info):
+        if not isinstance(value, np.ndarray):
+            return value
+
+        annotation = cls.model_fields[info.field_name].annotation
+
+        if get_origin(annotation) is list:
+            return value.tolist()
+
+        return value
+
+
+def _validate(cls, n_objects: int) -> None:
+    for index in range(n_objects):
+        cls(
+            id=f"m{index}",
+            name="measurement",
+            description="benchmark",
+            temperature=float(index),
+            unit="K",
+            replicates=3,
+            values=[0.5, 1.5, 2.5],
+        )
+
+
+def main(n_objects: int = 20_000, repeat: int = 3):
+    print(f"Validation of {n_objects} objects\n")
+
+    results = {}
+
+    for label, cls in [("previous", Previous), ("current", Current)]:
+        results[label] = min(
+            timeit.repeat(lambda: _validate(cls, n_objects), number=1, repeat=repeat)
+        )
+
+        print(
+            f"  {label}: {results[label]:.3f} s "
+            f"({results[label] / n_objects * 1e6:.1f} µs per object)"
+        )
+
+    saving = (results["previous"] - results["current"]) / n_objects * 1e6
+    print(f"\n  Saving: {saving:.1f} µs per object")
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,104 @@
+"""Compares the JSON backends for exporting and loading a large dataset.
+
+Usage:
+    python benchmarks/bench_json.py [n_objects]
+"""
+
+import json
+import sys
+import timeit
+
+from typing import List, Optional
+from pydantic import PrivateAttr
+from pydantic_xml import element
+
+from sdRDM import DataModel
+from sdRDM.base.ioutils.jsonbackends import get_json_backend, json_backends
+from sdRDM.base.listplus import ListPlus
+
+
+class Measurement(DataModel):
+    id: Optional[str] = None
+    temperature: Optional[float] = None
+    values: List[float] = element(tag="values", default_factory=ListPlus)
+
+    _repo: str = PrivateAttr(default="https://www.github.com/benchmark")
+
+
+class Dataset(DataModel):
+    name: Optional[str] = None
+    measurements: List[Measurement] = element(
+        tag="measurements", default_factory=ListPlus
+    )
+
+    _repo: str = PrivateAttr(default="https://www.github.com/benchmark")
+
+
+def _build_dataset(n_objects: int) -> Dataset:
+    return Dataset(
+        name="benchmark",
+        measurements=[
+            Measurement(
+                id=f"m{index}",
+                temperature=float(index),
+                values=[float(value) for value in range(10)],
+            )
+            for index in range(n_objects)
+        ],
+    )
+
+
+def _available_backends() -> List[str]:
+    backends = []
+
+    for name in json_backends():
+        try:
+            get_json_backend(name)
+        except ImportError:
+            continue
+
+        backends.append(name)
+
+    return backends
+
+
+def main(n_objects: int = 20_000, repeat: int = 3):
+    dataset = _build_dataset(n_objects)
+    content = dataset.json()
+
+    print(f"Dataset with {n_objects} objects ({len(content) / 1e6:.1f} MB)\n")
+    print("Export")
+
+    for name in _available_backends():
+        seconds = min(
+            timeit.repeat(lambda: dataset.json(backend=name), number=1, repeat=repeat)
+        )
+        print(f"  json(backend='{name}'): {seconds:.3f} s")
+
+    print("\nImport")
+
+    baseline = min(
+        timeit.repeat(
+            lambda: Dataset.from_dict(json.loads(content)), number=1, repeat=repeat
+        )
+    )
+    native = min(
+        timeit.repeat(lambda: Dataset.from_json_string(content), number=1, repeat=repeat)
+    )
+
+    print(f"  from_dict(json.loads(...)): {baseline:.3f} s")
+    print(f"  from_json_string (native): {native:.3f} s")
+
+    for name in _available_backends():
+        seconds = min(
+            timeit.repeat(
+                lambda: Dataset.from_json_string(content, backend=name),
+                number=1,
+                repeat=repeat,
+            )
+        )
+        print(f"  from_json_string(backend='{name}'): {seconds:.3f} s")
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
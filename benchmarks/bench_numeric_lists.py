@@ -0,0 +1,93 @@
+"""Compares the validation time of large numeric list fields before and after the bulk checks.
+
+Previously, each element of a list was checked on its own, formatting an
+error message per element even on success, and the list was converted to
+a ListPlus by appending the elements one by one. Now, numeric lists are
+checked at once by the kind of the NumPy array they form and the ListPlus
+is filled in bulk.
+
+Usage:
+    python benchmarks/bench_numeric_lists.py [n_values]
+"""
+
+import sys
+import timeit
+import numpy as np
+
+from typing import List, Optional, get_args
+from pydantic import BaseModel, field_validator
+
+from sdRDM.base.fieldpipeline import compile_field_pipelines
+from sdRDM.base.listplus import ListPlus
+
+
+class Fields(BaseModel):
+    name: Optional[str] = None
+    values: List[float] = []
+
+
+class Current(Fields):
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source, handler):
+        compile_field_pipelines(cls)
+
+        return super().__get_pydantic_core_schema__(source, handler)
+
+
+class Previous(Fields):
+    @field_validator("*")
+    @classmethod
+    def _convert_extended_list_and_numpy_strings(cls, value):
+        if isinstance(value, list):
+            return ListPlus(*[cls._convert_numpy_type(v) for v in value], in_setup=True)
+
+        return value
+
+    @staticmethod
+    def _convert_numpy_type(value):
+        if isinstance(value, np.str_):
+            return str(value)
+
+        return value
+
+    @field_validator("*")
+    @classmethod
+    def check_list_values(cls, values, info):
+        if not isinstance(values, (list, ListPlus)):
+            return values
+
+        field_type = get_args(cls.model_fields[info.field_name].annotation)
+
+        for value in values:
+            checks = [
+                (f"List element of type '{type(value)}' cannot be added. Expected type '{subtype}'",
+                 isinstance(value, subtype))
+                for subtype in field_type
+                if subtype is not type(None)
+            ]
+
+            if not any([check[1] for check in checks]):
+                raise TypeError("\n".join([msg for msg, check in checks if check is False]))
+
+        return values
+
+
+def main(n_values: int = 1_000_000, repeat: int = 3):
+    values = np.random.default_rng(0).random(n_values).tolist()
+
+    print(f"Validation of a list of {n_values} floats\n")
+
+    results = {}
+
+    for label, cls in [("previous", Previous), ("current", Current)]:
+        results[label] = min(
+            timeit.repeat(lambda: cls(name="series", values=values), number=1, repeat=repeat)
+        )
+
+        print(f"  {label}: {results[label]:.3f} s ({n_values / results[label] / 1e6:.1f} M values/s)")
+
+    print(f"\n  Speedup: {results['previous'] / results['current']:.1f}x")
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,125 @@
+"""Compares the construction time of objects with the previously and currently generated validators.
+
+Previously, every generated class captured raw XML data in a model validator
+iterating all attributes, and reference validators imported the referenced
+class on each call. Now, the capture is only generated for classes with raw
+XML attributes and runs for XML input only, and referenced classes are
+resolved by the module-level import.
+
+Usage:
+    python benchmarks/bench_validators.py [n_objects]
+"""
+
+import sys
+import timeit
+
+from typing import Dict, List, Optional
+from lxml.etree import _Element
+from pydantic import PrivateAttr, field_validator, model_validator
+from pydantic_xml import attr, element
+
+from sdRDM import DataModel
+from sdRDM.base.listplus import ListPlus
+from sdRDM.tools.utils import elem2dict
+
+
+class Species(DataModel):
+    id: Optional[str] = attr(name="id", default=None)
+    name: Optional[str] = element(tag="name", default=None)
+
+    _repo: str = PrivateAttr(default="https://www.github.com/benchmark")
+
+
+class Measurement(DataModel):
+    id: Optional[str] = attr(name="id", default=None)
+    species_id: Optional[str] = element(tag="species_id", default=None)
+    temperature: Optional[float] = element(tag="temperature", default=None)
+    unit: Optional[str] = element(tag="unit", default=None)
+    values: List[float] = element(tag="values", default_factory=ListPlus)
+
+    _repo: str = PrivateAttr(default="https://www.github.com/benchmark")
+
+    @field_validator("species_id")
+    def get_species_id_reference(cls, value):
+        if isinstance(value, Species):
+            return value.id
+        elif isinstance(value, str) or value is None:
+            return value
+        else:
+            raise TypeError(f"Expected types [Species, str] got '{type(value).__name__}' instead.")
+
+
+class PreviousMeasurement(DataModel):
+    id: Optional[str] = attr(name="id", default=None)
+    species_id: Optional[str] = element(tag="species_id", default=None)
+    temperature: Optional[float] = element(tag="temperature", default=None)
+    unit: Optional[str] = element(tag="unit", default=None)
+    values: List[float] = element(tag="values", default_factory=ListPlus)
+
+    _repo: str = PrivateAttr(default="https://www.github.com/benchmark")
+    _raw_xml_data: Optional[Dict] = PrivateAttr(default=None)
+
+    @model_validator(mode="after")
+    def _parse_raw_xml_data(self):
+        for name, value in self:
+            if isinstance(value, (ListPlus, list)) and all(
+                isinstance(i, _Element) for i in value
+            ):
+                raw_data = [elem2dict(i) for i in value]
+            elif isinstance(value, _Element):
+                raw_data = elem2dict(value)
+            else:
+                continue
+
+            if self._raw_xml_data is None:
+                self._raw_xml_data = {}
+
+            self._raw_xml_data[name] = raw_data
+
+        return self
+
+    @field_validator("species_id")
+    def get_species_id_reference(cls, value):
+        # Generated as 'from .species import Species'
+        from __main__ import Species
+
+        if isinstance(value, Species):
+            return value.id
+        elif isinstance(value, str) or value is None:
+            return value
+        else:
+            raise TypeError(f"Expected types [Species, str] got '{type(value).__name__}' instead.")
+
+
+def _construct(cls, n_objects: int) -> None:
+    for index in range(n_objects):
+        cls(
+            id=f"m{index}",
+            species_id="s0",
+            temperature=float(index),
+            unit="K",
+            values=[0.5, 1.5],
+        )
+
+
+def main(n_objects: int = 20_000, repeat: int = 3):
+    print(f"Construction of {n_objects} objects\n")
+
+    results = {}
+
+    for label, cls in [("previous", PreviousMeasurement), ("current", Measurement)]:
+        results[label] = min(
+            timeit.repeat(lambda: _construct(cls, n_objects), number=1, repeat=repeat)
+        )
+
+        print(
+            f"  {label}: {results[label]:.3f} s "
+            f"({results[label] / n_objects * 1e6:.1f} µs per object)"
+        )
+
+    saving = (results["previous"] - results["current"]) / n_objects * 1e6
+    print(f"\n  Saving: {saving:.1f} µs per object")
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,91 @@
+"""Compares the XML parse throughput of the element search modes of generated classes.
+
+Usage:
+    python benchmarks/bench_xml_search.py [n_objects]
+"""
+
+import sys
+import timeit
+
+from typing import List, Optional, Tuple
+from pydantic import PrivateAttr
+from pydantic_xml import attr, element, wrapped
+
+from sdRDM import DataModel
+from sdRDM.base.listplus import ListPlus
+
+SEARCH_MODES = ["unordered", "ordered", "strict"]
+
+
+def _build_classes(search_mode: str) -> Tuple[type, type]:
+    """Creates the classes of a dataset as the generator would for the given mode"""
+
+    class Measurement(DataModel, search_mode=search_mode):
+        id: Optional[str] = attr(name="id", default=None)
+        temperature: Optional[float] = element(tag="temperature", default=None)
+        unit: Optional[str] = element(tag="unit", default=None)
+        comment: Optional[str] = element(tag="comment", default=None)
+        values: List[float] = wrapped(
+            "values", element(tag="value", default_factory=ListPlus)
+        )
+
+        _repo: str = PrivateAttr(default="https://www.github.com/benchmark")
+
+    class Dataset(DataModel, search_mode=search_mode):
+        name: Optional[str] = element(tag="name", default=None)
+        description: Optional[str] = element(tag="description", default=None)
+        measurements: List[Measurement] = wrapped(
+            "measurements", element(tag="measurement", default_factory=ListPlus)
+        )
+        comment: Optional[str] = element(tag="comment", default=None)
+
+        _repo: str = PrivateAttr(default="https://www.github.com/benchmark")
+
+    return Dataset, Measurement
+
+
+def _build_document(n_objects: int) -> bytes:
+    Dataset, Measurement = _build_classes("unordered")
+    dataset = Dataset(
+        name="benchmark",
+        measurements=[
+            Measurement(
+                id=f"m{index}",
+                temperature=float(index),
+                unit="K",
+                values=[float(value) for value in range(5)],
+            )
+            for index in range(n_objects)
+        ],
+    )
+
+    return dataset.xml().encode()
+
+
+def main(n_objects: int = 20_000, repeat: int = 3):
+    content = _build_document(n_objects)
+    size = len(content) / 1e6
+    expected = None
+
+    print(f"Dataset with {n_objects} objects ({size:.1f} MB)\n")
+    print("Import")
+
+    for search_mode in SEARCH_MODES:
+        Dataset, _ = _build_classes(search_mode)
+
+        dataset = Dataset.from_xml_string(content)
+        expected = expected or dataset.to_dict()
+        assert dataset.to_dict() == expected, f"Mode '{search_mode}' differs"
+
+        seconds = min(
+            timeit.repeat(
+                lambda: Dataset.from_xml_string(content), number=1, repeat=repeat
+            )
+        )
+        print(
+            f"  search_mode='{search_mode}': {seconds:.3f} s ({size / seconds:.2f} MB/s)"
+        )
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
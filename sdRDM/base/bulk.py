@@ -0,0 +1,125 @@
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional, Tuple
+
+_ACTIVE_BULK: ContextVar[Optional["BulkContext"]] = ContextVar(
+    "sdrdm_active_bulk", default=None
+)
+
+
+def active_bulk() -> Optional["BulkContext"]:
+    """Returns the bulk context that is currently active, if any"""
+    return _ACTIVE_BULK.get()
+
+
+class BulkContext:
+    """Collects fields that have been modified while checks are deferred.
+
+    While a bulk context is active, attribute assignments and list operations
+    only store the given values. Validation, parent bookkeeping and reference
+    checks are run once per touched field when the context is finalized. The
+    value each field had before it has been touched is kept, such that fields
+    can be restored if the context fails.
+    """
+
+    def __init__(self):
+        self.touched: Dict[Tuple[int, str], Tuple["DataModel", str, bool]] = {}
+        self.originals: Dict[Tuple[int, str], Tuple[Any, bool, Optional[List]]] = {}
+        self.report: Dict[str, str] = {}
+        self._token = None
+
+    def touch(self, obj: "DataModel", name: str, validate: bool = True) -> None:
+        """Marks a field of an object for validation upon exit.
+
+        Has to be called before the field is modified, since the value of the
+        field is saved upon the first call.
+
+        Args:
+            obj (DataModel): Object that is modified.
+            name (str): Name of the modified field.
+            validate (bool): Whether the value has to be validated or only linked to the object.
+        """
+
+        key = (id(obj), name)
+
+        if key in self.touched:
+            validate = validate or self.touched[key][2]
+        else:
+            value = obj.__dict__.get(name)
+            items = list(value) if isinstance(value, list) else None
+            self.originals[key] = (value, name in obj.__pydantic_fields_set__, items)
+
+        self.touched[key] = (obj, name, validate)
+
+    def activate(self) -> None:
+        self._token = _ACTIVE_BULK.set(self)
+
+    def deactivate(self) -> None:
+        _ACTIVE_BULK.reset(self._token)
+        self._token = None
+
+    def finalize(self, restore: bool = False) -> Dict[str, str]:
+        """Validates all touched fields and returns an aggregated report.
+
+        Validation and linking happen first for all fields, such that the
+        subsequent reference checks operate on the complete tree. Fields that
+        fail validation are restored to their previous value.
+
+        Args:
+            restore (bool): Whether to restore all touched fields if the report is not empty. Defaults to False.
+
+        Returns:
+            Dict[str, str]: Error messages by the label of the affected field.
+        """
+
+        touched = list(self.touched.items())
+        valid = []
+
+        for key, (obj, name, validate) in touched:
+            try:
+                obj._revalidate_field(name, validate)
+                valid.append((obj, name))
+            except (ValueError, TypeError) as e:
+                self.report[_label(obj, name)] = str(e)
+                self._restore(key, obj, name)
+
+        for obj, name in valid:
+            report = obj._get_reference_report(name, obj.__dict__.get(name))
+
+            for attribute, message in report.items():
+                self.report[_label(obj, attribute)] = message
+
+        if self.report and restore:
+            for key, (obj, name, _) in touched:
+                self._restore(key, obj, name)
+
+        self.touched = {}
+        self.originals = {}
+
+        return self.report
+
+    def _restore(self, key: Tuple[int, str], obj: "DataModel", name: str) -> None:
+        """Restores the value a field had before it has been touched"""
+
+        value, was_set, items = self.originals[key]
+
+        if items is not None:
+            # Lists may have been modified in place, thus their items are restored too
+            list.__setitem__(value, slice(None), items)
+
+        obj.__dict__[name] = value
+
+        if not was_set:
+            obj.__pydantic_fields_set__.discard(name)
+
+        obj._invalidate_caches()
+
+
+def _label(obj: "DataModel", name: str) -> str:
+    """Creates a readable label for an objects field used in reports"""
+
+    obj_id = obj.__dict__.get("id")
+
+    if obj_id is None:
+        return f"{obj.__class__.__name__}.{name}"
+
+    return f"{obj.__class__.__name__}[{obj_id}].{name}"
@@ -1,3 +1,4 @@
+import io
 import json
 import os
 import re
@@ -7,17 +8,16 @@ import pydantic_xml
 import random
 import tempfile
 import validators
-import yaml
 import warnings
 import numpy as np
 import hashlib
+import weakref
 
 from nob import Nob
 from nob.path import Path
 from dotted_dict import DottedDict
-from enum import Enum
-from anytree import Node, LevelOrderIter
 from bigtree import print_tree, levelorder_iter, yield_tree
+from contextlib import contextmanager
 from functools import lru_cache, cached_property
 from lxml import etree
 from lxml.etree import _Element
@@ -25,7 +25,6 @@ from pydantic.fields import FieldInfo
 from pydantic import (
     ConfigDict,
     PrivateAttr,
-    field_validator,
     model_serializer,
     computed_field,
 )
@@ -35,30 +34,61 @@ from typing import (
     Dict,
     Optional,
     IO,
+    Iterable,
+    Iterator,
     Set,
     Tuple,
     Union,
     get_args,
     Callable,
-    get_origin,
 )
 
 from sdRDM.base.importedmodules import ImportedModules
+from sdRDM.base.ioutils.binary import from_binary, to_binary
+from sdRDM.base.ioutils.compression import (
+    PathLike,
+    is_compressed,
+    is_path,
+    open_file,
+    opened,
+)
+from sdRDM.base.ioutils.jsonbackends import get_json_backend
+from sdRDM.base.ioutils.jsonstream import dump_json
+from sdRDM.base.ioutils.ndjson import dump_ndjson, load_ndjson
+from sdRDM.base.ioutils.sharded import load_shards, open_sharded, write_sharded
+from sdRDM.base.ioutils.sidecar import (
+    handler_directory,
+    has_sidecar,
+    resolve_sidecars,
+    to_dict_with_sidecar,
+)
+from sdRDM.base.ioutils.jsonreader import iter_json, load_json
+from sdRDM.base.ioutils.xmlreader import iter_xml, load_xml
+from sdRDM.base.ioutils.xmlstream import dump_xml
+from sdRDM.base.ioutils.yamlio import dump_yaml, dump_yaml_all, iter_yaml, load_yaml
+from sdRDM.base.bulk import BulkContext, active_bulk
+from sdRDM.base.diff import apply_patch, diff_models
+from sdRDM.base.fieldpipeline import compile_field_pipelines
+from sdRDM.base.fieldtable import FieldTable, get_field_table
 from sdRDM.base.listplus import ListPlus
+from sdRDM.base.pathindex import PathIndex
+from sdRDM.base.query import compile_query
 from sdRDM.base.referencecheck import (
     object_is_compliant_to_references,
     value_is_compliant_to_references,
 )
 from sdRDM.base.utils import generate_model
-from sdRDM.base.tree import _digit_free_path, build_guide_tree, ClassNode
+from sdRDM.base.tree import build_guide_tree, ClassNode
+from sdRDM.base.trusted import ChecksumReader, construct_trusted, verify_checksum
+from sdRDM.base.walker import walk_meta
 from sdRDM.generator.codegen import generate_python_api
 from sdRDM.generator.utils import extract_modules
-from sdRDM.tools.utils import YAMLDumper
 from sdRDM.base.onto.jsonld import process_term
 from sdRDM.tools.gitutils import (
     build_library_from_git_specs,
     _import_library,
 )
+from sdRDM.tools.utils import xml_context
 
 
 class DataModel(pydantic_xml.BaseXmlModel):
@@ -72,47 +102,92 @@ class DataModel(pydantic_xml.BaseXmlModel):
     )
 
     # * Private attributes
-    _node: Optional[Node] = PrivateAttr(default=None)
-    _types: DottedDict = PrivateAttr(default=dict)
-    _parent: Optional["DataModel"] = PrivateAttr(default=None)
-    _references: DottedDict = PrivateAttr(default_factory=DottedDict)
-    _id: Optional[str] = PrivateAttr(default_factory=uuid.uuid4)
+    # Containers are allocated upon first use to keep instances small
+    _parent_ref: Optional[weakref.ref] = PrivateAttr(default=None)
+    _owner_refs: Optional[Dict[int, weakref.ref]] = PrivateAttr(default=None)
+    _references: Optional[DottedDict] = PrivateAttr(default=None)
+    _uuid: Optional[uuid.UUID] = PrivateAttr(default=None)
     _attribute: Optional[str] = PrivateAttr(default=None)
-    _attribute_terms: Dict[str, Set[str]] = PrivateAttr(default_factory=dict)
-    _object_terms: Set[str] = PrivateAttr(default_factory=set)
+    _attribute_terms: Optional[Dict[str, Set[str]]] = PrivateAttr(default=None)
+    _object_terms: Optional[Set[str]] = PrivateAttr(default=None)
+    _path_index: Optional[PathIndex] = PrivateAttr(default=None)
+    _digest: Optional[str] = PrivateAttr(default=None)
 
     def __init__(self, **data):
         self._convert_units(self, data)
 
         super().__init__(**data)
 
-        for field, value in self:
-            is_object = hasattr(value, "model_fields")
-            is_list = isinstance(value, (list, ListPlus))
+        self._setup_relations()
+
+    def _setup_relations(self) -> None:
+        """Links sub-objects to this object and gathers the types of all fields"""
+
+        table = self._get_field_table()
 
-            if is_list:
-                is_object = all([self.is_data_model(v) for v in value])
+        for field in table.object_fields:
+            value = self.__dict__.get(field)
 
-            if not is_object and not is_list:
+            if value is None:
                 continue
-            elif not is_object and is_list:
+            elif isinstance(value, (list, ListPlus)):
+                if not all([self.is_data_model(v) for v in value]):
+                    continue
+            elif not hasattr(value, "model_fields"):
                 continue
 
-            self.__dict__[field]._parent = self
-            self.__dict__[field]._attribute = field
+            value._parent = self
+            value._attribute = field
 
-        self._types = DottedDict()
-        self._attribute_terms = {attr: set() for attr in self.model_fields}
+        for field in table.multiple_fields.difference(table.object_fields):
+            value = self.__dict__.get(field)
 
-        for name, field in self.model_fields.items():
-            args = get_args(field.annotation)
+            if isinstance(value, ListPlus):
+                value._set_owner(self, field)
 
-            if not args and hasattr(field.annotation, "model_fields"):
-                self._types[name] = field.annotation
-            elif args:
-                self._types[name] = tuple(
-                    [subtype for subtype in args if hasattr(subtype, "model_fields")]
-                )
+    @property
+    def _parent(self) -> Optional["DataModel"]:
+        """Object this object is part of. It is held weakly to avoid reference cycles."""
+
+        ref = self.__pydantic_private__["_parent_ref"]
+
+        return None if ref is None else ref()
+
+    @_parent.setter
+    def _parent(self, value: Optional["DataModel"]) -> None:
+        private = self.__pydantic_private__
+        previous = private["_parent_ref"]
+        previous = None if previous is None else previous()
+
+        if previous is not None and value is not None and previous is not value:
+            # Shared or moved objects keep their former owners to invalidate their caches
+            if private["_owner_refs"] is None:
+                private["_owner_refs"] = {}
+
+            private["_owner_refs"][id(previous)] = weakref.ref(previous)
+
+        private["_parent_ref"] = None if value is None else weakref.ref(value)
+
+    @property
+    def _types(self) -> DottedDict:
+        """Data model types of each field, copied from the table of the class"""
+
+        return DottedDict(dict(self._get_field_table().types))
+
+    @property
+    def _id(self) -> uuid.UUID:
+        """Internal identifier of this object, which is generated upon first access"""
+
+        if self._uuid is None:
+            self._uuid = uuid.uuid4()
+
+        return self._uuid
+
+    @classmethod
+    def _get_field_table(cls) -> FieldTable:
+        """Returns the field descriptions of this class, which are shared by all instances"""
+
+        return get_field_table(cls)
 
     # ! Computed fields
     @pydantic_xml.computed_element(
@@ -128,7 +203,7 @@ class DataModel(pydantic_xml.BaseXmlModel):
 
         return [
             self.__class__.__name__,
-            *list(self._object_terms)
+            *list(self._object_terms or ())
         ]
 
     @pydantic_xml.computed_element(
@@ -187,13 +262,11 @@ class DataModel(pydantic_xml.BaseXmlModel):
         """Helper function to search for a given path in the model"""
 
         query = self._setup_query(target)
-        model = Nob(self.to_dict(warn=False, convert_h5ds=False))
-
-        path = model.find(path)
 
-        assert path, f"Path '{path}' does not exist in the model."
-
-        object = self._traverse_model_by_path(self, path[0])
+        try:
+            object = self._traverse_model_by_path(self, path)
+        except (AttributeError, IndexError, KeyError):
+            raise AssertionError(f"Path '{path}' does not exist in the model.")
 
         return self._check_query(object, attribute, query)
 
@@ -208,27 +281,75 @@ class DataModel(pydantic_xml.BaseXmlModel):
         if not path.startswith("/"):
             path = "/" + path
 
-        # Get all the paths that end with the last part
-        last_part = path.split("/")[-1].strip("/")
-        model = Nob(self.to_dict(warn=False, convert_h5ds=False))
         query = self._setup_query(target)
 
-        paths = model.find(last_part)
-        matching_paths = [p for p in paths if _digit_free_path(str(p)) == path]
-
         references = ListPlus()
-        for path in matching_paths:  # type: ignore
-            reference = self._check_query(
-                self._traverse_model_by_path(self, path),
-                attribute,
-                query,
-            )
+        for value in self._get_path_index().values(path):
+            reference = self._check_query(value, attribute, query)
 
             if reference is not None:
                 references.append(reference)
 
         return references
 
+    def _get_path_index(self) -> PathIndex:
+        """Returns the meta path index of this object and builds it if necessary"""
+
+        if self._path_index is None:
+            self._path_index = PathIndex(self)
+
+        return self._path_index
+
+    def _invalidate_caches(self) -> None:
+        """Drops the meta path index and digest of this object and all of its owners.
+
+        Besides the current parent, owners an object has been linked to before
+        are invalidated as well, since the object may still be part of them.
+        """
+
+        obj = self
+
+        while obj is not None:
+            # Bypass __setattr__, this is called on every modification
+            private = obj.__pydantic_private__
+            private["_path_index"] = None
+            private["_digest"] = None
+
+            if private["_owner_refs"]:
+                for ref in list(private["_owner_refs"].values()):
+                    owner = ref()
+
+                    if owner is not None and owner is not obj:
+                        owner._invalidate_caches()
+
+            ref = private["_parent_ref"]
+            obj = None if ref is None else ref()
+
+    def select(
+        self,
+        path: str,
+        where: Optional[str] = None,
+        project: Union[str, List[str], None] = None,
+    ):
+        """Selects objects or values via a meta path and filters them in a vectorized manner.
+
+        The query is compiled once per class and evaluates the where clause
+        as NumPy masks over all rows, instead of calling a function per object.
+
+        Example:
+            ds.select("measurements/*/species", where="temperature > 300", project=["value"])
+
+        Args:
+            path (str): Meta path to the selected objects or values. A '*' marks the rows the where clause is applied to. Defaults to the selected objects.
+            where (Optional[str]): Boolean expression over the attributes of the rows, e.g. 'temperature > 300 and name == "A"'.
+            project (Union[str, List[str], None]): Attribute(s) of the selected objects to return. A single name returns an array, a list returns a dict of arrays.
+
+        Returns:
+            Union[ListPlus, np.ndarray, Dict[str, np.ndarray]]: Selected objects, numeric values or projected attributes.
+        """
+
+        return compile_query(self.__class__, path, where, project).run(self)
+
     @staticmethod
     def _setup_query(
         target: Union[str, float, int, None, "DataModel", Callable]
@@ -299,7 +420,9 @@ class DataModel(pydantic_xml.BaseXmlModel):
 
         current = self
         for command in commands:
-            if command.isdigit():
+            if isinstance(current, dict):
+                current = current[command]
+            elif command.isdigit():
                 current = current[int(command)]  # type: ignore
             else:
                 current = getattr(current, command)
@@ -307,7 +430,18 @@ class DataModel(pydantic_xml.BaseXmlModel):
         return current
 
     def paths(self, leaves: bool = False):
-        """Returns all possible paths of an instantiated data model. Can also be reduced to just leaves."""
+        """Returns all possible paths of an instantiated data model. Can also be reduced to just leaves.
+
+        Paths are those of the exported dictionary, thus they include aliases,
+        the JSON-LD entries and an entry per item of a list. Use 'walk' from
+        'sdRDM.base.walker' to traverse the attributes of the object instead.
+
+        Args:
+            leaves (bool): If True, only paths of values that are not traversed any further are returned.
+
+        Returns:
+            List[Path]: Absolute paths of the exported dictionary.
+        """
 
         # Get JSON representation
         model = Nob(self.to_dict(warn=False, mode="python"))
@@ -322,18 +456,11 @@ class DataModel(pydantic_xml.BaseXmlModel):
         """Returns all possible paths of an instantiated data model. Can also be reduced to just leaves."""
 
         metapaths = set()
-        for node in LevelOrderIter(cls.meta_tree(show=False)):
-            if len(node.node_path) == 1:
+        for path, _, _, dtype in walk_meta(cls):
+            if leaves and dtype is not None:
                 continue
 
-            if leaves and node.is_leaf:
-                metapaths.add(
-                    "/".join([n.name for n in node.node_path if n.name[0].islower()])
-                )
-            elif not leaves:
-                metapaths.add(
-                    "/".join([n.name for n in node.node_path if n.name[0].islower()])
-                )
+            metapaths.add(path.lstrip("/"))
 
         return sorted(metapaths)
 
@@ -375,7 +502,7 @@ class DataModel(pydantic_xml.BaseXmlModel):
         **kwargs,
     ):
 
-        data = super().model_dump(
+        data = self.model_dump(
             exclude_none=exclude_none,
             by_alias=True,
             mode=mode,
@@ -392,65 +519,80 @@ class DataModel(pydantic_xml.BaseXmlModel):
 
         return data
 
-    def _convert_types_and_remove_empty_objects(self, data, exclude_none, convert_h5ds):
-        """Converts als ListPlus items back to lists."""
+    def model_dump(self, **kwargs) -> Dict[str, Any]:
+        # The serializer reads lists directly, thus pending shards of objects
+        # opened via 'open_sharded' are read beforehand. Returns at once otherwise.
+        load_shards(self)
 
-        nu_data = {}
+        return super().model_dump(**kwargs)
+
+    def model_dump_json(self, **kwargs) -> str:
+        load_shards(self)
+
+        return super().model_dump_json(**kwargs)
+
+    def _convert_types_and_remove_empty_objects(self, data, exclude_none, convert_h5ds):
+        """Converts als ListPlus items back to lists and removes empty objects."""
 
         if not isinstance(data, dict):
             return data
 
+        return self._prune_dict(data, exclude_none, convert_h5ds)[0]
+
+    def _prune_dict(
+        self,
+        data: Dict,
+        exclude_none: bool,
+        convert_h5ds: bool,
+    ) -> Tuple[Dict, bool]:
+        """Converts and prunes a dictionary in a single pass.
+
+        Besides the converted dictionary, it is returned whether the given
+        dictionary is empty, i.e. made up only by its ID, empty lists, unset
+        values and empty sub-dictionaries. Nested dictionaries are thus
+        visited exactly once.
+
+        Returns:
+            Tuple[Dict, bool]: The converted dictionary and whether the input is empty.
+        """
+
+        nu_data = {}
+        is_empty = True
+
         for key, value in data.items():
             if isinstance(value, ListPlus):
-                if not value and exclude_none:
-                    continue
+                value_is_empty = len(value) == 0
 
-                nu_data[key] = [
-                    self._check_and_convert_sub(element, exclude_none, convert_h5ds)
-                    for element in value
-                ]
+                if value or not exclude_none:
+                    nu_data[key] = [
+                        self._check_and_convert_sub(element, exclude_none, convert_h5ds)
+                        for element in value
+                    ]
 
-            elif isinstance(value, (dict)):
-                if not value and exclude_none:
-                    continue
-                elif self._is_empty(value):
-                    continue
-
-                if self._convert_types_and_remove_empty_objects(
+            elif isinstance(value, dict):
+                converted, value_is_empty = self._prune_dict(
                     value, exclude_none, convert_h5ds
-                ):
-                    nu_data[key] = self._convert_types_and_remove_empty_objects(
-                        value, exclude_none, convert_h5ds
-                    )
+                )
+
+                if not value_is_empty and converted:
+                    nu_data[key] = converted
 
             elif isinstance(value, np.ndarray):
+                value_is_empty = False
                 nu_data[key] = value.tolist()
 
             else:
-                nu_data[key] = value
-
-        return nu_data
-
-    def _is_empty(self, value):
-        """Checks whether this object is just made up by its ID"""
-
-        if not isinstance(value, dict):
-            return False
-
-        is_empty = []
+                if isinstance(value, list):
+                    value_is_empty = len(value) == 0
+                else:
+                    value_is_empty = value is None
 
-        for name, attribute in value.items():
-            if name == "id":
-                continue
+                nu_data[key] = value
 
-            if isinstance(attribute, list):
-                is_empty.append(len(attribute) == 0)
-            elif isinstance(attribute, dict):
-                is_empty.append(self._is_empty(attribute))
-            else:
-                is_empty.append(attribute == None)
+            if key != "id" and not value_is_empty:
+                is_empty = False
 
-        return all(is_empty)
+        return nu_data, is_empty
 
     def _check_and_convert_sub(self, element, exclude_none, convert_h5ds):
         """Helper function used to trigger recursion on deeply nested lists."""
@@ -465,38 +607,179 @@ class DataModel(pydantic_xml.BaseXmlModel):
             element, exclude_none, convert_h5ds
         )
 
-    def json(self, indent: int = 2, **kwargs):
-        return json.dumps(
-            self.to_dict(**kwargs),
-            indent=indent,
-            default=self._json_dump,
-            sort_keys=True,
+    def json(
+        self,
+        indent: int = 2,
+        backend: Optional[str] = None,
+        sidecar: Optional[str] = None,
+        **kwargs,
+    ):
+        """Exports this object to a JSON string.
+
+        Args:
+            indent (int): Indentation of the JSON string. Defaults to 2.
+            backend (Optional[str]): Name of the JSON backend, e.g. 'stdlib', 'orjson' or 'pydantic'. Defaults to the backend set via 'set_json_backend'. The 'pydantic' backend keeps keys in export order instead of sorting them.
+            sidecar (Optional[str]): Path of a '.npz' bundle or directory, to which arrays and large bytes are written instead. The JSON file has to be stored in the same directory.
+            **kwargs: Keyword arguments passed to 'to_dict'.
+        """
+
+        return get_json_backend(backend).dumps(
+            self._export_dict(sidecar, **kwargs), indent=indent
         )
 
+    def _export_dict(self, sidecar: Optional[str] = None, **kwargs) -> Dict:
+        """Exports to a dictionary, with arrays being stored in a sidecar if given"""
+
+        if sidecar is None:
+            return self.to_dict(**kwargs)
+
+        return to_dict_with_sidecar(self, sidecar, **kwargs)
+
+    def dump_json(
+        self,
+        handler: Union[IO, PathLike],
+        indent: int = 2,
+        exclude_none: bool = True,
+        mode: str = "json",
+        chunk_size: int = 1 << 16,
+    ) -> None:
+        """Writes this object as JSON to a file handler without building the document in memory.
+
+        Objects are exported one after another and arrays are written in chunks,
+        such that memory stays bounded for large datasets. The output is
+        identical to 'json' with the 'stdlib' backend and the same options.
+        Paths ending with '.gz', '.bz2' or '.xz' are compressed while writing.
+
+        Args:
+            handler (Union[IO, PathLike]): Text or binary file handler or path to write to.
+            indent (int): Indentation of the JSON document. Defaults to 2.
+            exclude_none (bool): Whether to exclude unset values. Defaults to True.
+            mode (str): Serialization mode passed to 'model_dump'. Defaults to 'json'.
+            chunk_size (int): Number of array elements that are converted at once.
+        """
+
+        with opened(handler, "wb") as file:
+            dump_json(
+                self,
+                file,
+                indent=indent,
+                exclude_none=exclude_none,
+                mode=mode,
+                chunk_size=chunk_size,
+            )
+
+    def to_ndjson(
+        self,
+        handler: Union[IO, PathLike],
+        path: str,
+        backend: Optional[str] = None,
+        **kwargs,
+    ) -> int:
+        """Writes each object of a list field as one JSON line to a file handler.
+
+        Each record carries the position of the object holding the list among
+        all objects at its meta path ('__parent__') and the meta path of the
+        list ('__path__'), such that records can be processed independently
+        and reassembled via 'from_ndjson'.
+
+        Example:
+            >>> with open("measurements.ndjson", "w") as f:
+            ...     dataset.to_ndjson(f, path="measurements")
+
+        Args:
+            handler (Union[IO, PathLike]): Text or binary file handler or path of a (compressed) file to write to.
+            path (str): Meta path of the list field, e.g. 'measurements'.
+            backend (Optional[str]): Name of the JSON backend used to serialize records.
+            **kwargs: Keyword arguments passed to 'to_dict'.
+
+        Returns:
+            int: Number of written records.
+        """
+
+        with opened(handler, "wb") as file:
+            return dump_ndjson(self, file, path, backend=backend, **kwargs)
+
+    def yaml(self, sidecar: Optional[str] = None, **kwargs):
+        return dump_yaml(self._export_dict(sidecar, **kwargs))
+
+    def dump_yaml(
+        self,
+        handler: Union[IO, PathLike],
+        sidecar: Optional[str] = None,
+        **kwargs,
+    ) -> None:
+        """Writes this object as YAML to a file handler or path.
+
+        The output is identical to 'yaml'. Paths ending with '.gz', '.bz2' or
+        '.xz' are compressed while writing.
+
+        Args:
+            handler (Union[IO, PathLike]): Text file handler or path to write to.
+            sidecar (Optional[str]): Path of a '.npz' bundle or directory, to which arrays and large bytes are written instead.
+            **kwargs: Keyword arguments passed to 'to_dict'.
+        """
+
+        with opened(handler, "w") as file:
+            file.write(self.yaml(sidecar, **kwargs))
+
     @staticmethod
-    def _json_dump(value):
-        """Helper function to export nd-arrays in a proper way"""
+    def dump_yaml_all(
+        models: Iterable["DataModel"],
+        handler: Union[IO, PathLike],
+        **kwargs,
+    ) -> int:
+        """Writes objects as a multi-document YAML stream, separated by '---'.
 
-        if isinstance(value, np.ndarray):
-            return value.tolist()
+        Each object is written as soon as it has been exported, thus the
+        objects may also be generated one after another.
 
-        return str(value)
+        Example:
+            >>> DataModel.dump_yaml_all(datasets, "datasets.yaml")
 
-    def yaml(self, **kwargs):
-        return yaml.dump(
-            self.to_dict(**kwargs),
-            Dumper=YAMLDumper,
-            default_flow_style=False,
-            sort_keys=False,
-        )
+        Args:
+            models (Iterable[DataModel]): Objects to write.
+            handler (Union[IO, PathLike]): Text file handler or path of a (compressed) file to write to.
+            **kwargs: Keyword arguments passed to 'to_dict'.
+
+        Returns:
+            int: Number of written documents.
+        """
+
+        with opened(handler, "w") as file:
+            return dump_yaml_all(models, file, **kwargs)
 
     def xml(self):
+        return "<?xml version='1.0' encoding='UTF-8'?>\n" + self._tree_to_string(
+            self._export_xml_tree()
+        )
+
+    def dump_xml(self, handler: Union[IO, PathLike]) -> None:
+        """Writes this object as XML to a binary file handler or path while walking the model.
+
+        Elements are written incrementally object by object, thus memory stays
+        bounded for large lists of objects, and JSON-LD elements are never
+        created. The document is equivalent to 'xml', but namespace
+        declarations are sorted and empty elements are written with start and
+        end tag. Paths ending with '.gz', '.bz2' or '.xz' are compressed while
+        writing.
+
+        Args:
+            handler (Union[IO, PathLike]): Binary file handler or path to write to.
+        """
+
+        with opened(handler, "wb") as file:
+            dump_xml(self, file)
+
+    def _export_xml_tree(self) -> _Element:
+        """Exports this object to an XML tree without JSON-LD elements"""
+
+        load_shards(self)
+
         # Remove JSON LD elements
         tree = self.to_xml_tree()
         xpath = "//*[local-name()='ld_context' or local-name()='ld_type']"
-        tree = self._remove_nodes(tree, xpath)
 
-        return "<?xml version='1.0' encoding='UTF-8'?>\n" + self._tree_to_string(tree)
+        return self._remove_nodes(tree, xpath)
 
     @staticmethod
     def _remove_nodes(tree, xpath):
@@ -530,6 +813,56 @@ class DataModel(pydantic_xml.BaseXmlModel):
 
         return etree.tostring(tree, pretty_print=True).decode()
 
+    def to_binary(self, exclude_none: bool = True) -> bytes:
+        """Exports this object to the compact sdRDM binary format.
+
+        The format embeds the root class and source of the library, stores
+        each key once, lists of numbers, strings and objects column by column
+        and keeps arrays as raw buffers, which are decoded without copying by
+        'from_binary'.
+
+        Args:
+            exclude_none (bool): Whether to exclude unset values. Defaults to True.
+        """
+
+        return to_binary(self, exclude_none=exclude_none)
+
+    def to_sharded(
+        self,
+        directory: str,
+        shard_size: int = 1000,
+        format: str = "json",
+        fields: Optional[List[str]] = None,
+        processes: Optional[int] = None,
+    ) -> Dict:
+        """Writes this object to a directory, splitting large lists into shards.
+
+        A manifest holds all other attributes, the source of the library and
+        an index of the shards. The dataset is opened via 'open_sharded'.
+
+        Example:
+            >>> dataset.to_sharded("dataset/", shard_size=10_000, processes=4)
+
+        Args:
+            directory (str): Directory to write to, which is created if necessary.
+            shard_size (int): Maximum number of objects per shard. Defaults to 1000.
+            format (str): Format of the shards, either 'json' or 'binary'. Defaults to 'json'.
+            fields (Optional[List[str]]): Lists of objects to shard. Defaults to all lists of objects of this object.
+            processes (Optional[int]): Number of processes writing shards in parallel. Defaults to writing sequentially.
+
+        Returns:
+            Dict: The manifest.
+        """
+
+        return write_sharded(
+            self,
+            directory,
+            shard_size=shard_size,
+            format=format,
+            fields=fields,
+            processes=processes,
+        )
+
     def hdf5(self, file: Union["H5File", str]) -> None:
         """Writes the object instance to HDF5."""
 
@@ -544,32 +877,342 @@ class DataModel(pydantic_xml.BaseXmlModel):
 
     # ! Inherited Initializers
     @classmethod
-    def from_dict(cls, obj: Dict):
+    def from_dict(cls, obj: Dict, trusted: bool = False):
+        """Creates an object from its dictionary representation.
+
+        Args:
+            obj (Dict): Dictionary representation of the object.
+            trusted (bool): If True, the data is assumed to be an unmodified export of this library and is not validated. Defaults to False.
+        """
+
+        if trusted:
+            return construct_trusted(cls, obj)
+
         return cls.model_validate(obj)
 
     @classmethod
-    def from_json_string(cls, json_string: str):
-        return cls.from_dict(json.loads(json_string))
+    def from_json_string(
+        cls,
+        json_string: Union[str, bytes],
+        trusted: bool = False,
+        checksum: Optional[str] = None,
+        backend: Optional[str] = None,
+        sidecar_dir: Optional[str] = None,
+    ):
+        """Creates an object from a JSON string.
+
+        Unless a backend is given, the data is trusted or it references
+        sidecar files, the string is parsed and validated natively by
+        pydantic-core.
+
+        Args:
+            json_string (Union[str, bytes]): JSON representation of the object.
+            trusted (bool): If True, the data is assumed to be an unmodified export of this library and is not validated. Defaults to False.
+            checksum (Optional[str]): Expected SHA-256 hex digest of the JSON string. Loading fails if it does not match.
+            backend (Optional[str]): Name of the JSON backend used for parsing.
+            sidecar_dir (Optional[str]): Directory referenced sidecar files are stored in. Defaults to the working directory.
+        """
+
+        if checksum is not None:
+            verify_checksum(json_string, checksum)
+
+        is_referencing = has_sidecar(json_string)
+
+        if backend is None and not trusted and not is_referencing:
+            return cls.model_validate_json(json_string)
+
+        data = get_json_backend(backend).loads(json_string)
+
+        if is_referencing:
+            data = resolve_sidecars(data, sidecar_dir)
+
+        return cls.from_dict(data, trusted=trusted)
 
     @classmethod
-    def from_json(cls, handler: IO):
-        return cls.from_dict(json.load(handler))
+    def from_json(
+        cls,
+        handler: Union[IO, PathLike],
+        trusted: bool = False,
+        checksum: Optional[str] = None,
+        backend: Optional[str] = None,
+        incremental: Optional[bool] = None,
+    ):
+        """Creates an object from a JSON file.
+
+        Paths ending with '.gz', '.bz2' or '.xz' are decompressed while reading,
+        in which case the checksum refers to the decompressed content. Unless
+        a backend is given, these are read incrementally by default, such that
+        they are never fully decompressed into memory. Otherwise, the whole
+        content of the file is read into memory before parsing.
+
+        Args:
+            handler (Union[IO, PathLike]): File handler or path to read the JSON data from.
+            trusted (bool): If True, the data is assumed to be an unmodified export of this library and is not validated. Defaults to False.
+            checksum (Optional[str]): Expected SHA-256 hex digest of the file content. Loading fails if it does not match.
+            backend (Optional[str]): Name of the JSON backend used for parsing.
+            incremental (Optional[bool]): If True, the file is parsed in chunks and each object within a list is created as soon as it has been read, instead of parsing the whole document first. The backend is not used in this mode. Defaults to True for compressed paths without a backend and False otherwise.
+        """
+
+        sidecar_dir = handler_directory(handler)
+
+        if incremental is None:
+            incremental = backend is None and is_compressed(handler)
+
+        with opened(handler, "rb") as file:
+            if incremental:
+                return load_json(
+                    cls,
+                    file,
+                    trusted=trusted,
+                    checksum=checksum,
+                    sidecar_dir=sidecar_dir,
+                )
+
+            return cls.from_json_string(
+                file.read(),
+                trusted,
+                checksum,
+                backend,
+                sidecar_dir=sidecar_dir,
+            )
 
     @classmethod
-    def from_yaml_string(cls, yaml_string: str):
-        return cls.from_dict(yaml.safe_load(yaml_string))
+    def iter_json(
+        cls,
+        handler: Union[IO, PathLike],
+        path: str,
+        trusted: bool = False,
+    ) -> Iterator[Any]:
+        """Yields the objects or values at a meta path of a JSON file one by one.
+
+        Only the currently yielded element is parsed, everything else is
+        skipped. Thus, large lists can be processed without loading the file.
+
+        Example:
+            >>> for measurement in Dataset.iter_json(handler, "measurements"):
+            ...     print(measurement.id)
+
+        Args:
+            handler (Union[IO, PathLike]): File handler or path of a (compressed) file to read the JSON data from.
+            path (str): Meta path of the attribute, e.g. 'measurements' or 'measurements/species'.
+            trusted (bool): If True, the data is assumed to be an unmodified export of this library and is not validated. Defaults to False.
+        """
+
+        return iter_json(
+            cls,
+            handler,
+            path,
+            trusted=trusted,
+            sidecar_dir=handler_directory(handler),
+        )
 
     @classmethod
-    def from_yaml(cls, handler: IO):
-        return cls.from_dict(yaml.safe_load(handler))
+    def from_yaml_string(
+        cls,
+        yaml_string: str,
+        trusted: bool = False,
+        checksum: Optional[str] = None,
+        sidecar_dir: Optional[str] = None,
+    ):
+        """Creates an object from a YAML string.
+
+        Args:
+            yaml_string (str): YAML representation of the object.
+            trusted (bool): If True, the data is assumed to be an unmodified export of this library and is not validated. Defaults to False.
+            checksum (Optional[str]): Expected SHA-256 hex digest of the YAML string. Loading fails if it does not match.
+            sidecar_dir (Optional[str]): Directory referenced sidecar files are stored in. Defaults to the working directory.
+        """
+
+        if checksum is not None:
+            verify_checksum(yaml_string, checksum)
+
+        data = resolve_sidecars(load_yaml(yaml_string), sidecar_dir)
+
+        return cls.from_dict(data, trusted=trusted)
+
+    @classmethod
+    def from_yaml(
+        cls,
+        handler: Union[IO, PathLike],
+        trusted: bool = False,
+        checksum: Optional[str] = None,
+    ):
+        """Creates an object from a YAML file.
+
+        The file is parsed from the stream, thus it is not read into memory
+        as a whole. Paths ending with '.gz', '.bz2' or '.xz' are decompressed
+        while reading, in which case the checksum refers to the decompressed
+        content.
+
+        Args:
+            handler (Union[IO, PathLike]): File handler or path to read the YAML data from.
+            trusted (bool): If True, the data is assumed to be an unmodified export of this library and is not validated. Defaults to False.
+            checksum (Optional[str]): Expected SHA-256 hex digest of the file content. Loading fails if it does not match.
+        """
+
+        with opened(handler, "rb") as file:
+            reader = file if checksum is None else ChecksumReader(file)
+            data = load_yaml(reader)
+
+            if checksum is not None:
+                reader.verify(checksum)
+
+        data = resolve_sidecars(data, handler_directory(handler))
+
+        return cls.from_dict(data, trusted=trusted)
+
+    @classmethod
+    def iter_yaml(
+        cls,
+        handler: Union[IO, PathLike],
+        trusted: bool = False,
+    ) -> Iterator["DataModel"]:
+        """Yields an object per document of a multi-document YAML file.
+
+        Documents are separated by '---' and parsed one by one, such that
+        streams of many datasets can be processed without loading them all.
+
+        Example:
+            >>> for dataset in Dataset.iter_yaml("datasets.yaml"):
+            ...     print(dataset.id)
+
+        Args:
+            handler (Union[IO, PathLike]): File handler or path of a (compressed) file to read from.
+            trusted (bool): If True, the data is assumed to be an unmodified export of this library and is not validated. Defaults to False.
+        """
+
+        with opened(handler, "r") as file:
+            yield from iter_yaml(
+                cls,
+                file,
+                trusted=trusted,
+                sidecar_dir=handler_directory(handler),
+            )
+
+    @classmethod
+    def from_ndjson(
+        cls,
+        handler: Union[IO, PathLike],
+        obj: Optional["DataModel"] = None,
+        trusted: bool = False,
+        batch_size: int = 1000,
+        backend: Optional[str] = None,
+    ):
+        """Rebuilds list fields from an NDJSON file written by 'to_ndjson'.
+
+        Records are appended in batches to the lists they have been exported
+        from. Lists of nested objects are appended to the parent at the
+        exported position, which has to be present already.
+
+        Args:
+            handler (Union[IO, PathLike]): Text or binary file handler or path of a (compressed) file to read from.
+            obj (Optional[DataModel]): Object to append to. Defaults to a new instance of this class, which requires the class to have no required fields.
+            trusted (bool): If True, the records are assumed to be unmodified exports of this library and are not validated. Defaults to False.
+            batch_size (int): Number of records that are appended at once. Defaults to 1000.
+            backend (Optional[str]): Name of the JSON backend used to parse records.
+        """
+
+        with opened(handler, "rb") as file:
+            return load_ndjson(
+                cls,
+                file,
+                obj=obj,
+                trusted=trusted,
+                batch_size=batch_size,
+                backend=backend,
+            )
+
+    @classmethod
+    def open_sharded(cls, directory: str, trusted: bool = False):
+        """Opens a dataset written by 'to_sharded' without reading its shards.
+
+        Shards are read once their list is accessed. Indexing a list reads
+        only the shard holding the requested object.
+
+        Args:
+            directory (str): Directory the dataset has been written to.
+            trusted (bool): If True, the data is assumed to be an unmodified export of this library and is not validated. Defaults to False.
+        """
+
+        return open_sharded(cls, directory, trusted=trusted)
+
+    @classmethod
+    def from_binary(
+        cls,
+        buffer: Union[bytes, bytearray, memoryview],
+        trusted: bool = False,
+    ):
+        """Creates an object from the compact sdRDM binary format.
+
+        Arrays are views on the given buffer and are thus not copied.
+
+        Args:
+            buffer (Union[bytes, bytearray, memoryview]): Binary representation of the object.
+            trusted (bool): If True, the data is assumed to be an unmodified export of this library and is not validated. Defaults to False.
+        """
+
+        return from_binary(cls, buffer, trusted=trusted)
 
     @classmethod
-    def from_xml(cls, handler: IO):
-        return super().from_xml(handler.read())
+    def from_xml(cls, handler: Union[IO, PathLike]):
+        """Creates an object from an XML file.
+
+        The file is parsed incrementally and each sub-object is validated as
+        soon as its element closes, after which the element is discarded.
+        Paths ending with '.gz', '.bz2' or '.xz' are decompressed while reading.
+
+        Args:
+            handler (Union[IO, PathLike]): Binary file handler or path to read the XML data from.
+        """
+
+        with opened(handler, "rb") as file:
+            return load_xml(cls, file)
+
+    @classmethod
+    def from_xml_string(cls, xml_string: Union[str, bytes]):
+        """Creates an object from an XML string.
+
+        Args:
+            xml_string (Union[str, bytes]): XML representation of the object.
+        """
+
+        if isinstance(xml_string, str):
+            xml_string = xml_string.encode()
+
+        return load_xml(cls, io.BytesIO(xml_string))
 
     @classmethod
-    def from_xml_string(cls, xml_string: str):
-        return super().from_xml(xml_string)
+    def from_xml_tree(cls, root: _Element, context: Optional[Dict[str, Any]] = None):
+        """Creates an object from an XML element tree.
+
+        The validation context marks all created objects as deserialized from
+        XML, which generated classes use to capture raw XML data.
+
+        Args:
+            root (_Element): Element of the object.
+            context (Optional[Dict[str, Any]]): Validation context.
+        """
+
+        return super().from_xml_tree(root, context=xml_context(context))
+
+    @classmethod
+    def iter_xml(cls, handler: Union[IO, PathLike], path: str) -> Iterator["DataModel"]:
+        """Yields the objects at a meta path of an XML file one by one.
+
+        Only the elements of the currently yielded object are kept in memory,
+        everything else is discarded as soon as it has been read. Thus, large
+        lists can be processed without loading the file.
+
+        Example:
+            >>> for measurement in Dataset.iter_xml(handler, "measurements"):
+            ...     print(measurement.id)
+
+        Args:
+            handler (Union[IO, PathLike]): Binary file handler or path of a (compressed) file to read the XML data from.
+            path (str): Meta path of an object attribute, e.g. 'measurements' or 'measurements/species'.
+        """
+
+        return iter_xml(cls, handler, path)
 
     @classmethod
     def from_hdf5(cls, file):
@@ -582,6 +1225,12 @@ class DataModel(pydantic_xml.BaseXmlModel):
                 "HDF5 is not installed. Please install it via 'pip install h5py'"
             )
 
+        if is_path(file):
+            import h5py
+
+            with h5py.File(file, "r") as h5file:
+                return read_hdf5(cls, h5file)
+
         return read_hdf5(cls, file)
 
     # ! Dynamic initializers
@@ -599,6 +1248,9 @@ class DataModel(pydantic_xml.BaseXmlModel):
         is not known. In addition, this function allows you to load any sdRDM capable
         format without having to install a library.
 
+        JSON and YAML files may be compressed with gzip, bzip2 or LZMA, which
+        is recognized by their '.gz', '.bz2' or '.xz' extension.
+
         Args:
             path (str): Path to the file to load.
             data (Dict): Dataset in dict format.
@@ -609,9 +1261,11 @@ class DataModel(pydantic_xml.BaseXmlModel):
         # Detect base
         if path and data is None:
             if cls._is_json(path):
-                dataset = json.loads(open(path).read())
+                with open_file(path, "rb") as file:
+                    dataset = json.load(file)
             elif cls._is_yaml(path):
-                dataset = yaml.safe_load(open(path).read())
+                with open_file(path) as file:
+                    dataset = load_yaml(file)
             elif cls._is_hdf5(path):
                 import deepdish as dd
 
@@ -654,7 +1308,8 @@ class DataModel(pydantic_xml.BaseXmlModel):
     @staticmethod
     def _is_json(path: str):
         try:
-            json.loads(open(path).read())
+            with open_file(path, "rb") as file:
+                json.load(file)
         except ValueError as e:
             return False
         return True
@@ -662,7 +1317,8 @@ class DataModel(pydantic_xml.BaseXmlModel):
     @staticmethod
     def _is_yaml(path: str):
         try:
-            yaml.safe_load(open(path).read())
+            with open_file(path) as file:
+                load_yaml(file)
         except ValueError as e:
             return False
         return True
@@ -809,7 +1465,10 @@ class DataModel(pydantic_xml.BaseXmlModel):
         if not validators.url(term):
             raise ValueError(f"Given term '{term}' is not a valid URL.")
 
-        self._attribute_terms[attribute].add(term)
+        if self._attribute_terms is None:
+            self._attribute_terms = {}
+
+        self._attribute_terms.setdefault(attribute, set()).add(term)
 
     def add_object_term(
         self,
@@ -827,6 +1486,9 @@ class DataModel(pydantic_xml.BaseXmlModel):
         if not validators.url(term):
             raise ValueError(f"Given term '{term}' is not a valid URL.")
 
+        if self._object_terms is None:
+            self._object_terms = set()
+
         self._object_terms.add(term)
 
     # ! Utilities
@@ -873,39 +1535,14 @@ class DataModel(pydantic_xml.BaseXmlModel):
         return tree
 
     # ! Validators
-    @field_validator("*")
     @classmethod
-    def _convert_extended_list_and_numpy_strings(cls, value):
-        """Validator used to convert any list into a ListPlus."""
-
-        if isinstance(value, list):
-            return ListPlus(*[cls._convert_numpy_type(v) for v in value], in_setup=True)
-        elif isinstance(value, np.str_):
-            return str(value)
-        else:
-            return value
+    def __get_pydantic_core_schema__(cls, source, handler):
+        """Compiles the validation pipelines of all fields before the schema is built"""
 
-    @field_validator("*", mode="before")
-    def _convert_lists_to_ndarray(cls, value, info):
-        field_type = cls.model_fields[info.field_name].annotation
-        if cls._has_ndarray(field_type) and isinstance(value, list):
-            return np.array(value)
+        if "__pydantic_core_schema__" not in cls.__dict__:
+            compile_field_pipelines(cls)
 
-        return value
-
-    @staticmethod
-    def _has_ndarray(dtype):
-        return any(
-            t.__name__ == "ndarray" for t in get_args(dtype) if hasattr(t, "__name__")
-        )
-
-    @staticmethod
-    def _convert_numpy_type(value):
-        """Helper function to convert numpy strings into builtin"""
-        if isinstance(value, np.str_):
-            return str(value)
-
-        return value
+        return super().__get_pydantic_core_schema__(source, handler)
 
     def validate_references(self):
         """Recursively validates this object and all sub-objects"""
@@ -925,76 +1562,9 @@ class DataModel(pydantic_xml.BaseXmlModel):
 
         return report
 
-    @field_validator("*")
-    @classmethod
-    def check_list_values(cls, values, info):
-        if not isinstance(values, (list, ListPlus)):
-            return values
-
-        field_type = cls.model_fields[info.field_name].annotation
-
-        if get_args(field_type):
-            field_type = get_args(field_type)
-        else:
-            field_type = [field_type]
-
-        for value in values:
-            checks = [
-                cls._check_list_value(value, dtype)
-                for dtype in field_type
-                if dtype != type(None)
-            ]
-
-            if not any([check[1] for check in checks]):
-                error_messages = "\n".join(
-                    [msg for msg, check in checks if check is False]
-                )
-                raise TypeError(error_messages)
-
-        return values
-
-    @staticmethod
-    def _check_list_value(value: Any, field_type) -> Tuple[str, bool]:
-        msg = f"List element of type '{type(value)}' cannot be added. Expected type '{field_type}'"
-
-        if not isinstance(value, field_type) and not issubclass(field_type, Enum):
-            return msg, False
-
-        return "", True
-
-    @field_validator("*", mode="before")
-    @classmethod
-    def convert_numpy_to_appropriate_type(cls, value, info):
-        """Converts numpy arrays to the appropriate native numeric type, if possible."""
-
-        field_type = cls.model_fields[info.field_name].annotation
-
-        if not isinstance(value, np.ndarray):
-            # Skip if not a numpy array
-            return value
-
-        is_multiple = get_origin(field_type) is list
-        is_numeric = any(dtype in (int, float) for dtype in get_args(field_type))
-
-        if not is_numeric:
-            return value
-
-        if isinstance(value, np.ndarray) and is_multiple:
-            return value.tolist()
-        elif isinstance(value, np.ndarray) and not is_multiple:
-            return field_type(value)
-
-        return value
-
     # ! Pre-validators
     def _convert_units(self, model, data):
-        unit_fields = [
-            name
-            for name, field in model.model_fields.items()
-            if self._is_unit_type(field)
-        ]
-
-        for name in unit_fields:
+        for name in model._get_field_table().unit_fields:
             if name not in data:
                 continue
 
@@ -1033,12 +1603,87 @@ class DataModel(pydantic_xml.BaseXmlModel):
         else:
             return converted[0]
 
+    # ! Bulk mode
+    @contextmanager
+    def bulk(self, raise_errors: bool = True):
+        """Defers validation, parent bookkeeping and reference checks of assignments and list operations.
+
+        Within the context, values are stored as given. Upon exit, each touched
+        field is validated once and all reference checks are run on the complete
+        tree. Errors are collected into a single report. The context applies to
+        all objects modified within it, including newly created ones. Values
+        that fail validation are never kept. If errors are raised, all touched
+        fields are restored to the values they had before the context.
+
+        Example:
+            with ds.bulk() as context:
+                for value in values:
+                    ds.add_to_measurements(value=value)
+
+        Args:
+            raise_errors (bool): Whether to raise a ValueError if the report is not empty. Defaults to True.
+
+        Yields:
+            BulkContext: The context, whose 'report' is available after exit.
+        """
+
+        if active_bulk() is not None:
+            # Nested contexts are finalized by the outermost one
+            yield active_bulk()
+            return
+
+        context = BulkContext()
+        context.activate()
+
+        try:
+            yield context
+        except BaseException:
+            context.deactivate()
+            context.finalize()
+            raise
+
+        context.deactivate()
+        report = context.finalize(restore=raise_errors)
+
+        if report and raise_errors:
+            raise ValueError(self._render_report(report))
+
+    def _revalidate_field(self, name: str, validate: bool = True) -> None:
+        """Runs the deferred validation and bookkeeping of a single field, except reference checks"""
+
+        if validate:
+            value = self.__dict__.get(name)
+
+            if name in self._get_field_table().unit_fields:
+                value = self._convert_unit_string_to_unit_type(value)
+
+            self._add_reference_to_object(name, value)
+            super().__setattr__(name, value)
+
+        value = self.__dict__[name]
+        self._set_parent_instances(value)
+
+        if isinstance(value, (list, ListPlus)):
+            value._parent = self
+            value._attribute = name
+
+        self._invalidate_caches()
+
     # ! Overloads
     def __setattr__(self, name, value):
-        if bool(re.match("_[a-zA-Z0-9]*", name)):
+        if name.startswith("_"):
             return super().__setattr__(name, value)
 
-        if self._is_unit_type(self.model_fields[name]):
+        context = active_bulk()
+
+        if context is not None and name in self.model_fields:
+            context.touch(self, name)
+            self.__dict__[name] = value
+            self.__pydantic_fields_set__.add(name)
+            self._invalidate_caches()
+            return
+
+        if name in self._get_field_table().unit_fields:
             value = self._convert_unit_string_to_unit_type(value)
 
         self._add_reference_to_object(name, value)
@@ -1051,46 +1696,61 @@ class DataModel(pydantic_xml.BaseXmlModel):
             self.__dict__[name]._parent = self
             self.__dict__[name]._attribute = name
 
+        self._invalidate_caches()
+
     def _add_reference_to_object(self, name, value):
         """Adds the current class to the referenced object to maintain its relation"""
 
         if name.startswith("_"):
             return
 
-        extra = self.model_fields[name].json_schema_extra
+        target_attr = self._get_field_table().reference_targets.get(name)
 
-        if extra is None:
-            return
-        elif "reference" not in extra:
+        if target_attr is None:
             return
         elif not hasattr(value, "model_fields"):
             return
 
         # Add the relation to the attribute of this field
-        self._references[name].append(value)
+        self._get_references().setdefault(name, []).append(value)
 
         # Also add it to the other object
-        target_attr = extra["reference"].split(".")[-1]
-        value._references[target_attr].append(self)
+        value._get_references().setdefault(target_attr, []).append(self)
+
+    def _get_references(self) -> DottedDict:
+        """Returns the objects related to this one and allocates them on first use"""
+
+        if self._references is None:
+            self._references = DottedDict()
+
+        return self._references
 
     def _check_references(self, name, value):
         """Checks whether references are compliant"""
 
+        report = self._get_reference_report(name, value)
+
+        if report != {}:
+            raise ValueError(self._render_report(report))
+
+    def _get_reference_report(self, name, value) -> Dict:
+        """Returns all reference violations of a value assigned to a field"""
+
         if self.is_data_model(value):
-            report = self.check_object_references(value)
+            return self.check_object_references(value)
         else:
-            report = self.check_value_references(name, value)
+            return self.check_value_references(name, value)
 
-        if report != {}:
-            rendered_report = "\n\n".join(
-                [f"- {message}" for message in report.values()]
-            )
-            raise ValueError(
-                f"""Object is not compliant to the model:
+    @staticmethod
+    def _render_report(report: Dict) -> str:
+        """Renders a report of violations into an error message"""
+
+        rendered_report = "\n\n".join([f"- {message}" for message in report.values()])
+
+        return f"""Object is not compliant to the model:
 
             {rendered_report}
                 """
-            )
 
     def _set_parent_instances(self, value) -> None:
         """Sets current instance as the parent to objects"""
@@ -1147,25 +1807,113 @@ class DataModel(pydantic_xml.BaseXmlModel):
 
         return hasattr(value, "model_fields")
 
+    # ! Digests
+    def _get_digest(self) -> str:
+        """Returns the structural digest of this object based on its field content.
+
+        The digest is cached and dropped whenever this object or one of its
+        sub-objects is modified via attribute assignment or `ListPlus` methods.
+        In-place modifications of values, such as arrays, are not tracked.
+        """
+
+        if self._digest is None:
+            data = [
+                f"{key}={self._digest_value(self.__dict__.get(key))}"
+                for key in sorted(self.model_fields)
+            ]
+
+            self._digest = hashlib.md5("".join(data).encode()).hexdigest()
+
+        return self._digest
+
+    @classmethod
+    def _digest_value(cls, value) -> str:
+        """Converts a field value into a string representation used for digests"""
+
+        if isinstance(value, DataModel):
+            return value._get_digest()
+        elif isinstance(value, list):
+            return "[" + ",".join(cls._digest_value(v) for v in value) + "]"
+        elif isinstance(value, dict):
+            return (
+                "{"
+                + ",".join(f"{k}:{cls._digest_value(v)}" for k, v in value.items())
+                + "}"
+            )
+        elif isinstance(value, np.ndarray):
+            content = hashlib.md5(np.ascontiguousarray(value).tobytes()).hexdigest()
+            return f"ndarray({value.dtype},{value.shape},{content})"
+
+        return str(value)
+
+    # ! Diffs
+    def diff(self, other: "DataModel") -> List[Dict]:
+        """Computes the operations needed to turn this object into another one.
+
+        Identical subtrees are skipped by comparing their digests and lists of
+        objects are aligned by the IDs of their items. The resulting operations
+        are JSON compatible and can be applied via `apply_patch`.
+
+        Args:
+            other (DataModel): Object of the same type to compare to.
+
+        Returns:
+            List[Dict]: Operations in the form of {"op": ..., "path": ..., "value": ...}.
+        """
+
+        return diff_models(self, other)
+
+    def apply_patch(self, operations: Union[str, List[Dict]]) -> "DataModel":
+        """Applies operations computed by `diff` to this object in place.
+
+        Args:
+            operations (Union[str, List[Dict]]): Operations or their JSON representation.
+        """
+
+        apply_patch(self, operations)
+
+        return self
+
     # ! Dunder methods
     def __hash__(self) -> int:
-        """Hashes the object based on its `dict` content"""
+        """Hashes the object based on its cached structural digest"""
 
-        data = [f"{key}={dict(self)[key]}" for key in sorted(dict(self).keys())]  # type: ignore
-        data_string = "".join(data)
-
-        return hashlib.md5(data_string.encode()).hexdigest()
+        return int(self._get_digest(), 16)
 
     def __eq__(self, __value: object) -> bool:
-        """Compares two objects based on their hashes"""
+        """Compares two objects based on their type and structural digests"""
 
-        try:
-            __value.__hash__()
-        except TypeError:
-            raise TypeError(
-                f"Can't compare '{self.__class__.__name__}' to type '{type(__value)}'"
-            )
-        return self.__hash__() == __value.__hash__()
+        if self is __value:
+            return True
+        elif type(self) is not type(__value):
+            return False
+
+        return self._get_digest() == __value._get_digest()  # type: ignore
+
+    def __deepcopy__(self, memo: Optional[Dict[int, Any]] = None) -> "DataModel":
+        copied = super().__deepcopy__(memo)
+        copied._setup_relations()
+
+        return copied
+
+    def __getstate__(self) -> Dict[Any, Any]:
+        state = super().__getstate__()
+        private = state.get("__pydantic_private__")
+
+        if private:
+            # Weak references can't be pickled, relations are restored upon load
+            state["__pydantic_private__"] = {
+                **private,
+                "_parent_ref": None,
+                "_owner_refs": None,
+                "_path_index": None,
+            }
+
+        return state
+
+    def __setstate__(self, state: Dict[Any, Any]) -> None:
+        super().__setstate__(state)
+        self._setup_relations()
 
     def __str__(self) -> str:
         class bcolors:
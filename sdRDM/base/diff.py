@@ -0,0 +1,242 @@
+import json
+
+from typing import Any, Dict, List, Optional, Tuple, Union, get_args
+
+from sdRDM.base.tree import _is_data_model
+
+# Type alias for a single patch operation
+Operation = Dict[str, Any]
+
+
+def diff_models(old: "DataModel", new: "DataModel") -> List[Operation]:
+    """Computes the operations needed to turn one object into another.
+
+    Both objects are compared by their cached digests first, thus identical
+    subtrees are never descended. Lists of objects are aligned by the 'id'
+    of their items, such that only changed items are part of the patch.
+    Lists whose items have been reordered are replaced as a whole.
+
+    Operations are JSON compatible dicts in the form of
+
+        {"op": "add" | "remove" | "replace", "path": "/attr/items[<id>]/attr", "value": ...}
+
+    Args:
+        old (DataModel): Object to compute the patch from.
+        new (DataModel): Object the patch should result in.
+
+    Returns:
+        List[Operation]: Operations to apply to 'old' to arrive at 'new'.
+    """
+
+    if type(old) is not type(new):
+        raise TypeError(
+            f"Can't diff '{type(old).__name__}' against '{type(new).__name__}'"
+        )
+
+    operations = []
+    _diff_objects(old, new, "", operations)
+
+    return operations
+
+
+def apply_patch(obj: "DataModel", operations: Union[str, List[Operation]]) -> None:
+    """Applies operations computed by `diff_models` to an object in place.
+
+    Args:
+        obj (DataModel): Object to apply the patch to.
+        operations (Union[str, List[Operation]]): Operations or their JSON representation.
+    """
+
+    if isinstance(operations, str):
+        operations = json.loads(operations)
+
+    for operation in operations:
+        *parents, (name, item_id) = _parse_path(operation["path"])
+        target = obj
+
+        for parent_name, parent_id in parents:
+            target = getattr(target, parent_name)
+
+            if parent_id is not None:
+                target = _find_item(target, parent_id, operation["path"])
+
+        kind = operation["op"]
+
+        if item_id is None:
+            if kind == "remove":
+                setattr(target, name, None)
+            elif kind in ("add", "replace"):
+                setattr(target, name, operation["value"])
+            else:
+                raise ValueError(f"Unknown patch operation '{kind}'")
+
+            continue
+
+        items = getattr(target, name)
+        field = type(target).model_fields[name]
+
+        if kind == "remove":
+            items.remove(_find_item(items, item_id, operation["path"]))
+        elif kind == "add":
+            items.append(_build_item(field, operation["value"]))
+        elif kind == "replace":
+            index = _index_of(items, _find_item(items, item_id, operation["path"]))
+            items[index] = _build_item(field, operation["value"])
+        else:
+            raise ValueError(f"Unknown patch operation '{kind}'")
+
+
+# ! Diff
+def _diff_objects(old, new, path: str, operations: List[Operation]) -> None:
+    """Compares two objects of the same type field by field"""
+
+    if old._get_digest() == new._get_digest():
+        return
+
+    for name in old.model_fields:
+        old_value = old.__dict__.get(name)
+        new_value = new.__dict__.get(name)
+        field_path = f"{path}/{name}"
+
+        if old_value is None and new_value is None:
+            continue
+        elif old_value is None:
+            operations.append(_operation("add", field_path, new, name))
+        elif new_value is None:
+            operations.append({"op": "remove", "path": field_path})
+        elif _is_data_model(old_value) and type(old_value) is type(new_value):
+            _diff_objects(old_value, new_value, field_path, operations)
+        elif old._digest_value(old_value) == new._digest_value(new_value):
+            continue
+        elif _has_unique_ids(old_value) and _has_unique_ids(new_value):
+            _diff_lists(old_value, new_value, field_path, new, name, operations)
+        else:
+            operations.append(_operation("replace", field_path, new, name))
+
+
+def _diff_lists(old_items, new_items, path, new, name, operations) -> None:
+    """Compares two lists of objects, whose items are aligned by their IDs.
+
+    Removed, added and changed items result in operations per item. If the
+    order of the items changed otherwise, which these can't express, the
+    list is replaced as a whole instead.
+    """
+
+    old_ids = {item.id: item for item in old_items}
+    new_ids = {item.id: item for item in new_items}
+
+    # Removals and additions keep the order, everything else is a reorder
+    kept = [item_id for item_id in old_ids if item_id in new_ids]
+    added = [item_id for item_id in new_ids if item_id not in old_ids]
+
+    if kept + added != list(new_ids):
+        operations.append(_operation("replace", path, new, name))
+        return
+
+    for item_id in old_ids:
+        if item_id not in new_ids:
+            operations.append({"op": "remove", "path": _item_path(path, item_id)})
+
+    for item_id, item in new_ids.items():
+        item_path = _item_path(path, item_id)
+
+        if item_id not in old_ids:
+            operations.append(
+                {"op": "add", "path": item_path, "value": item.to_dict(warn=False)}
+            )
+        elif type(item) is not type(old_ids[item_id]):
+            operations.append(
+                {"op": "replace", "path": item_path, "value": item.to_dict(warn=False)}
+            )
+        else:
+            _diff_objects(old_ids[item_id], item, item_path, operations)
+
+
+def _has_unique_ids(value) -> bool:
+    """Checks whether a value is a list of objects that can be aligned by ID"""
+
+    if not isinstance(value, list) or not value:
+        return False
+    elif not all(_is_data_model(item) and "id" in item.model_fields for item in value):
+        return False
+
+    ids = [item.id for item in value]
+
+    return None not in ids and len(set(ids)) == len(ids)
+
+
+def _operation(kind: str, path: str, obj, name: str) -> Operation:
+    """Creates an operation carrying the exported value of a field"""
+
+    field = obj.model_fields[name]
+    data = obj.to_dict(warn=False, include={name})
+
+    return {"op": kind, "path": path, "value": data.get(field.alias or name)}
+
+
+# ! Patch
+def _parse_path(path: str) -> List[Tuple[str, Optional[str]]]:
+    """Splits a patch path into attribute names and optional item IDs"""
+
+    segments = []
+
+    for segment in path.strip("/").split("/"):
+        if "[" in segment and segment.endswith("]"):
+            name, item_id = segment[:-1].split("[", 1)
+            segments.append((name, _unescape(item_id)))
+        else:
+            segments.append((segment, None))
+
+    return segments
+
+
+def _item_path(path: str, item_id: Any) -> str:
+    return f"{path}[{_escape(str(item_id))}]"
+
+
+def _escape(item_id: str) -> str:
+    return item_id.replace("~", "~0").replace("/", "~1")
+
+
+def _unescape(item_id: str) -> str:
+    return item_id.replace("~1", "/").replace("~0", "~")
+
+
+def _find_item(items, item_id: str, path: str):
+    """Finds an object within a list by its ID"""
+
+    for item in items:
+        if str(getattr(item, "id", None)) == item_id:
+            return item
+
+    raise KeyError(f"No item with ID '{item_id}' found at path '{path}'")
+
+
+def _index_of(items, target) -> int:
+    """Returns the index of an object by identity"""
+
+    for index, item in enumerate(items):
+        if item is target:
+            return index
+
+    raise ValueError("Item is not part of the list")
+
+
+def _build_item(field, value):
+    """Builds a list item from its exported representation"""
+
+    if not isinstance(value, dict):
+        return value
+
+    candidates = [dtype for dtype in get_args(field.annotation) if _is_data_model(dtype)]
+
+    if not candidates:
+        return value
+
+    types = value.get("@type", [])
+    dtype = next(
+        (dtype for dtype in candidates if types and dtype.__name__ == types[0]),
+        candidates[0],
+    )
+
+    return dtype.model_validate(value)
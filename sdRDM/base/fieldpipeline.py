@@ -0,0 +1,241 @@
+import types
+import numpy as np
+
+from enum import Enum
+from pydantic import AfterValidator, BeforeValidator
+from typing import Annotated, Any, Callable, List, Optional, Tuple, TypeVar, Union, get_args, get_origin
+
+from sdRDM.base.fieldtable import is_multiple, is_ndarray, is_numeric
+from sdRDM.base.listplus import ListPlus
+
+# Step of a pipeline, which receives and returns the value of a field
+Step = Callable[[Any], Any]
+
+# Kinds of NumPy arrays, whose elements are instances of a numeric class
+_NUMERIC_KINDS = {bool: "b", int: "biu", float: "f"}
+
+# Origins of unions, including those written as 'X | Y' on Python 3.10 and later
+_UNION_TYPES = (Union, types.UnionType) if hasattr(types, "UnionType") else (Union,)
+
+
+class _BeforeStep(BeforeValidator):
+    """Pipeline of a field, which runs before pydantic validates the type"""
+
+
+class _AfterStep(AfterValidator):
+    """Pipeline of a field, which runs after pydantic validated the type"""
+
+
+def compile_field_pipelines(cls) -> None:
+    """Attaches the validation steps each field of a class needs to the field.
+
+    The steps are selected once per class from the annotation of each field
+    and attached as a single validator before and after the type validation
+    of pydantic. Fields whose values are fully validated by pydantic, such
+    as strings or numbers, are not given any step and thus validated without
+    calling back into Python. Steps of a previous compilation, for instance
+    those inherited from a parent class, are replaced.
+
+    Args:
+        cls (Type[DataModel]): Class whose fields are compiled.
+    """
+
+    for field in cls.model_fields.values():
+        before, after = compile_pipeline(field.annotation)
+        metadata = [
+            entry
+            for entry in field.metadata
+            if not isinstance(entry, (_BeforeStep, _AfterStep))
+        ]
+
+        if before is not None:
+            metadata.append(_BeforeStep(before))
+
+        if after is not None:
+            metadata.append(_AfterStep(after))
+
+        # Re-assigned, since inherited fields share the metadata of their parent
+        field.metadata = metadata
+
+
+def compile_pipeline(annotation) -> Tuple[Optional[Step], Optional[Step]]:
+    """Composes the steps run before and after the type validation of a field.
+
+    Args:
+        annotation (Any): Annotation of the field.
+
+    Returns:
+        Tuple[Optional[Step], Optional[Step]]: Steps before and after the type validation, if any.
+    """
+
+    before = []
+
+    if is_numeric(annotation) and is_multiple(annotation):
+        before.append(_ndarray_to_list)
+    elif is_numeric(annotation) and not is_ndarray(annotation):
+        before.append(_ndarray_to_scalar)
+
+    if is_ndarray(annotation):
+        before.append(_list_to_ndarray)
+
+    if is_multiple(annotation):
+        after = _list_step(get_args(annotation))
+    elif _is_open(annotation):
+        after = _convert_list_and_numpy_string
+    else:
+        after = None
+
+    return _chain(before), after
+
+
+def _chain(steps: List[Step]) -> Optional[Step]:
+    """Merges steps into a single one, which runs them in order"""
+
+    if not steps:
+        return None
+    elif len(steps) == 1:
+        return steps[0]
+
+    def run(value):
+        for step in steps:
+            value = step(value)
+
+        return value
+
+    return run
+
+
+def _is_open(annotation) -> bool:
+    """Whether values validated against an annotation may be lists or NumPy strings"""
+
+    if annotation in (Any, object) or isinstance(annotation, TypeVar):
+        return True
+
+    origin = get_origin(annotation)
+
+    if origin is list:
+        return True
+    elif origin is Annotated:
+        return _is_open(get_args(annotation)[0])
+    elif origin in _UNION_TYPES:
+        return any(_is_open(arg) for arg in get_args(annotation))
+
+    return False
+
+
+def _ndarray_to_list(value):
+    """Converts NumPy arrays to lists of native numbers"""
+
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+
+    return value
+
+
+def _ndarray_to_scalar(value):
+    """Converts NumPy arrays holding a single value to a native number"""
+
+    if isinstance(value, np.ndarray) and value.size == 1:
+        return value.item()
+
+    return value
+
+
+def _list_to_ndarray(value):
+    """Converts lists to NumPy arrays"""
+
+    if isinstance(value, list):
+        return np.array(value)
+
+    return value
+
+
+def _convert_numpy_string(value):
+    """Converts NumPy strings to builtin strings"""
+
+    if isinstance(value, np.str_):
+        return str(value)
+
+    return value
+
+
+def _convert_list_and_numpy_string(value):
+    """Converts lists to ListPlus and NumPy strings to builtin strings"""
+
+    if isinstance(value, list):
+        return ListPlus._from_values(value)
+
+    return _convert_numpy_string(value)
+
+
+def _list_step(args: Tuple) -> Step:
+    """Creates the step checking the elements of a list field and converting it to a ListPlus"""
+
+    expected = [dtype for dtype in args if dtype is not type(None)]
+    checked = _element_types(expected)
+    kinds = _numeric_kinds(checked)
+    convert = any(_is_open(dtype) for dtype in expected)
+
+    def validate(values):
+        if checked is not None and not (kinds and _has_kinds(values, kinds)):
+            for value in values:
+                if not isinstance(value, checked):
+                    raise TypeError(
+                        "\n".join(
+                            f"List element of type '{type(value)}' cannot be added. Expected type '{dtype}'"
+                            for dtype in expected
+                        )
+                    )
+
+        if convert:
+            values = [_convert_numpy_string(v) for v in values]
+
+        return ListPlus._from_values(values)
+
+    return validate
+
+
+def _element_types(expected: List) -> Optional[Tuple[type, ...]]:
+    """Classes list elements are checked against or None, if no check is possible"""
+
+    classes = []
+
+    for dtype in expected:
+        if get_origin(dtype) in _UNION_TYPES:
+            classes.extend(get_args(dtype))
+        else:
+            classes.append(dtype)
+
+    if not classes or not all(isinstance(dtype, type) for dtype in classes):
+        return None
+    elif any(issubclass(dtype, Enum) for dtype in classes):
+        return None
+
+    return tuple(classes)
+
+
+def _numeric_kinds(classes: Optional[Tuple[type, ...]]) -> str:
+    """Kinds of NumPy arrays, whose elements are instances of numeric classes.
+
+    Returns an empty string, if any of the classes is not numeric.
+    """
+
+    if not classes or not all(dtype in _NUMERIC_KINDS for dtype in classes):
+        return ""
+
+    return "".join(_NUMERIC_KINDS[dtype] for dtype in classes)
+
+
+def _has_kinds(values: List, kinds: str) -> bool:
+    """Checks in bulk whether the values of a list form an array of the given kinds.
+
+    The values have been validated by pydantic beforehand, thus the kind of
+    the array reflects the classes of the elements. Otherwise, for instance
+    for lists of mixed or unexpected classes, the elements are checked one
+    by one to report the offending element.
+    """
+
+    try:
+        return np.asarray(values).dtype.kind in kinds
+    except (ValueError, OverflowError):
+        return False
@@ -0,0 +1,128 @@
+from types import MappingProxyType
+from typing import Annotated, Any, Dict, FrozenSet, Mapping, Tuple, get_args, get_origin
+
+# Name of the class attribute the table is stored at
+TABLE_ATTRIBUTE = "__sdrdm_field_table__"
+
+
+class FieldTable:
+    """Describes the fields of a data model class, computed once per class.
+
+    All instances of a class share the same table, thus hot paths such as
+    instance creation, assignments and validation only perform lookups
+    instead of repeatedly introspecting the field annotations.
+
+    Attributes:
+        types (Mapping[str, Any]): Read-only data model types of each field, copied by '_types'.
+        object_fields (Tuple[str, ...]): Fields that can hold objects or lists of objects.
+        unit_fields (FrozenSet[str]): Fields that hold units.
+        ndarray_fields (FrozenSet[str]): Fields that accept NumPy arrays.
+        multiple_fields (FrozenSet[str]): Fields that hold lists.
+        numeric_fields (FrozenSet[str]): Fields whose type includes 'int' or 'float'.
+        reference_targets (Dict[str, str]): Attribute of the referenced object per field ('reference').
+        reference_checks (Dict[str, Tuple[str, str]]): Root and path each value has to appear at ('references').
+        names (Dict[str, str]): Maps aliases and names of exported keys to field names.
+    """
+
+    def __init__(self, cls):
+        from sdRDM.base.datatypes import Unit
+
+        types = {}
+        object_fields = []
+        unit_fields = set()
+        ndarray_fields = set()
+        multiple_fields = set()
+        numeric_fields = set()
+        self.reference_targets: Dict[str, str] = {}
+        self.reference_checks: Dict[str, Tuple[str, str]] = {}
+        self.names: Dict[str, str] = {}
+
+        for name, field in cls.model_fields.items():
+            annotation = field.annotation
+            self.names[name] = name
+
+            if field.alias:
+                self.names[field.alias] = name
+
+            args = get_args(annotation)
+
+            if not args and hasattr(annotation, "model_fields"):
+                types[name] = annotation
+            elif args:
+                types[name] = tuple(
+                    [subtype for subtype in args if hasattr(subtype, "model_fields")]
+                )
+
+            if types.get(name):
+                object_fields.append(name)
+
+            if annotation == Unit or any(dtype == Unit for dtype in args):
+                unit_fields.add(name)
+
+            if is_ndarray(annotation):
+                ndarray_fields.add(name)
+
+            if is_multiple(annotation):
+                multiple_fields.add(name)
+
+            if is_numeric(annotation):
+                numeric_fields.add(name)
+
+            extra = field.json_schema_extra or {}
+
+            if "reference" in extra:
+                self.reference_targets[name] = extra["reference"].split(".")[-1]
+
+            if "references" in extra:
+                root, *path = extra["references"].split(".")
+                self.reference_checks[name] = (root, "/".join(path))
+
+        self.types: Mapping[str, Any] = MappingProxyType(types)
+        self.object_fields: Tuple[str, ...] = tuple(object_fields)
+        self.unit_fields: FrozenSet[str] = frozenset(unit_fields)
+        self.ndarray_fields: FrozenSet[str] = frozenset(ndarray_fields)
+        self.multiple_fields: FrozenSet[str] = frozenset(multiple_fields)
+        self.numeric_fields: FrozenSet[str] = frozenset(numeric_fields)
+
+
+def is_ndarray(annotation) -> bool:
+    """Whether an annotation accepts NumPy arrays"""
+
+    return any(getattr(dtype, "__name__", None) == "ndarray" for dtype in get_args(annotation))
+
+
+def is_multiple(annotation) -> bool:
+    """Whether an annotation describes a list"""
+
+    return get_origin(annotation) is list
+
+
+def is_numeric(annotation) -> bool:
+    """Whether an annotation includes 'int' or 'float'"""
+
+    return any(dtype in (int, float) for dtype in get_args(annotation))
+
+
+def unwrap_annotated(dtype):
+    """Returns the underlying type of constrained types such as 'PositiveFloat'"""
+
+    if get_origin(dtype) is Annotated:
+        return get_args(dtype)[0]
+
+    return dtype
+
+
+def get_field_table(cls) -> FieldTable:
+    """Returns the field table of a class and builds it upon first use.
+
+    The table is stored on the class itself, such that it is released along
+    with dynamically generated libraries and not inherited by sub-classes.
+    """
+
+    table = cls.__dict__.get(TABLE_ATTRIBUTE)
+
+    if table is None:
+        table = FieldTable(cls)
+        setattr(cls, TABLE_ATTRIBUTE, table)
+
+    return table
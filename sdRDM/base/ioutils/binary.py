@@ -0,0 +1,434 @@
+import json
+import struct
+
+import numpy as np
+import pydantic_core
+
+from itertools import accumulate
+from typing import Any, Dict, List, Tuple, Union
+
+from sdRDM.base.trusted import check_source
+
+# Marks the start of a binary document
+MAGIC = b"SDRB"
+VERSION = 3
+
+# Array buffers start at multiples of this offset relative to the document
+ALIGNMENT = 64
+
+_U32 = struct.Struct("<I")
+_UINT64 = struct.Struct("<Q")
+_INT64 = struct.Struct("<q")
+_FLOAT64 = struct.Struct("<d")
+
+_INT64_MIN, _INT64_MAX = -(2**63), 2**63 - 1
+
+# Tags of single values
+_NONE, _TRUE, _FALSE, _INT, _BIGINT, _FLOAT, _STR, _BYTES, _MAP, _LIST, _ARRAY = b"NTFIJDSYMLA"
+
+# Tags of columns, which hold all values of a list at once
+_FLOATS, _INTS, _BOOLS, _STRS, _CODES, _LISTS, _RECORDS, _VALUES = b"fibsclrg"
+
+
+def to_binary(obj: "DataModel", exclude_none: bool = True) -> bytes:
+    """Encodes an object to the compact sdRDM binary format.
+
+    The document consists of a header stating the root class and the source
+    repository and commit of the library, a table of the keys of all maps,
+    which are referenced by their index, and the tagged values. Lists are
+    stored as columns: Numbers of a list are stored as a single raw buffer,
+    strings as a single UTF-8 text and lists of maps sharing their keys,
+    such as the objects of a list attribute, column by column. Arrays and
+    the buffers of columns follow the values and are aligned to 64 bytes
+    relative to the start of the document.
+
+    Args:
+        obj (DataModel): Object to encode.
+        exclude_none (bool): Whether to exclude unset values. Defaults to True.
+
+    Returns:
+        bytes: The encoded document.
+    """
+
+    data = obj.model_dump(exclude_none=exclude_none, by_alias=True, mode="python")
+
+    return encode_binary(source_info(obj), data)
+
+
+def source_info(obj: "DataModel") -> Dict:
+    """Returns the class, repository and commit an object stems from"""
+
+    return {
+        "root": obj.__class__.__name__,
+        "repo": getattr(obj, "_repo", None),
+        "commit": getattr(obj, "_commit", None),
+    }
+
+
+def encode_binary(header: Dict, data: Any) -> bytes:
+    """Encodes a header and arbitrary exported data to a binary document.
+
+    Args:
+        header (Dict): Information about the document, such as its source.
+        data (Any): Exported data made up by dictionaries, lists, arrays and scalars.
+
+    Returns:
+        bytes: The encoded document.
+    """
+
+    encoder = _Encoder()
+    encoder.value(data)
+
+    arrays = encoder.arrays
+    table = json.dumps([[array.dtype.str, array.shape] for array in arrays])
+
+    out = bytearray(MAGIC)
+    out.append(VERSION)
+
+    for part in (
+        json.dumps(header).encode(),
+        json.dumps(list(encoder.keys)).encode(),
+        encoder.out,
+        table.encode(),
+    ):
+        out += _UINT64.pack(len(part))
+        out += part
+
+    for array in arrays:
+        out += bytes(-len(out) % ALIGNMENT)
+        out += array.tobytes()
+
+    return bytes(out)
+
+
+def from_binary(
+    cls,
+    buffer: Union[bytes, bytearray, memoryview],
+    trusted: bool = False,
+) -> "DataModel":
+    """Decodes an object from the compact sdRDM binary format.
+
+    Arrays are returned as views on the given buffer, thus they are not
+    copied and the buffer is kept alive as long as they are in use. Views
+    on immutable buffers are read-only.
+
+    Args:
+        cls (Type[DataModel]): Class of the root object.
+        buffer (Union[bytes, bytearray, memoryview]): Encoded document.
+        trusted (bool): If True, the data is not validated, but has to stem from the same library.
+
+    Returns:
+        DataModel: The decoded object.
+    """
+
+    header, data = decode_binary(buffer)
+
+    if header.get("root") != cls.__name__:
+        raise ValueError(
+            f"Binary document holds '{header.get('root')}', but '{cls.__name__}' was expected."
+        )
+
+    if trusted:
+        check_source(cls, {"__source__": header})
+
+    return cls.from_dict(data, trusted=trusted)
+
+
+def decode_binary(buffer: Union[bytes, bytearray, memoryview]) -> Tuple[Dict, Any]:
+    """Decodes the header and the data of a binary document without creating objects.
+
+    Args:
+        buffer (Union[bytes, bytearray, memoryview]): Encoded document.
+
+    Returns:
+        Tuple[Dict, Any]: Header and exported data.
+    """
+
+    view = memoryview(buffer).cast("B")
+
+    if bytes(view[:4]) != MAGIC:
+        raise ValueError("Buffer is not an sdRDM binary document.")
+    elif view[4] != VERSION:
+        raise ValueError(f"Binary format version '{view[4]}' is not supported.")
+
+    header, pos = _read_sized(view, 5)
+    keys, pos = _read_sized(view, pos)
+    body, pos = _read_sized(view, pos)
+    table, pos = _read_sized(view, pos)
+    arrays = []
+
+    for dtype, shape in json.loads(table):
+        dtype = np.dtype(dtype)
+        count = int(np.prod(shape))
+        pos += -pos % ALIGNMENT
+
+        array = np.frombuffer(view, dtype=dtype, count=count, offset=pos)
+        arrays.append(array.reshape(shape))
+        pos += count * dtype.itemsize
+
+    decoder = _Decoder(body, json.loads(keys), arrays)
+
+    return json.loads(header), decoder.value()
+
+
+class _Encoder:
+    """Writes tagged values, while collecting the keys of maps and the buffers of arrays"""
+
+    def __init__(self):
+        self.out = bytearray()
+        self.keys: Dict[str, int] = {}
+        self.arrays: List[np.ndarray] = []
+
+    def value(self, value: Any) -> None:
+        out = self.out
+        kind = type(value)
+
+        if value is None:
+            out.append(_NONE)
+        elif kind is bool:
+            out.append(_TRUE if value else _FALSE)
+        elif kind is int and _INT64_MIN <= value <= _INT64_MAX:
+            out.append(_INT)
+            out += _INT64.pack(value)
+        elif kind is int:
+            out.append(_BIGINT)
+            self._text(str(value))
+        elif kind is float:
+            out.append(_FLOAT)
+            out += _FLOAT64.pack(value)
+        elif kind is str:
+            out.append(_STR)
+            self._text(value)
+        elif kind is bytes:
+            out.append(_BYTES)
+            out += _U32.pack(len(value))
+            out += value
+        elif isinstance(value, dict):
+            out.append(_MAP)
+            out += _U32.pack(len(value))
+
+            for key, item in value.items():
+                out += _U32.pack(self._key(key))
+                self.value(item)
+        elif isinstance(value, (list, tuple)):
+            out.append(_LIST)
+            self.column(list(value))
+        elif isinstance(value, np.ndarray) and _is_plain(value.dtype):
+            out.append(_ARRAY)
+            self._array(value)
+        elif isinstance(value, (np.ndarray, np.generic)):
+            self.value(value.tolist())
+        else:
+            # Dates, URLs, enums and others are stored as in JSON
+            self.value(pydantic_core.to_jsonable_python(value))
+
+    def column(self, values: List) -> None:
+        """Writes the values of a list, at once if they share their type"""
+
+        out = self.out
+        kinds = {type(value) for value in values}
+        kind = kinds.pop() if len(kinds) == 1 else None
+
+        if kind is float:
+            out.append(_FLOATS)
+            out += _U32.pack(len(values))
+            self._array(np.array(values, dtype=np.float64))
+        elif kind is int and _INT64_MIN <= min(values) and max(values) <= _INT64_MAX:
+            out.append(_INTS)
+            out += _U32.pack(len(values))
+            self._array(np.array(values, dtype=np.int64))
+        elif kind is bool:
+            out.append(_BOOLS)
+            out += _U32.pack(len(values))
+            self._array(np.array(values, dtype=np.bool_))
+        elif kind is str:
+            self._strings(values)
+        elif kind is list:
+            out.append(_LISTS)
+            out += _U32.pack(len(values))
+            self._array(np.array([len(value) for value in values], dtype=np.int64))
+            self.column([item for value in values for item in value])
+        elif kind is dict and _share_keys(values):
+            keys = list(values[0])
+            out.append(_RECORDS)
+            out += _U32.pack(len(values))
+            out += _U32.pack(len(keys))
+
+            for key in keys:
+                out += _U32.pack(self._key(key))
+
+            for key in keys:
+                self.column([value[key] for value in values])
+        else:
+            out.append(_VALUES)
+            out += _U32.pack(len(values))
+
+            for value in values:
+                self.value(value)
+
+    def _strings(self, values: List[str]) -> None:
+        """Writes strings as a single text, replacing repeated ones by codes"""
+
+        unique = dict.fromkeys(values)
+
+        if len(unique) * 2 > len(values):
+            self._text_column(values)
+            return
+
+        codes = {value: code for code, value in enumerate(unique)}
+
+        self.out.append(_CODES)
+        self.out += _U32.pack(len(values))
+        self._text_column(list(unique))
+        self._array(np.array([codes[value] for value in values], dtype=np.uint32))
+
+    def _text_column(self, values: List[str]) -> None:
+        offsets = list(accumulate((len(value) for value in values), initial=0))
+        blob = "".join(values).encode("utf-8", "surrogatepass")
+
+        self.out.append(_STRS)
+        self.out += _U32.pack(len(values))
+        self._array(np.array(offsets, dtype=np.int64))
+        self.out += _UINT64.pack(len(blob))
+        self.out += blob
+
+    def _text(self, text: str) -> None:
+        blob = text.encode("utf-8", "surrogatepass")
+        self.out += _U32.pack(len(blob))
+        self.out += blob
+
+    def _key(self, key: Any) -> int:
+        """Returns the index of a key in the key table, adding it upon first use"""
+
+        key = key if isinstance(key, str) else str(key)
+        index = self.keys.get(key)
+
+        if index is None:
+            index = self.keys[key] = len(self.keys)
+
+        return index
+
+    def _array(self, array: np.ndarray) -> None:
+        """Writes a reference to an array, whose buffer is appended to the document"""
+
+        self.out += _U32.pack(len(self.arrays))
+        self.arrays.append(np.ascontiguousarray(array))
+
+
+class _Decoder:
+    """Reads the tagged values written by '_Encoder'"""
+
+    def __init__(self, body: bytes, keys: List[str], arrays: List[np.ndarray]):
+        self.body = body
+        self.pos = 0
+        self.keys = keys
+        self.arrays = arrays
+
+    def value(self) -> Any:
+        body = self.body
+        tag = body[self.pos]
+        self.pos += 1
+
+        if tag == _MAP:
+            keys = self.keys
+            result = {}
+
+            for _ in range(self._count()):
+                key = keys[self._count()]
+                result[key] = self.value()
+
+            return result
+        elif tag == _STR:
+            return self._text()
+        elif tag == _LIST:
+            return self.column()
+        elif tag == _INT:
+            self.pos += _INT64.size
+            return _INT64.unpack_from(body, self.pos - _INT64.size)[0]
+        elif tag == _FLOAT:
+            self.pos += _FLOAT64.size
+            return _FLOAT64.unpack_from(body, self.pos - _FLOAT64.size)[0]
+        elif tag == _NONE:
+            return None
+        elif tag == _TRUE:
+            return True
+        elif tag == _FALSE:
+            return False
+        elif tag == _ARRAY:
+            return self.arrays[self._count()]
+        elif tag == _BIGINT:
+            return int(self._text())
+        elif tag == _BYTES:
+            size = self._count()
+            self.pos += size
+            return body[self.pos - size : self.pos]
+
+        raise ValueError(f"Unknown value tag '{chr(tag)}' in binary document.")
+
+    def column(self) -> List:
+        tag = self.body[self.pos]
+        self.pos += 1
+        count = self._count()
+
+        if tag in (_FLOATS, _INTS, _BOOLS):
+            return self.arrays[self._count()].tolist()
+        elif tag == _STRS:
+            offsets = self.arrays[self._count()].tolist()
+            size = _UINT64.unpack_from(self.body, self.pos)[0]
+            start = self.pos + _UINT64.size
+            self.pos = start + size
+
+            text = self.body[start : self.pos].decode("utf-8", "surrogatepass")
+
+            return [text[begin:end] for begin, end in zip(offsets, offsets[1:])]
+        elif tag == _CODES:
+            unique = self.column()
+            return [unique[code] for code in self.arrays[self._count()].tolist()]
+        elif tag == _LISTS:
+            ends = list(accumulate(self.arrays[self._count()].tolist()))
+            items = self.column()
+            return [items[begin:end] for begin, end in zip([0, *ends], ends)]
+        elif tag == _RECORDS:
+            keys = [self.keys[self._count()] for _ in range(self._count())]
+            columns = [self.column() for _ in keys]
+
+            if not keys:
+                return [{} for _ in range(count)]
+
+            return [dict(zip(keys, row)) for row in zip(*columns)]
+        elif tag == _VALUES:
+            return [self.value() for _ in range(count)]
+
+        raise ValueError(f"Unknown column tag '{chr(tag)}' in binary document.")
+
+    def _count(self) -> int:
+        self.pos += _U32.size
+        return _U32.unpack_from(self.body, self.pos - _U32.size)[0]
+
+    def _text(self) -> str:
+        size = self._count()
+        self.pos += size
+        return self.body[self.pos - size : self.pos].decode("utf-8", "surrogatepass")
+
+
+def _share_keys(values: List[Dict]) -> bool:
+    """Whether maps have the same keys in the same order"""
+
+    keys = tuple(values[0])
+
+    return all(tuple(value) == keys for value in values)
+
+
+def _read_sized(view: memoryview, pos: int) -> Tuple[bytes, int]:
+    """Reads a part of a document, which is prefixed by its size"""
+
+    size = _UINT64.unpack_from(view, pos)[0]
+    pos += _UINT64.size
+
+    return bytes(view[pos : pos + size]), pos + size
+
+
+def _is_plain(dtype: np.dtype) -> bool:
+    """Whether arrays of a dtype can be restored from their raw buffer"""
+
+    return not dtype.hasobject and dtype.fields is None
@@ -0,0 +1,93 @@
+import bz2
+import gzip
+import lzma
+import os
+
+from contextlib import contextmanager
+from typing import IO, Iterator, Optional, Tuple, Union
+
+# Openers of compressed files by their extension
+COMPRESSIONS = {
+    ".gz": gzip.open,
+    ".bz2": bz2.open,
+    ".xz": lzma.open,
+}
+
+PathLike = Union[str, os.PathLike]
+
+
+def split_compression(path: PathLike) -> Tuple[str, Optional[str]]:
+    """Splits the compression extension off a path, e.g. 'data.json.gz' into ('data.json', '.gz').
+
+    Args:
+        path (PathLike): Path to split.
+
+    Returns:
+        Tuple[str, Optional[str]]: Path without and the compression extension, if any.
+    """
+
+    path = os.fspath(path)
+    base, ext = os.path.splitext(path)
+
+    if ext.lower() in COMPRESSIONS:
+        return base, ext.lower()
+
+    return path, None
+
+
+def open_file(path: PathLike, mode: str = "r") -> IO:
+    """Opens a file, which is (de-)compressed on the fly if its extension is '.gz', '.bz2' or '.xz'.
+
+    Compressed files are read and written as streams, thus they are never
+    fully decompressed into memory. Text modes use UTF-8.
+
+    Args:
+        path (PathLike): Path of the file.
+        mode (str): Mode to open the file with, e.g. 'r', 'rb', 'w' or 'wb'. Defaults to 'r'.
+
+    Returns:
+        IO: The file handler.
+    """
+
+    _, compression = split_compression(path)
+    is_binary = "b" in mode
+
+    if compression is None:
+        return open(path, mode, encoding=None if is_binary else "utf-8")
+
+    opener = COMPRESSIONS[compression]
+
+    if is_binary:
+        return opener(path, mode)
+
+    # Compressed files are opened in binary mode by default
+    return opener(path, mode.replace("t", "") + "t", encoding="utf-8")
+
+
+def is_path(target) -> bool:
+    """Checks whether a target is a path rather than a file handler"""
+
+    return isinstance(target, (str, os.PathLike))
+
+
+def is_compressed(target) -> bool:
+    """Checks whether a target is the path of a compressed file"""
+
+    return is_path(target) and split_compression(target)[1] is not None
+
+
+@contextmanager
+def opened(target: Union[PathLike, IO], mode: str = "r") -> Iterator[IO]:
+    """Yields the file handler of a path, which is closed afterwards, or a given handler as is.
+
+    Args:
+        target (Union[PathLike, IO]): Path of the file or an open file handler.
+        mode (str): Mode to open paths with. Defaults to 'r'.
+    """
+
+    if not is_path(target):
+        yield target
+        return
+
+    with open_file(target, mode) as handler:
+        yield handler
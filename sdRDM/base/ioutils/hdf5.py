@@ -13,6 +13,7 @@ from h5py._hl.group import Group as H5Group
 import h5py
 
 from sdRDM.base.listplus import ListPlus
+from sdRDM.base.walker import walk
 
 
 def write_hdf5(dataset, file: Union[H5File, str]):
@@ -28,14 +29,10 @@ def write_hdf5(dataset, file: Union[H5File, str]):
 
     _write_source(dataset, file)
 
-    for path in dataset.paths(leaves=True):
-        if "__source__" in path:
-            continue
-
-        # Fetch data and destination
-        data = dataset.get(path)
-        prefix, attribute = path.split()
-        prefix = str(prefix)
+    for path, _, attribute, data in walk(dataset, leaves=True):
+        # Fetch destination
+        prefix = os.path.dirname(path)
+        attribute = str(attribute)
         is_array = isinstance(data, (np.ndarray, H5Dataset))
 
         if isinstance(data, (list, ListPlus)):
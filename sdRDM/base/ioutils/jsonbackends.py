@@ -0,0 +1,189 @@
+import json
+
+import numpy as np
+import pydantic_core
+
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, List, Optional, Union
+
+# Name of the backend used when none is given
+DEFAULT_BACKEND = "stdlib"
+
+
+class JSONBackend(ABC):
+    """Serializes exported data to JSON and parses JSON documents.
+
+    Backends operate on the output of `DataModel.to_dict` and are selected
+    by name, either per call or globally via `set_json_backend`. New backends
+    are added via `register_json_backend`.
+
+    All backends produce the same JSON values, but may differ in key order
+    and whitespace. Thus, checksums of exported documents are only stable
+    for a given backend.
+    """
+
+    name: str = ""
+
+    @abstractmethod
+    def dumps(self, data: Any, indent: Optional[int] = 2) -> str:
+        """Serializes data to a JSON string.
+
+        Args:
+            data (Any): Data to serialize.
+            indent (Optional[int]): Number of spaces to indent with. Writes a single line, if None.
+
+        Returns:
+            str: The JSON string.
+        """
+
+    @abstractmethod
+    def loads(self, content: Union[str, bytes]) -> Any:
+        """Parses a JSON document.
+
+        Args:
+            content (Union[str, bytes]): JSON document to parse.
+
+        Returns:
+            Any: The parsed data.
+        """
+
+
+class StdlibBackend(JSONBackend):
+    """Python's json module. Keys are sorted and non-ASCII characters escaped."""
+
+    name = "stdlib"
+
+    def dumps(self, data: Any, indent: Optional[int] = 2) -> str:
+        return json.dumps(
+            data,
+            indent=indent,
+            default=_to_jsonable,
+            sort_keys=True,
+        )
+
+    def loads(self, content: Union[str, bytes]) -> Any:
+        return json.loads(content)
+
+
+class OrjsonBackend(JSONBackend):
+    """The 'orjson' library. Keys are sorted and arrays are serialized natively."""
+
+    name = "orjson"
+
+    def __init__(self):
+        try:
+            import orjson
+        except ImportError:
+            raise ImportError(
+                "orjson is not installed. Please install it via 'pip install orjson'"
+            )
+
+        self._orjson = orjson
+
+    def dumps(self, data: Any, indent: Optional[int] = 2) -> str:
+        if indent not in (None, 2):
+            raise ValueError(
+                f"The 'orjson' backend only supports an indent of 2 or None, got '{indent}'."
+            )
+
+        option = self._orjson.OPT_SORT_KEYS | self._orjson.OPT_SERIALIZE_NUMPY
+
+        if indent is not None:
+            option |= self._orjson.OPT_INDENT_2
+
+        return self._orjson.dumps(data, option=option, default=_to_jsonable).decode()
+
+    def loads(self, content: Union[str, bytes]) -> Any:
+        return self._orjson.loads(content)
+
+
+class PydanticBackend(JSONBackend):
+    """The JSON implementation of pydantic-core.
+
+    Unlike the other backends, keys are not sorted but kept in export order,
+    since sorting would require a pass over the data in Python. Documents
+    are thus equal in content, but not byte-identical to the default output.
+    """
+
+    name = "pydantic"
+
+    def dumps(self, data: Any, indent: Optional[int] = 2) -> str:
+        return pydantic_core.to_json(data, indent=indent, fallback=_to_jsonable).decode()
+
+    def loads(self, content: Union[str, bytes]) -> Any:
+        return pydantic_core.from_json(content)
+
+
+_FACTORIES: Dict[str, Callable[[], JSONBackend]] = {
+    StdlibBackend.name: StdlibBackend,
+    OrjsonBackend.name: OrjsonBackend,
+    PydanticBackend.name: PydanticBackend,
+}
+_INSTANCES: Dict[str, JSONBackend] = {}
+_default_backend = DEFAULT_BACKEND
+
+
+def register_json_backend(name: str, factory: Callable[[], JSONBackend]) -> None:
+    """Registers a JSON backend under the given name.
+
+    Args:
+        name (str): Name to select the backend by.
+        factory (Callable[[], JSONBackend]): Class or function creating the backend upon first use.
+    """
+
+    _FACTORIES[name] = factory
+    _INSTANCES.pop(name, None)
+
+
+def get_json_backend(name: Optional[str] = None) -> JSONBackend:
+    """Returns a JSON backend by name or the global default, if no name is given.
+
+    Args:
+        name (Optional[str]): Name of the backend.
+
+    Returns:
+        JSONBackend: The selected backend.
+    """
+
+    if name is None:
+        name = _default_backend
+
+    if name not in _INSTANCES:
+        if name not in _FACTORIES:
+            raise ValueError(
+                f"JSON backend '{name}' is unknown. Available backends are: {', '.join(_FACTORIES)}"
+            )
+
+        _INSTANCES[name] = _FACTORIES[name]()
+
+    return _INSTANCES[name]
+
+
+def set_json_backend(name: str) -> None:
+    """Sets the JSON backend that is used by default.
+
+    Args:
+        name (str): Name of the backend.
+    """
+
+    global _default_backend
+
+    # Fails early, if the backend is unknown or not installed
+    get_json_backend(name)
+
+    _default_backend = name
+
+
+def json_backends() -> List[str]:
+    """Returns the names of all registered JSON backends"""
+
+    return list(_FACTORIES)
+
+
+def _to_jsonable(value: Any) -> Any:
+    """Fallback for values that are not natively supported by a backend"""
+
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+
+    return str(value)
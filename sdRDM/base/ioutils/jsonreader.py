@@ -0,0 +1,442 @@
+import codecs
+import hashlib
+import json
+import re
+
+from typing import IO, Any, Iterator, List, Optional, Union
+
+from sdRDM.base.ioutils.compression import PathLike, opened
+from sdRDM.base.ioutils.sidecar import resolve_sidecars
+from sdRDM.base.trusted import select_type
+
+# Number of characters that are read from the file handler at once
+CHUNK_SIZE = 1 << 16
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_STRUCTURE = re.compile(r'[\[\]{}"]')
+_STRING_END = re.compile(r'["\\]')
+_NUMBER_TAIL = re.compile(r"[0-9.eE+\-]*")
+
+
+def load_json(
+    cls,
+    handler: IO,
+    trusted: bool = False,
+    checksum: Optional[str] = None,
+    chunk_size: int = CHUNK_SIZE,
+    sidecar_dir: Optional[str] = None,
+) -> "DataModel":
+    """Reads an object from a JSON file, validating sub-objects as they complete.
+
+    The document is parsed incrementally and each element of a list of objects
+    is turned into an object as soon as it has been read. Thus, only the
+    element that is currently parsed is held as raw data in addition to the
+    objects that have been created so far.
+
+    Args:
+        cls (Type[DataModel]): Class of the root object.
+        handler (IO): Text or binary file handler to read from.
+        trusted (bool): Whether sub-objects are constructed without validation.
+        checksum (Optional[str]): Expected SHA-256 hex digest of the content.
+        chunk_size (int): Number of characters that are read at once.
+        sidecar_dir (Optional[str]): Directory referenced sidecar files are stored in.
+
+    Returns:
+        DataModel: The root object.
+    """
+
+    lexer = _JSONLexer(handler, chunk_size, checksum is not None, sidecar_dir)
+    obj = _read_object(lexer, cls, trusted)
+
+    if checksum is not None:
+        lexer.verify(checksum)
+
+    return obj
+
+
+def iter_json(
+    cls,
+    handler: Union[IO, PathLike],
+    path: str,
+    trusted: bool = False,
+    chunk_size: int = CHUNK_SIZE,
+    sidecar_dir: Optional[str] = None,
+) -> Iterator[Any]:
+    """Yields the values found at a meta path of a JSON file one after another.
+
+    Everything that is not part of the path is skipped without being parsed,
+    thus files larger than the available memory can be processed. Lists along
+    the path are traversed, such that e.g. 'measurements/species' yields the
+    species of all measurements.
+
+    Args:
+        cls (Type[DataModel]): Class of the root object.
+        handler (Union[IO, PathLike]): Text or binary file handler or path of a (compressed) file to read from.
+        path (str): Meta path of the attribute, separated by '/'.
+        trusted (bool): Whether objects are constructed without validation.
+        chunk_size (int): Number of characters that are read at once.
+        sidecar_dir (Optional[str]): Directory referenced sidecar files are stored in.
+
+    Returns:
+        Iterator[Any]: Objects or values found at the path.
+    """
+
+    segments = [segment for segment in path.strip("/").split("/") if segment]
+
+    if not segments:
+        raise ValueError("Path must point to an attribute of the root object.")
+
+    with opened(handler, "rb") as file:
+        lexer = _JSONLexer(file, chunk_size, sidecar_dir=sidecar_dir)
+
+        yield from _iter_path(lexer, cls, segments, trusted)
+
+
+def _read_object(lexer: "_JSONLexer", cls, trusted: bool) -> "DataModel":
+    """Reads an object, whose directly nested objects are read recursively"""
+
+    table = cls._get_field_table()
+    data = {}
+
+    for key in lexer.iter_keys():
+        name = table.names.get(key)
+        char = lexer.peek()
+
+        if name not in table.object_fields or char not in "[{":
+            data[key] = lexer.read_value()
+            continue
+
+        dtypes = _candidates(table.types[name])
+
+        if char == "[":
+            data[key] = [
+                _build(dtypes, lexer.read_value(), trusted)
+                for _ in lexer.iter_items()
+            ]
+        elif len(dtypes) == 1:
+            data[key] = _read_object(lexer, dtypes[0], trusted)
+        else:
+            # The class is determined by the '@type' of the complete object
+            data[key] = _build(dtypes, lexer.read_value(), trusted)
+
+    return cls.from_dict(data, trusted=trusted)
+
+
+def _iter_path(
+    lexer: "_JSONLexer",
+    cls,
+    segments: List[str],
+    trusted: bool,
+) -> Iterator[Any]:
+    """Walks an object along the path and skips all other attributes"""
+
+    table = cls._get_field_table()
+    segment, *rest = segments
+
+    if segment not in table.names:
+        raise ValueError(f"'{cls.__name__}' has no attribute '{segment}'.")
+
+    for key in lexer.iter_keys():
+        if table.names.get(key) != table.names[segment]:
+            lexer.skip_value()
+            continue
+
+        dtypes = _candidates(table.types.get(table.names[segment]))
+        is_list = lexer.peek() == "["
+
+        if not rest:
+            values = (
+                (lexer.read_value() for _ in lexer.iter_items())
+                if is_list
+                else [lexer.read_value()]
+            )
+
+            for value in values:
+                if value is not None:
+                    yield _build(dtypes, value, trusted)
+
+            continue
+
+        dtype = next(
+            (dtype for dtype in dtypes if rest[0] in dtype._get_field_table().names),
+            None,
+        )
+
+        if dtype is None:
+            raise ValueError(
+                f"Attribute '{segment}' of '{cls.__name__}' has no sub-attribute '{rest[0]}'."
+            )
+
+        if is_list:
+            for _ in lexer.iter_items():
+                if lexer.peek() == "{":
+                    yield from _iter_path(lexer, dtype, rest, trusted)
+                else:
+                    lexer.skip_value()
+        elif lexer.peek() == "{":
+            yield from _iter_path(lexer, dtype, rest, trusted)
+        else:
+            lexer.skip_value()
+
+
+def _build(dtypes: tuple, value: Any, trusted: bool) -> Any:
+    """Turns a parsed value into an object, if it represents one"""
+
+    if not isinstance(value, dict) or not dtypes:
+        return value
+
+    return select_type(dtypes, value).from_dict(value, trusted=trusted)
+
+
+def _candidates(dtypes) -> tuple:
+    if not dtypes:
+        return ()
+    elif isinstance(dtypes, tuple):
+        return dtypes
+
+    return (dtypes,)
+
+
+class _JSONLexer:
+    """Reads JSON values from a file handler, holding only a window of the document.
+
+    Complete values are parsed by the stdlib decoder, while containers can be
+    entered key by key or item by item and skipped without being parsed.
+    """
+
+    def __init__(
+        self,
+        handler: IO,
+        chunk_size: int,
+        hash_content: bool = False,
+        sidecar_dir: Optional[str] = None,
+    ):
+        self.handler = handler
+        self.sidecar_dir = sidecar_dir
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+        self.hasher = hashlib.sha256() if hash_content else None
+        self.text_decoder = codecs.getincrementaldecoder("utf-8")()
+
+    # ! Reading
+    def _fill(self, size: Optional[int] = None) -> bool:
+        """Appends the next chunk to the buffer.
+
+        The part that has been read is only dropped once it spans at least a
+        chunk, such that values spanning many chunks are not copied twice per
+        chunk while they are being read.
+        """
+
+        if self.eof:
+            return False
+
+        size = size or self.chunk_size
+        chunk = self.handler.read(size)
+
+        if isinstance(chunk, bytes):
+            chunk = self._decode(chunk, size)
+        elif self.hasher is not None:
+            self.hasher.update(chunk.encode("utf-8"))
+
+        if not chunk:
+            self.eof = True
+            return False
+
+        if self.pos >= self.chunk_size:
+            self.buffer = self.buffer[self.pos :] + chunk
+            self.pos = 0
+        else:
+            self.buffer += chunk
+
+        return True
+
+    def _decode(self, raw: bytes, size: int) -> str:
+        """Decodes bytes, reading on while a chunk ends within a multi-byte character"""
+
+        while True:
+            if self.hasher is not None:
+                self.hasher.update(raw)
+
+            text = self.text_decoder.decode(raw, final=not raw)
+
+            if text or not raw:
+                return text
+
+            raw = self.handler.read(size)
+
+    def peek(self) -> str:
+        """Returns the next character that is not whitespace or '' at the end"""
+
+        while True:
+            self.pos = _WHITESPACE.match(self.buffer, self.pos).end()
+
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            elif not self._fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        found = self.peek()
+
+        if found != char:
+            raise ValueError(
+                f"Expected '{char}' but found '{found or 'end of document'}' in JSON document."
+            )
+
+        self.pos += 1
+
+    def read_value(self) -> Any:
+        """Parses the next complete value and resolves contained sidecar references"""
+
+        value = self._decode_value()
+
+        if isinstance(value, (dict, list)):
+            return resolve_sidecars(value, self.sidecar_dir)
+
+        return value
+
+    def _decode_value(self) -> Any:
+        self.peek()
+        size = self.chunk_size
+
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if not self._fill(size):
+                    raise
+
+                # Grows reads for large values to avoid re-parsing them too often
+                size *= 2
+                continue
+
+            tail = _NUMBER_TAIL.match(self.buffer, end).end()
+
+            if tail == len(self.buffer) and self._fill(size):
+                # Numbers may continue in the next chunk
+                continue
+
+            self.pos = end
+
+            return value
+
+    def skip_value(self) -> None:
+        """Moves past the next value without parsing it"""
+
+        if self.peek() not in "[{":
+            self.read_value()
+            return
+
+        depth = 0
+        in_string = False
+        index = self.pos
+
+        while True:
+            if in_string:
+                match = _STRING_END.search(self.buffer, index)
+
+                if match is None:
+                    index = len(self.buffer)
+                elif match.group() == '"':
+                    in_string = False
+                    index = match.end()
+                    continue
+                elif match.end() < len(self.buffer):
+                    # Skips the escaped character
+                    index = match.end() + 1
+                    continue
+                else:
+                    index = match.start()
+            else:
+                match = _STRUCTURE.search(self.buffer, index)
+
+                if match is None:
+                    index = len(self.buffer)
+                else:
+                    char = match.group()
+                    index = match.end()
+
+                    if char == '"':
+                        in_string = True
+                    elif char in "[{":
+                        depth += 1
+                    else:
+                        depth -= 1
+
+                        if depth == 0:
+                            self.pos = index
+                            return
+
+                    continue
+
+            self.pos = index
+
+            if not self._fill():
+                raise ValueError("Unexpected end of JSON document.")
+
+            index = self.pos
+
+    # ! Containers
+    def iter_keys(self) -> Iterator[str]:
+        """Enters an object and yields its keys, after each the value has to be consumed"""
+
+        self.expect("{")
+
+        if self.peek() == "}":
+            self.pos += 1
+            return
+
+        while True:
+            key = self.read_value()
+            self.expect(":")
+
+            yield key
+
+            char = self.peek()
+            self.pos += 1
+
+            if char == "}":
+                return
+            elif char != ",":
+                raise ValueError(
+                    f"Expected ',' or '}}' but found '{char or 'end of document'}' in JSON document."
+                )
+
+    def iter_items(self) -> Iterator[None]:
+        """Enters a list and yields once per item, which has to be consumed in turn"""
+
+        self.expect("[")
+
+        if self.peek() == "]":
+            self.pos += 1
+            return
+
+        while True:
+            yield
+
+            char = self.peek()
+            self.pos += 1
+
+            if char == "]":
+                return
+            elif char != ",":
+                raise ValueError(
+                    f"Expected ',' or ']' but found '{char or 'end of document'}' in JSON document."
+                )
+
+    # ! Checksum
+    def verify(self, checksum: str) -> None:
+        """Reads the remaining content and compares its digest to the checksum"""
+
+        while self._fill():
+            self.pos = len(self.buffer)
+
+        given = self.hasher.hexdigest()
+
+        if given != checksum.lower():
+            raise ValueError(
+                f"Checksum mismatch: Expected '{checksum}', but content has '{given}'."
+            )
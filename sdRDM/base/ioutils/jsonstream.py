@@ -0,0 +1,269 @@
+import io
+import json
+
+import numpy as np
+
+from typing import IO, Any, Dict, List, Optional
+
+from sdRDM.base.ioutils.jsonbackends import _to_jsonable
+
+# Number of characters that are collected before they are written
+BUFFER_SIZE = 1 << 16
+
+
+def dump_json(
+    obj: "DataModel",
+    handler: IO,
+    indent: Optional[int] = 2,
+    exclude_none: bool = True,
+    mode: str = "json",
+    chunk_size: int = 1 << 16,
+) -> None:
+    """Writes an object to a file handler as JSON without building the document in memory.
+
+    The object tree is walked and each object is exported on its own, thus
+    only a single object and the write buffer are held at a time. Arrays are
+    written in chunks of 'chunk_size' elements. The output is identical to
+    `DataModel.json` with the 'stdlib' backend and the same options.
+
+    Args:
+        obj (DataModel): Object to write.
+        handler (IO): Text or binary file handler to write to.
+        indent (Optional[int]): Indentation of the JSON document. Defaults to 2.
+        exclude_none (bool): Whether to exclude unset values. Defaults to True.
+        mode (str): Serialization mode passed to 'model_dump'. Defaults to 'json'.
+        chunk_size (int): Number of array elements that are converted at once.
+    """
+
+    writer = _JSONStreamWriter(handler, indent, chunk_size)
+    writer.write_object(obj, 0, exclude_none, mode, prune=True)
+    writer.flush()
+
+
+class _Deferred:
+    """Marks a value holding objects, which are written by the streaming writer"""
+
+    def __init__(self, value: Any):
+        self.value = value
+
+
+class _JSONStreamWriter:
+    """Writes JSON tokens in the same format as 'json.dumps(..., sort_keys=True)'"""
+
+    def __init__(self, handler: IO, indent: Optional[int], chunk_size: int):
+        self.handler = handler
+        self.indent = indent
+        self.chunk_size = chunk_size
+        self.encoder = json.JSONEncoder(
+            indent=indent,
+            sort_keys=True,
+            default=_to_jsonable,
+        )
+        self.is_binary = isinstance(handler, (io.RawIOBase, io.BufferedIOBase))
+        self.item_separator = "," if indent is not None else ", "
+        self.buffer: List[str] = []
+        self.buffered = 0
+
+    # ! Objects
+    def write_object(
+        self,
+        obj: "DataModel",
+        level: int,
+        exclude_none: bool,
+        mode: str,
+        prune: bool,
+    ) -> None:
+        """Writes an object, whose sub-objects are written one after another.
+
+        Mirroring 'to_dict', objects that are directly nested are pruned from
+        empty dictionaries, while objects within lists are exported as they are.
+        """
+
+        deferred = self._get_deferred_fields(obj)
+        data = obj.model_dump(
+            exclude_none=exclude_none,
+            by_alias=True,
+            mode=mode,
+            exclude=set(deferred),
+        )
+
+        if prune:
+            data = obj._prune_dict(data, exclude_none, True)[0]
+
+        for name, value in deferred.items():
+            data[obj.model_fields[name].alias or name] = _Deferred(value)
+
+        self._write_dict(
+            data,
+            level,
+            lambda value, level: self._write_deferred(
+                value, level, exclude_none, mode, prune
+            ),
+        )
+
+    def _write_deferred(self, value, level, exclude_none, mode, prune) -> None:
+        """Writes the objects of a deferred field"""
+
+        if not isinstance(value, list):
+            self.write_object(value, level, exclude_none, mode, prune)
+            return
+
+        # Objects within lists are not pruned by 'to_dict'
+        self._write_sequence(
+            value,
+            level,
+            lambda element, level: self.write_object(
+                element, level, exclude_none, mode, prune=False
+            ),
+        )
+
+    @staticmethod
+    def _get_deferred_fields(obj: "DataModel") -> Dict[str, Any]:
+        """Returns fields holding objects that are exported as their declared type"""
+
+        table = obj._get_field_table()
+        deferred = {}
+
+        for name in table.object_fields:
+            value = obj.__dict__.get(name)
+            dtypes = table.types[name]
+            dtypes = dtypes if isinstance(dtypes, tuple) else (dtypes,)
+
+            if value is None:
+                continue
+            elif isinstance(value, list):
+                if value and all(type(element) in dtypes for element in value):
+                    deferred[name] = value
+            elif type(value) in dtypes:
+                deferred[name] = value
+
+        return deferred
+
+    # ! Values
+    def write_value(self, value: Any, level: int) -> None:
+        """Writes any exported value"""
+
+        if isinstance(value, np.ndarray):
+            self._write_array(value, level)
+        elif isinstance(value, dict):
+            self._write_dict(value, level, self.write_value)
+        elif isinstance(value, (list, tuple)):
+            self._write_sequence(value, level, self.write_value)
+        else:
+            self._write_leaf(value, level)
+
+    def _write_dict(self, data: Dict, level: int, write_deferred) -> None:
+        if not data:
+            self.write("{}")
+            return
+
+        self.write("{")
+
+        for index, key in enumerate(sorted(data)):
+            if index > 0:
+                self.write(self.item_separator)
+
+            self.write(self._newline(level + 1))
+            self.write(self.encoder.encode(self._key(key)))
+            self.write(": ")
+
+            value = data[key]
+
+            if isinstance(value, _Deferred):
+                write_deferred(value.value, level + 1)
+            else:
+                self.write_value(value, level + 1)
+
+        self.write(self._newline(level))
+        self.write("}")
+
+    def _write_sequence(self, values, level: int, write_element) -> None:
+        if len(values) == 0:
+            self.write("[]")
+            return
+
+        self.write("[")
+
+        for index, element in enumerate(values):
+            if index > 0:
+                self.write(self.item_separator)
+
+            self.write(self._newline(level + 1))
+            write_element(element, level + 1)
+
+        self.write(self._newline(level))
+        self.write("]")
+
+    def _write_array(self, array: np.ndarray, level: int) -> None:
+        """Writes an array chunk by chunk, such that it is never converted as a whole"""
+
+        if array.ndim == 0:
+            self._write_leaf(array.item(), level)
+            return
+        elif array.ndim > 1:
+            self._write_sequence(array, level, self._write_array)
+            return
+        elif array.size == 0:
+            self.write("[]")
+            return
+
+        self.write("[")
+
+        for start in range(0, array.size, self.chunk_size):
+            for index, element in enumerate(array[start : start + self.chunk_size].tolist()):
+                if start + index > 0:
+                    self.write(self.item_separator)
+
+                self.write(self._newline(level + 1))
+                self._write_leaf(element, level + 1)
+
+        self.write(self._newline(level))
+        self.write("]")
+
+    def _write_leaf(self, value: Any, level: int) -> None:
+        encoded = self.encoder.encode(value)
+
+        if self.indent is not None and "\n" in encoded:
+            # Encoded strings never contain raw line breaks
+            encoded = encoded.replace("\n", self._newline(level))
+
+        self.write(encoded)
+
+    def _key(self, key: Any) -> str:
+        """Converts a key analogous to the json module"""
+
+        if isinstance(key, str):
+            return key
+        elif key is True:
+            return "true"
+        elif key is False:
+            return "false"
+        elif key is None:
+            return "null"
+
+        return self.encoder.encode(key)
+
+    def _newline(self, level: int) -> str:
+        if self.indent is None:
+            return ""
+
+        return "\n" + " " * (self.indent * level)
+
+    # ! Output
+    def write(self, token: str) -> None:
+        self.buffer.append(token)
+        self.buffered += len(token)
+
+        if self.buffered >= BUFFER_SIZE:
+            self.flush()
+
+    def flush(self) -> None:
+        content = "".join(self.buffer)
+
+        if self.is_binary:
+            self.handler.write(content.encode("utf-8"))
+        else:
+            self.handler.write(content)
+
+        self.buffer = []
+        self.buffered = 0
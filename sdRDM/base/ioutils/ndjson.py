@@ -0,0 +1,221 @@
+import io
+
+from typing import IO, Dict, Iterator, List, Optional, Tuple
+
+from sdRDM.base.ioutils.jsonbackends import get_json_backend
+from sdRDM.base.trusted import select_type
+
+# Keys of each record that locate it within the data model
+PARENT_KEY = "__parent__"
+PATH_KEY = "__path__"
+
+
+def dump_ndjson(
+    obj: "DataModel",
+    handler: IO,
+    path: str,
+    backend: Optional[str] = None,
+    **kwargs,
+) -> int:
+    """Writes each object of a list field as a single JSON line.
+
+    Besides the exported object, each record holds the meta path of the list
+    and the position of the object the list belongs to among all objects at
+    the meta path of the parent, in document order. Records can thus be split
+    and processed independently and reassembled via `load_ndjson`.
+
+    Args:
+        obj (DataModel): Root object.
+        handler (IO): Text or binary file handler to write to.
+        path (str): Meta path of the list field, e.g. 'measurements' or 'measurements/species'.
+        backend (Optional[str]): Name of the JSON backend used to serialize records.
+        **kwargs: Keyword arguments passed to 'to_dict'.
+
+    Returns:
+        int: Number of written records.
+    """
+
+    segments, _ = _resolve_path(obj.__class__, path)
+    backend = get_json_backend(backend)
+    is_binary = isinstance(handler, (io.RawIOBase, io.BufferedIOBase))
+    meta_path = "/".join(segments)
+    count = 0
+
+    for position, parent in enumerate(_iter_parents(obj, segments[:-1])):
+        for element in getattr(parent, segments[-1]):
+            record = element.to_dict(**kwargs)
+            record[PARENT_KEY] = position
+            record[PATH_KEY] = meta_path
+
+            line = backend.dumps(record, indent=None) + "\n"
+            handler.write(line.encode("utf-8") if is_binary else line)
+            count += 1
+
+    return count
+
+
+def load_ndjson(
+    cls,
+    handler: IO,
+    obj: Optional["DataModel"] = None,
+    trusted: bool = False,
+    batch_size: int = 1000,
+    backend: Optional[str] = None,
+) -> "DataModel":
+    """Appends the records of an NDJSON file to the lists they have been exported from.
+
+    Records are turned into objects line by line and appended in batches,
+    such that the model is updated once per batch instead of once per
+    record. Parents of nested lists are found by their meta path and
+    position, thus they have to be loaded in the same order as exported.
+
+    Args:
+        cls (Type[DataModel]): Class of the root object.
+        handler (IO): Text or binary file handler to read from.
+        obj (Optional[DataModel]): Root object to append to. A new one is created if not given, which requires the class to have no required fields.
+        trusted (bool): Whether records are constructed without validation.
+        batch_size (int): Number of records that are appended at once.
+        backend (Optional[str]): Name of the JSON backend used to parse records.
+
+    Returns:
+        DataModel: The root object.
+    """
+
+    if obj is None:
+        required = [
+            name for name, field in cls.model_fields.items() if field.is_required()
+        ]
+
+        if required:
+            raise ValueError(
+                f"'{cls.__name__}' requires the fields {required}, thus the root object to append to has to be given."
+            )
+
+        obj = cls()
+
+    backend = get_json_backend(backend)
+    loader = _RecordLoader(obj, trusted, batch_size)
+
+    for line in handler:
+        if line.strip():
+            loader.add(backend.loads(line))
+
+    loader.flush()
+
+    return obj
+
+
+class _RecordLoader:
+    """Collects records per target list and appends them in batches"""
+
+    def __init__(self, root: "DataModel", trusted: bool, batch_size: int):
+        self.root = root
+        self.trusted = trusted
+        self.batch_size = batch_size
+        self.batches: Dict[Tuple[int, str], Tuple["DataModel", str, List]] = {}
+        self.parents: Dict[str, List["DataModel"]] = {}
+        self.paths: Dict[str, Tuple[List[str], Tuple]] = {}
+
+    def add(self, record: Dict) -> None:
+        meta_path = record.pop(PATH_KEY, None)
+        position = record.pop(PARENT_KEY, 0)
+
+        if meta_path is None:
+            raise ValueError(f"Record is missing the '{PATH_KEY}' key.")
+
+        segments, dtypes = self._resolve_path(meta_path)
+        parent = self._find_parent(segments[:-1], position)
+        element = select_type(dtypes, record).from_dict(record, trusted=self.trusted)
+
+        key = (id(parent), segments[-1])
+
+        if key not in self.batches:
+            self.batches[key] = (parent, segments[-1], [])
+
+        batch = self.batches[key][2]
+        batch.append(element)
+
+        if len(batch) >= self.batch_size:
+            self._append(key)
+
+    def flush(self) -> None:
+        for key in list(self.batches):
+            self._append(key)
+
+    def _append(self, key: Tuple[int, str]) -> None:
+        parent, attribute, batch = self.batches.pop(key)
+
+        if batch:
+            getattr(parent, attribute).extend(batch)
+
+    def _resolve_path(self, meta_path: str) -> Tuple[List[str], Tuple]:
+        if meta_path not in self.paths:
+            self.paths[meta_path] = _resolve_path(self.root.__class__, meta_path)
+
+        return self.paths[meta_path]
+
+    def _find_parent(self, segments: List[str], position: int):
+        if not segments:
+            return self.root
+
+        meta_path = "/".join(segments)
+
+        if not isinstance(position, int) or position < 0:
+            raise ValueError(f"Record has an invalid '{PARENT_KEY}' position '{position}'.")
+
+        if position >= len(self.parents.get(meta_path, [])):
+            # Parents may have been appended by previous batches
+            self.flush()
+            self.parents[meta_path] = list(_iter_parents(self.root, segments))
+
+        try:
+            return self.parents[meta_path][position]
+        except IndexError:
+            raise ValueError(f"No object found at position {position} of '{meta_path}'.")
+
+
+def _resolve_path(cls, path: str) -> Tuple[List[str], Tuple]:
+    """Returns the field names along a meta path to a list of objects and their classes"""
+
+    segments = [segment for segment in path.strip("/").split("/") if segment]
+    names = []
+
+    if not segments:
+        raise ValueError("Path must point to a list of objects.")
+
+    for index, segment in enumerate(segments):
+        table = cls._get_field_table()
+        name = table.names.get(segment)
+
+        if name not in table.object_fields:
+            raise ValueError(f"'{segment}' of '{cls.__name__}' does not hold objects.")
+        elif index == len(segments) - 1 and name not in table.multiple_fields:
+            raise ValueError(f"'{segment}' of '{cls.__name__}' is not a list of objects.")
+
+        dtypes = table.types[name]
+        dtypes = dtypes if isinstance(dtypes, tuple) else (dtypes,)
+        cls = dtypes[0]
+        names.append(name)
+
+    return names, dtypes
+
+
+def _iter_parents(obj: "DataModel", segments: List[str]) -> Iterator["DataModel"]:
+    """Yields all objects found at a meta path of field names"""
+
+    objects = [obj]
+
+    for segment in segments:
+        found = []
+
+        for parent in objects:
+            value = getattr(parent, segment)
+
+            if isinstance(value, list):
+                found.extend(value)
+            elif value is not None:
+                found.append(value)
+
+        objects = found
+
+    yield from objects
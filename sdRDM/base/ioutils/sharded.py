@@ -0,0 +1,378 @@
+import bisect
+import functools
+import json
+import os
+import weakref
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from sdRDM.base.ioutils.binary import decode_binary, encode_binary, source_info
+from sdRDM.base.ioutils.jsonbackends import get_json_backend
+from sdRDM.base.listplus import ListPlus
+from sdRDM.base.trusted import check_source, select_type
+
+# Name of the file describing a sharded dataset
+MANIFEST = "manifest.json"
+
+# File extension per shard format
+SHARD_FORMATS = {"json": ".json", "binary": ".sdrb"}
+
+# Roots opened via 'open_sharded', whose shards may not have been read yet
+_PENDING_ROOTS: Dict[int, weakref.ref] = {}
+
+
+def write_sharded(
+    obj: "DataModel",
+    directory: str,
+    shard_size: int = 1000,
+    format: str = "json",
+    fields: Optional[Sequence[str]] = None,
+    processes: Optional[int] = None,
+) -> Dict:
+    """Writes an object to a directory, splitting its list fields into shards.
+
+    The manifest holds the remaining attributes of the object, its source
+    and an index of all shards. Each list field of the root is split into
+    shards of 'shard_size' objects, which are written to a sub-directory
+    named after the field. HDF5 is not supported as a shard format, since
+    objects can't be restored from it. Arrays are instead kept as raw
+    buffers by the binary format.
+
+    Args:
+        obj (DataModel): Root object to write.
+        directory (str): Directory to write to, which is created if necessary.
+        shard_size (int): Maximum number of objects per shard. Defaults to 1000.
+        format (str): Format of the shards, either 'json' or 'binary'. Defaults to 'json'.
+        fields (Optional[Sequence[str]]): Lists of objects to shard. Defaults to all of the root.
+        processes (Optional[int]): Number of processes writing shards in parallel. Defaults to writing sequentially.
+
+    Returns:
+        Dict: The manifest.
+    """
+
+    if format not in SHARD_FORMATS:
+        raise ValueError(
+            f"Shard format '{format}' is unknown. Available formats are: {', '.join(SHARD_FORMATS)}"
+        )
+    elif shard_size < 1:
+        raise ValueError(f"Shard size has to be positive, got '{shard_size}'.")
+
+    table = obj._get_field_table()
+
+    if fields is None:
+        fields = [
+            name for name in table.object_fields if name in table.multiple_fields
+        ]
+
+    tasks = []
+    shards = {}
+
+    for name in fields:
+        if name not in table.object_fields or name not in table.multiple_fields:
+            raise ValueError(f"'{name}' of '{obj.__class__.__name__}' is not a list of objects.")
+
+        elements = list(getattr(obj, name))
+        files, counts = [], []
+
+        os.makedirs(os.path.join(directory, name), exist_ok=True)
+
+        for index, start in enumerate(range(0, len(elements), shard_size)):
+            path = f"{name}/{index:05d}{SHARD_FORMATS[format]}"
+            chunk = elements[start : start + shard_size]
+
+            files.append(path)
+            counts.append(len(chunk))
+            tasks.append((os.path.join(directory, path), format, chunk))
+
+        shards[name] = {"format": format, "files": files, "counts": counts}
+
+    manifest = {
+        "__source__": source_info(obj),
+        "root": obj.to_dict(exclude=set(fields)),
+        "shards": shards,
+    }
+
+    if processes is not None and processes > 1:
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            list(pool.map(_write_shard, *zip(*tasks)))
+    else:
+        for task in tasks:
+            _write_shard(*task)
+
+    # The manifest is written last, such that incomplete datasets can't be opened
+    with open(os.path.join(directory, MANIFEST), "w") as handler:
+        handler.write(get_json_backend("stdlib").dumps(manifest, indent=2))
+
+    return manifest
+
+
+def open_sharded(cls, directory: str, trusted: bool = False) -> "DataModel":
+    """Opens a sharded dataset, whose shards are read once their list is accessed.
+
+    Indexing a list only reads the shard holding the requested object, while
+    any other access reads all shards of the list. Exporting the object reads
+    all shards.
+
+    Args:
+        cls (Type[DataModel]): Class of the root object.
+        directory (str): Directory the dataset has been written to.
+        trusted (bool): Whether objects are constructed without validation.
+
+    Returns:
+        DataModel: The root object.
+    """
+
+    with open(os.path.join(directory, MANIFEST)) as handler:
+        manifest = json.load(handler)
+
+    root_name = manifest.get("__source__", {}).get("root")
+
+    if root_name not in (None, cls.__name__):
+        raise ValueError(
+            f"Sharded dataset holds '{root_name}', but '{cls.__name__}' was expected."
+        )
+
+    if trusted:
+        check_source(cls, manifest)
+
+    obj = cls.from_dict(manifest["root"], trusted=trusted)
+    table = cls._get_field_table()
+
+    for name, index in manifest["shards"].items():
+        if name not in table.object_fields or name not in table.multiple_fields:
+            raise ValueError(f"'{name}' of '{cls.__name__}' is not a list of objects.")
+
+        dtypes = table.types[name]
+        loader = _ShardLoader(
+            directory,
+            index,
+            dtypes if isinstance(dtypes, tuple) else (dtypes,),
+            trusted,
+        )
+
+        value = ShardedList(loader)
+        value._parent = obj
+        value._attribute = name
+        obj.__dict__[name] = value
+
+    key = id(obj)
+    _PENDING_ROOTS[key] = weakref.ref(obj, lambda _: _PENDING_ROOTS.pop(key, None))
+
+    return obj
+
+
+def load_shards(obj: "DataModel") -> None:
+    """Reads all pending shards of an object, e.g. before it is exported.
+
+    Objects that have not been opened via 'open_sharded' are returned from
+    at once, thus exports of all other objects are not slowed down.
+    """
+
+    ref = _PENDING_ROOTS.get(id(obj))
+
+    if ref is None or ref() is not obj:
+        return
+
+    del _PENDING_ROOTS[id(obj)]
+
+    for value in obj.__dict__.values():
+        if type(value) is ShardedList:
+            value._load_all()
+
+
+class _ShardLoader:
+    """Reads the shards of a single list field"""
+
+    def __init__(self, directory: str, index: Dict, dtypes: Tuple, trusted: bool):
+        self.directory = directory
+        self.format = index["format"]
+        self.files = index["files"]
+        self.counts = index["counts"]
+        self.dtypes = dtypes
+        self.trusted = trusted
+
+        # Position of the first object of each shard
+        self.offsets = [0]
+
+        for count in self.counts[:-1]:
+            self.offsets.append(self.offsets[-1] + count)
+
+    def load(self, shard: int) -> List["DataModel"]:
+        path = os.path.join(self.directory, self.files[shard])
+
+        if self.format == "binary":
+            with open(path, "rb") as handler:
+                _, records = decode_binary(handler.read())
+        else:
+            with open(path, "rb") as handler:
+                records = get_json_backend().loads(handler.read())
+
+        return [
+            select_type(self.dtypes, record).from_dict(record, trusted=self.trusted)
+            for record in records
+        ]
+
+
+def _reading(method):
+    """Wraps a list method, such that all shards are read before it is called"""
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        self._load_all()
+
+        for arg in args:
+            # Lists are compared and concatenated by their storage
+            if type(arg) is ShardedList:
+                arg._load_all()
+
+        return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+class ShardedList(ListPlus):
+    """A list of objects, whose shards are read upon first access.
+
+    The length and single objects are served from the shard index and the
+    respective shard. All other operations read the remaining shards first
+    and then behave like a regular 'ListPlus'.
+    """
+
+    def __init__(self, loader: Optional[_ShardLoader] = None):
+        super().__init__()
+
+        self.__dict__["_loader"] = loader
+        self.__dict__["_shards"] = {}
+
+    def _load_shard(self, shard: int) -> List["DataModel"]:
+        shards = self.__dict__["_shards"]
+
+        if shard not in shards:
+            elements = self.__dict__["_loader"].load(shard)
+            parent, attribute = self._parent, self._attribute
+
+            for element in elements:
+                element._parent = parent
+                element._attribute = attribute
+
+            shards[shard] = elements
+
+        return shards[shard]
+
+    def _load_all(self) -> None:
+        loader = self.__dict__.get("_loader")
+
+        if loader is None:
+            return
+
+        elements = []
+
+        for shard in range(len(loader.files)):
+            elements.extend(self._load_shard(shard))
+
+        self.__dict__["_loader"] = None
+        self.__dict__["_shards"] = {}
+
+        # Objects have been linked already, thus the list is filled directly
+        list.extend(self, elements)
+
+    def __len__(self) -> int:
+        loader = self.__dict__.get("_loader")
+
+        if loader is None:
+            return list.__len__(self)
+
+        return sum(loader.counts)
+
+    def __getitem__(self, index):
+        loader = self.__dict__.get("_loader")
+
+        if loader is None or not isinstance(index, int):
+            self._load_all()
+            return list.__getitem__(self, index)
+
+        size = sum(loader.counts)
+        position = index + size if index < 0 else index
+
+        if not 0 <= position < size:
+            raise IndexError("list index out of range")
+
+        shard = bisect.bisect_right(loader.offsets, position) - 1
+
+        return self._load_shard(shard)[position - loader.offsets[shard]]
+
+    def set_parent_for_object_entries(self, parent):
+        for elements in self._loaded():
+            for element in elements:
+                element._parent = parent
+
+    def set_attribute_for_object_entries(self, attribute):
+        for elements in self._loaded():
+            for element in elements:
+                element._attribute = attribute
+
+    def _loaded(self) -> List[List["DataModel"]]:
+        """Returns the objects that have been read so far"""
+
+        if self.__dict__.get("_loader") is None:
+            return [list(list.__iter__(self))]
+
+        return list(self.__dict__.get("_shards", {}).values())
+
+    def __getstate__(self):
+        state = super().__getstate__()
+        state.pop("_loader", None)
+        state.pop("_shards", None)
+
+        return state
+
+    # Any other operation reads all shards first
+    __iter__ = _reading(ListPlus.__iter__)
+    __reversed__ = _reading(ListPlus.__reversed__)
+    __contains__ = _reading(ListPlus.__contains__)
+    __eq__ = _reading(ListPlus.__eq__)
+    __ne__ = _reading(ListPlus.__ne__)
+    __lt__ = _reading(ListPlus.__lt__)
+    __le__ = _reading(ListPlus.__le__)
+    __gt__ = _reading(ListPlus.__gt__)
+    __ge__ = _reading(ListPlus.__ge__)
+    __repr__ = _reading(ListPlus.__repr__)
+    __add__ = _reading(ListPlus.__add__)
+    __mul__ = _reading(ListPlus.__mul__)
+    __rmul__ = _reading(ListPlus.__rmul__)
+    __imul__ = _reading(ListPlus.__imul__)
+    __iadd__ = _reading(ListPlus.__iadd__)
+    __setitem__ = _reading(ListPlus.__setitem__)
+    __delitem__ = _reading(ListPlus.__delitem__)
+    __reduce_ex__ = _reading(ListPlus.__reduce_ex__)
+    append = _reading(ListPlus.append)
+    extend = _reading(ListPlus.extend)
+    insert = _reading(ListPlus.insert)
+    pop = _reading(ListPlus.pop)
+    remove = _reading(ListPlus.remove)
+    clear = _reading(ListPlus.clear)
+    sort = _reading(ListPlus.sort)
+    reverse = _reading(ListPlus.reverse)
+    index = _reading(ListPlus.index)
+    count = _reading(ListPlus.count)
+    copy = _reading(ListPlus.copy)
+    get = _reading(ListPlus.get)
+
+
+def _write_shard(path: str, format: str, elements: List["DataModel"]) -> None:
+    if format == "binary":
+        records = [
+            element.model_dump(exclude_none=True, by_alias=True, mode="python")
+            for element in elements
+        ]
+        header = source_info(elements[0]) if elements else {}
+
+        with open(path, "wb") as handler:
+            handler.write(encode_binary(header, records))
+    else:
+        records = [element.to_dict() for element in elements]
+
+        with open(path, "w") as handler:
+            handler.write(get_json_backend().dumps(records, indent=None))
+
@@ -0,0 +1,306 @@
+import os
+import re
+import struct
+import zipfile
+
+import numpy as np
+
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+# Key marking a value that is stored in a sidecar file
+SIDECAR_KEY = "__sidecar__"
+
+# Keys of a sidecar reference
+_REFERENCE_KEYS = frozenset({SIDECAR_KEY, "key", "bytes"})
+
+# Matches the key within a JSON object, but not within strings, whose quotes are escaped
+_JSON_REFERENCE = r'[{,]\s*"' + SIDECAR_KEY + r'"\s*:'
+_JSON_REFERENCE_PATTERNS = {
+    str: re.compile(_JSON_REFERENCE),
+    bytes: re.compile(_JSON_REFERENCE.encode()),
+}
+
+# Minimum size in bytes of 'bytes' values that are moved to a sidecar
+BYTES_THRESHOLD = 1 << 10
+
+# Offset of the name length within a local zip file header
+_ZIP_NAME_LENGTH_OFFSET = 26
+_ZIP_LOCAL_HEADER_SIZE = 30
+
+
+def to_dict_with_sidecar(
+    obj: "DataModel",
+    sidecar: str,
+    exclude_none: bool = True,
+    mode: str = "json",
+    threshold: int = BYTES_THRESHOLD,
+) -> Dict:
+    """Exports an object to a dictionary, storing arrays and large bytes in sidecar files.
+
+    Arrays and 'bytes' values of at least 'threshold' bytes are written to
+    the sidecar instead of being converted to lists, and are replaced by a
+    reference in the returned dictionary. If the sidecar ends with '.npz', all
+    values are bundled into a single uncompressed archive. Otherwise, it is
+    treated as a directory, to which each value is written as '.npy' file.
+
+    References hold the file name of the sidecar only, thus the document
+    has to be stored in the same directory as the sidecar.
+
+    Args:
+        obj (DataModel): Object to export.
+        sidecar (str): Path of the '.npz' bundle or the directory of '.npy' files.
+        exclude_none (bool): Whether to exclude unset values. Defaults to True.
+        mode (str): Serialization mode passed to 'model_dump'. Defaults to 'json'.
+        threshold (int): Minimum size in bytes of 'bytes' values to store externally.
+
+    Returns:
+        Dict: Exported data including the references.
+    """
+
+    values = list(_collect_values(obj, (), threshold))
+    data = obj.model_dump(
+        exclude_none=exclude_none,
+        by_alias=True,
+        mode=mode,
+        exclude=_exclude_spec(values),
+    )
+
+    with _SidecarWriter(sidecar) as writer:
+        for path, value in values:
+            key = "/".join(str(alias) for _, alias in path)
+            _insert(data, [alias for _, alias in path], writer.write(key, value))
+
+    return obj._convert_types_and_remove_empty_objects(data, exclude_none, True)
+
+
+def has_sidecar(content: Union[str, bytes]) -> bool:
+    """Checks whether a raw JSON document holds an object referencing a sidecar file"""
+
+    pattern = _JSON_REFERENCE_PATTERNS[bytes if isinstance(content, bytes) else str]
+
+    return pattern.search(content) is not None
+
+
+def resolve_sidecars(data: Any, directory: Optional[str] = None) -> Any:
+    """Replaces sidecar references by the stored values in place.
+
+    Arrays are memory-mapped read-only, such that they are not copied into
+    memory until they are accessed. Bundled arrays are mapped as well, as
+    long as the bundle is not compressed. Referenced files have to be located
+    within the directory of the document.
+
+    Args:
+        data (Any): Parsed document.
+        directory (Optional[str]): Directory the document is stored in. Defaults to the working directory.
+
+    Returns:
+        Any: The document with references replaced.
+    """
+
+    return _resolve(data, directory or "", {})
+
+
+def handler_directory(handler) -> Optional[str]:
+    """Returns the directory of a path or the file a handler reads from, if known"""
+
+    if isinstance(handler, (str, os.PathLike)):
+        name = os.fspath(handler)
+    else:
+        name = getattr(handler, "name", None)
+
+    if not isinstance(name, str):
+        return None
+
+    return os.path.dirname(os.path.abspath(name))
+
+
+# ! Export
+def _collect_values(obj: "DataModel", prefix: Tuple, threshold: int):
+    """Yields the path of (name, alias) or index pairs and value of externally stored values"""
+
+    from sdRDM.base.datamodel import DataModel
+
+    for name, field in obj.model_fields.items():
+        value = obj.__dict__.get(name)
+        path = prefix + ((name, field.alias or name),)
+
+        if isinstance(value, np.ndarray):
+            yield path, value
+        elif isinstance(value, bytes) and len(value) >= threshold:
+            yield path, value
+        elif isinstance(value, DataModel):
+            yield from _collect_values(value, path, threshold)
+        elif isinstance(value, list):
+            for index, element in enumerate(value):
+                if isinstance(element, DataModel):
+                    yield from _collect_values(
+                        element, path + ((index, index),), threshold
+                    )
+
+
+def _exclude_spec(values: List) -> Dict:
+    """Builds a nested 'exclude' argument for 'model_dump' from the collected paths"""
+
+    spec = {}
+
+    for path, _ in values:
+        level = spec
+
+        for name, _ in path[:-1]:
+            level = level.setdefault(name, {})
+
+        level[path[-1][0]] = True
+
+    return spec
+
+
+def _insert(data: Dict, path: List, reference: Dict) -> None:
+    for key in path[:-1]:
+        data = data[key]
+
+    data[path[-1]] = reference
+
+
+class _SidecarWriter:
+    """Writes values to a '.npz' bundle or a directory of '.npy' files"""
+
+    def __init__(self, sidecar: str):
+        self.sidecar = sidecar
+        self.name = os.path.basename(os.path.normpath(sidecar))
+        self.bundle = None
+
+        if sidecar.endswith(".npz"):
+            self.bundle = zipfile.ZipFile(
+                sidecar, "w", compression=zipfile.ZIP_STORED, allowZip64=True
+            )
+        else:
+            os.makedirs(sidecar, exist_ok=True)
+
+    def write(self, key: str, value: Union[np.ndarray, bytes]) -> Dict:
+        """Writes a single value and returns its reference"""
+
+        reference = {SIDECAR_KEY: self.name}
+
+        if isinstance(value, bytes):
+            reference["bytes"] = True
+            value = np.frombuffer(value, dtype=np.uint8)
+
+        filename = key.replace("/", ".") + ".npy"
+
+        if self.bundle is not None:
+            reference["key"] = filename
+
+            with self.bundle.open(filename, "w", force_zip64=True) as handler:
+                np.lib.format.write_array(handler, value, allow_pickle=False)
+        else:
+            reference[SIDECAR_KEY] = f"{self.name}/{filename}"
+            np.save(
+                os.path.join(self.sidecar, filename), value, allow_pickle=False
+            )
+
+        return reference
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        if self.bundle is not None:
+            self.bundle.close()
+
+
+# ! Import
+def _resolve(data: Any, directory: str, bundles: Dict) -> Any:
+    if isinstance(data, list):
+        items = enumerate(data)
+    elif isinstance(data, dict) and _is_reference(data):
+        return _load_reference(data, directory, bundles)
+    elif isinstance(data, dict):
+        items = data.items()
+    else:
+        return data
+
+    for key, value in list(items):
+        if isinstance(value, (list, dict)):
+            data[key] = _resolve(value, directory, bundles)
+
+    return data
+
+
+def _is_reference(data: Dict) -> bool:
+    """Whether a dictionary is a sidecar reference written by `_SidecarWriter`"""
+
+    return isinstance(data.get(SIDECAR_KEY), str) and data.keys() <= _REFERENCE_KEYS
+
+
+def _load_reference(data: Dict, directory: str, bundles: Dict) -> Any:
+    path = _sidecar_path(directory, data[SIDECAR_KEY])
+
+    if "key" in data:
+        value = _map_member(path, data["key"], bundles)
+    else:
+        value = _map_file(path)
+
+    if data.get("bytes"):
+        return value.tobytes()
+
+    return value
+
+
+def _sidecar_path(directory: str, name: str) -> str:
+    """Returns the path of a sidecar file, which has to be located within the directory"""
+
+    root = os.path.abspath(directory)
+    path = os.path.abspath(os.path.join(root, name))
+
+    if os.path.commonpath([root, path]) != root:
+        raise ValueError(f"Sidecar '{name}' is not located within '{root}'.")
+
+    return path
+
+
+def _map_file(path: str) -> np.ndarray:
+    return np.load(path, mmap_mode="r", allow_pickle=False)
+
+
+def _map_member(path: str, member: str, bundles: Dict) -> np.ndarray:
+    """Memory-maps an array within an uncompressed '.npz' bundle"""
+
+    if path not in bundles:
+        with zipfile.ZipFile(path) as bundle:
+            bundles[path] = {info.filename: info for info in bundle.infolist()}
+
+    info = bundles[path].get(member)
+
+    if info is None:
+        raise ValueError(f"Sidecar '{path}' does not contain '{member}'.")
+    elif info.compress_type != zipfile.ZIP_STORED:
+        with np.load(path, allow_pickle=False) as bundle:
+            return bundle[member[: -len(".npy")]]
+
+    with open(path, "rb") as handler:
+        handler.seek(info.header_offset + _ZIP_NAME_LENGTH_OFFSET)
+        name_length, extra_length = struct.unpack("<HH", handler.read(4))
+        handler.seek(
+            info.header_offset + _ZIP_LOCAL_HEADER_SIZE + name_length + extra_length
+        )
+
+        version = np.lib.format.read_magic(handler)
+
+        if version == (1, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(handler)
+        else:
+            shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(handler)
+
+        offset = handler.tell()
+
+    if int(np.prod(shape)) == 0:
+        return np.empty(shape, dtype=dtype)
+
+    return np.memmap(
+        path,
+        dtype=dtype,
+        mode="r",
+        offset=offset,
+        shape=shape,
+        order="F" if fortran_order else "C",
+    )
@@ -0,0 +1,319 @@
+import pydantic as pd
+
+from functools import lru_cache
+from lxml import etree
+from pydantic_xml import errors, utils
+from pydantic_xml.element.native import XmlElement
+from typing import IO, Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from sdRDM.base.ioutils.compression import PathLike, opened
+from sdRDM.base.ioutils.xmlstream import _object_slot
+from sdRDM.tools.utils import xml_context
+
+# Events the document is parsed with
+_EVENTS = ("start", "end")
+
+
+def load_xml(cls, handler: IO) -> "DataModel":
+    """Reads an object from an XML file, validating sub-objects as their elements close.
+
+    The document is parsed incrementally and each element of an object field,
+    for instance an item of a wrapped list, is turned into an object as soon
+    as it is complete. Its element is cleared and removed from the tree
+    afterwards, thus only the objects created so far and the elements of
+    incomplete objects are held in memory.
+
+    Args:
+        cls (Type[DataModel]): Class of the root object.
+        handler (IO): Binary file handler to read from.
+
+    Returns:
+        DataModel: The root object.
+    """
+
+    reader = _XMLReader(cls)
+
+    for event, element in etree.iterparse(handler, events=_EVENTS):
+        if event == "start":
+            reader.start(element)
+            continue
+
+        for obj in reader.end(element):
+            return obj
+
+    raise errors.ParsingError("document ended before the root element was closed")
+
+
+def iter_xml(
+    cls,
+    handler: Union[IO, PathLike],
+    path: str,
+) -> Iterator["DataModel"]:
+    """Yields the objects found at a meta path of an XML file one after another.
+
+    Only the elements of the currently yielded object are kept, all others
+    are cleared as soon as they close. Thus, files larger than the available
+    memory can be processed. Lists along the path are traversed, such that
+    e.g. 'measurements/species' yields the species of all measurements.
+
+    Args:
+        cls (Type[DataModel]): Class of the root object.
+        handler (Union[IO, PathLike]): Binary file handler or path of a (compressed) file to read from.
+        path (str): Meta path of an object attribute, separated by '/'.
+
+    Returns:
+        Iterator[DataModel]: Objects found at the path.
+    """
+
+    segments = [segment for segment in path.strip("/").split("/") if segment]
+
+    if not segments:
+        raise ValueError("Path must point to an attribute of the root object.")
+
+    reader = _XMLReader(cls, segments)
+
+    with opened(handler, "rb") as file:
+        for event, element in etree.iterparse(file, events=_EVENTS):
+            if event == "start":
+                reader.start(element)
+            else:
+                yield from reader.end(element)
+
+
+class _Frame:
+    """State of an object, whose element has been opened but not yet closed"""
+
+    __slots__ = ("element", "proxies", "field_name", "slots", "relative", "values")
+
+    def __init__(
+        self,
+        element: etree._Element,
+        proxies: Tuple,
+        field_name: Optional[str],
+        slots: Dict[Tuple[str, ...], Tuple[str, List]],
+    ):
+        self.element = element
+        self.proxies = proxies
+        self.field_name = field_name
+        self.slots = slots
+        self.relative: List[str] = []
+        self.values: Dict[str, List] = {}
+
+
+class _XMLReader:
+    """Turns the elements of object fields into objects while the document is parsed.
+
+    Each opened element of an object is tracked by a frame, which maps the
+    tag paths of its object fields relative to the element to the field.
+    When a matching element closes, the object is created and handed to the
+    frame of the parent. If a path is given, only the object fields along the
+    path are followed and the objects at its end are returned instead.
+    """
+
+    def __init__(self, cls, segments: Optional[List[str]] = None):
+        self.cls = cls
+        self.segments = segments
+        self.stack: List[_Frame] = []
+
+    def start(self, element: etree._Element) -> None:
+        if not self.stack:
+            serializer = self.cls.__xml_serializer__
+
+            if element.tag != serializer.element_name:
+                raise errors.ParsingError(
+                    f"root element not found (actual: {element.tag}, expected: {serializer.element_name})",
+                )
+
+            self.stack.append(self._frame(element, (serializer,), None))
+            return
+
+        frame = self.stack[-1]
+        slot = frame.slots.get((*frame.relative, element.tag))
+
+        if slot is None:
+            frame.relative.append(element.tag)
+            return
+
+        field_name, proxies = slot
+        proxies = tuple(proxy for proxy in proxies if proxy.element_name == element.tag)
+
+        self.stack.append(self._frame(element, proxies, field_name))
+
+    def end(self, element: etree._Element) -> Iterator["DataModel"]:
+        frame = self.stack[-1]
+
+        if element is not frame.element:
+            frame.relative.pop()
+
+            if self._is_skipped(frame):
+                _release(element)
+
+            return
+
+        self.stack.pop()
+
+        if self.segments is not None and len(self.stack) < len(self.segments):
+            # Objects along the path are not created
+            _release(element)
+            return
+
+        obj = self._build(frame)
+
+        if not self.stack:
+            yield obj
+        elif self.segments is not None and len(self.stack) == len(self.segments):
+            _release(element)
+            yield obj
+        else:
+            self.stack[-1].values.setdefault(frame.field_name, []).append(obj)
+            _release(element)
+
+    def _frame(
+        self,
+        element: etree._Element,
+        proxies: Tuple,
+        field_name: Optional[str],
+    ) -> _Frame:
+        """Creates the frame of an object, whose slots are determined by its class"""
+
+        if len(proxies) != 1:
+            # Objects of ambiguous classes are parsed as a whole
+            return _Frame(element, proxies, field_name, {})
+
+        model = proxies[0].model
+        fields = None
+
+        if self.segments is not None and len(self.stack) < len(self.segments):
+            fields = frozenset({self._field_name(model, self.segments[len(self.stack)])})
+
+        return _Frame(element, proxies, field_name, _slots(model, fields))
+
+    def _is_skipped(self, frame: _Frame) -> bool:
+        """Whether the content of a frame is not needed to create an object"""
+
+        return self.segments is not None and len(self.stack) <= len(self.segments)
+
+    def _build(self, frame: _Frame) -> "DataModel":
+        """Creates the object of a closed frame from its element and the objects created within"""
+
+        if len(frame.proxies) != 1:
+            return _deserialize_union(frame.proxies, frame.element)
+
+        serializer = frame.proxies[0].model.__xml_serializer__
+
+        return _deserialize(serializer, frame.element, frame.values)
+
+    @staticmethod
+    def _field_name(model, segment: str) -> str:
+        table = model._get_field_table()
+        name = table.names.get(segment)
+
+        if name is None:
+            raise ValueError(f"'{model.__name__}' has no attribute '{segment}'.")
+        elif _object_slot(model.__xml_serializer__.fields_serializers[name]) is None:
+            raise ValueError(f"Attribute '{segment}' of '{model.__name__}' does not hold objects.")
+
+        return name
+
+
+@lru_cache(maxsize=256)
+def _slots(model, fields: Optional[frozenset] = None) -> Dict[Tuple[str, ...], Tuple[str, List]]:
+    """Maps the tag paths of object fields relative to the element of an object to the field"""
+
+    slots = {}
+
+    for field_name, serializer in model.__xml_serializer__.fields_serializers.items():
+        if fields is not None and field_name not in fields:
+            continue
+
+        slot = _object_slot(serializer)
+
+        if slot is None:
+            continue
+
+        path, _, proxies = slot
+
+        for proxy in proxies:
+            key = (*path, proxy.element_name)
+            slots.setdefault(key, (field_name, []))[1].append(proxy)
+
+    return slots
+
+
+def _deserialize(serializer, element: etree._Element, values: Dict[str, List]) -> "DataModel":
+    """Creates an object from an element, whose object fields have been created beforehand.
+
+    Mirrors the deserialization of pydantic-xml, which is thus pinned to a
+    minor version, but the objects created while parsing are passed to the
+    validation in place of the removed elements. Source lines are tracked
+    alike, such that errors state the line of the offending element.
+    """
+
+    reader = XmlElement.from_native(element)
+    context = xml_context()
+    sourcemap: Dict[Tuple, int] = {}
+    result: Dict[str, Any] = {}
+    field_errors: Dict[str, pd.ValidationError] = {}
+
+    for field_name, field_serializer in serializer.fields_serializers.items():
+        try:
+            loc = (field_name,)
+            sourcemap[loc] = reader.get_sourceline()
+
+            # Wrapper elements of removed objects are consumed nonetheless
+            value = field_serializer.deserialize(
+                reader, context=context, sourcemap=sourcemap, loc=loc
+            )
+        except pd.ValidationError as err:
+            field_errors[field_name] = err
+            continue
+
+        if field_name in values:
+            value = values[field_name]
+            value = value if _is_multiple(serializer, field_name) else value[-1]
+
+        if value is not None:
+            result[serializer._fields_validation_aliases.get(field_name, field_name)] = value
+
+    if field_errors:
+        raise utils.build_validation_error(
+            title=serializer.model.__name__, errors_map=field_errors
+        )
+
+    try:
+        return serializer.model.model_validate(result, strict=False, context=context)
+    except pd.ValidationError as err:
+        raise utils.set_validation_error_sourceline(err, sourcemap)
+
+
+def _deserialize_union(proxies: Tuple, element: etree._Element) -> "DataModel":
+    """Creates an object of the first class an element can be deserialized to"""
+
+    last_error = None
+
+    for proxy in proxies:
+        try:
+            return proxy.model.__xml_serializer__.deserialize(
+                XmlElement.from_native(element),
+                context=xml_context(),
+                sourcemap={},
+                loc=(),
+            )
+        except pd.ValidationError as err:
+            last_error = err
+
+    raise last_error
+
+
+def _is_multiple(serializer, field_name: str) -> bool:
+    return field_name in serializer.model._get_field_table().multiple_fields
+
+
+def _release(element: etree._Element) -> None:
+    """Frees a processed element and detaches it from its parent"""
+
+    element.clear()
+    parent = element.getparent()
+
+    if parent is not None:
+        parent.remove(element)
@@ -0,0 +1,284 @@
+import pydantic_core
+
+from lxml import etree
+from pydantic_xml.element.native import XmlElement
+from pydantic_xml.serializers.factories import homogeneous, model, union, wrapper
+from typing import IO, Dict, List, Optional, Tuple
+
+# Computed elements, which are only meant for JSON-LD
+LD_FIELDS = frozenset({"json_ld_type", "json_ld_context"})
+
+DECLARATION = b"<?xml version='1.0' encoding='UTF-8'?>\n"
+
+_LD_XPATH = "//*[local-name()='ld_context' or local-name()='ld_type']"
+
+_INDENT = "  "
+
+
+def dump_xml(obj: "DataModel", handler: IO) -> None:
+    """Writes an object as XML to a binary file handler while walking the model.
+
+    Each object is serialized on its own and written via an incremental
+    'lxml.etree.xmlfile', thus objects of list fields are never collected in
+    a single tree. The JSON-LD elements 'ld_type' and 'ld_context' are not
+    created at all. The document is equivalent to the one of `DataModel.xml`,
+    but namespace declarations are sorted and empty elements are written
+    with start and end tag.
+
+    Args:
+        obj (DataModel): Object to write.
+        handler (IO): Binary file handler to write to.
+    """
+
+    serializer = obj.__class__.__xml_serializer__
+
+    handler.write(DECLARATION)
+
+    with etree.xmlfile(handler, encoding="UTF-8") as xf:
+        writer = _XMLStreamWriter(xf)
+        writer.write_object(obj, serializer.element_name, serializer.nsmap, {}, 0)
+
+    handler.write(b"\n")
+
+
+class _XMLStreamWriter:
+    def __init__(self, xf):
+        self.xf = xf
+
+    def write_object(
+        self,
+        obj: "DataModel",
+        name: str,
+        nsmap: Optional[Dict],
+        scope: Dict,
+        depth: int,
+        pretty: bool = True,
+    ) -> None:
+        """Writes an object, whose sub-objects are written one after another"""
+
+        shell, parts = self._serialize_own_fields(obj, name, nsmap)
+
+        if not parts:
+            self._write_element(shell, scope, depth, pretty, _native_nsmap(nsmap))
+            return
+
+        declared = _declarations(_native_nsmap(nsmap), scope)
+        scope = {**scope, **declared}
+        pretty = pretty and not shell.text
+
+        with self.xf.element(shell.tag, dict(shell.attrib), nsmap=declared or None):
+            if shell.text:
+                self.xf.write(shell.text)
+
+            for part in parts:
+                if isinstance(part, list):
+                    for element in part:
+                        self._newline(depth + 1, pretty)
+                        self._write_element(element, scope, depth + 1, pretty)
+                else:
+                    self._write_slot(*part, scope, depth + 1, pretty)
+
+            self._newline(depth, pretty)
+
+    def _serialize_own_fields(
+        self,
+        obj: "DataModel",
+        name: str,
+        nsmap: Optional[Dict],
+    ) -> Tuple[etree._Element, List]:
+        """Serializes all but the object fields, which are returned as slots to write separately.
+
+        Returns an element holding the attributes and text of the object, and
+        the content in field order. Each part of the content is either a list
+        of serialized elements or the slot of an object field.
+        """
+
+        cls = obj.__class__
+        table = cls._get_field_table()
+        serializers = cls.__xml_serializer__.fields_serializers
+        skip_empty = bool(cls.__xml_skip_empty__)
+
+        slots = {}
+
+        for field_name, serializer in serializers.items():
+            slot = _object_slot(serializer)
+
+            if slot is not None:
+                slots[field_name] = slot
+
+        encoded = pydantic_core.to_jsonable_python(
+            obj,
+            by_alias=False,
+            exclude=LD_FIELDS | set(slots),
+            fallback=lambda value: value if not isinstance(value, etree._Element) else None,
+        )
+
+        shell = XmlElement(tag=name, nsmap=nsmap).to_native()
+        parts = []
+
+        for field_name, serializer in serializers.items():
+            field = cls.model_fields.get(field_name)
+
+            if field_name in LD_FIELDS or (field is not None and field.exclude):
+                continue
+
+            value = getattr(obj, field_name)
+
+            if field_name in slots:
+                path, wrapper_nsmap, proxies = slots[field_name]
+                values = value if isinstance(value, list) else [value]
+
+                if value is None or (not path and not values):
+                    continue
+                elif path and skip_empty and not values:
+                    continue
+
+                parts.append((path, wrapper_nsmap, proxies, values))
+                continue
+
+            # Each field is serialized on its own to keep the order of its elements
+            element = XmlElement(tag=name, nsmap=nsmap)
+            serializer.serialize(
+                element,
+                value,
+                encoded[field_name],
+                skip_empty=skip_empty,
+            )
+            element = element.to_native()
+
+            if field_name in table.object_fields:
+                # Objects of unknown layouts are serialized including JSON-LD elements
+                _remove_json_ld(element)
+
+            shell.attrib.update(element.attrib)
+
+            if element.text is not None:
+                shell.text = element.text
+            if len(element):
+                parts.append(list(element))
+
+        return shell, parts
+
+    def _write_slot(
+        self,
+        path: Tuple[str, ...],
+        nsmap: Optional[Dict],
+        proxies: Tuple,
+        values: List,
+        scope: Dict,
+        depth: int,
+        pretty: bool,
+    ) -> None:
+        """Writes the wrapper elements along the path of an object field and the objects within"""
+
+        if not path:
+            for obj in values:
+                proxy = _select_proxy(proxies, obj)
+
+                self._newline(depth, pretty)
+                self.write_object(
+                    obj, proxy.element_name, proxy.nsmap, scope, depth, pretty
+                )
+
+            return
+
+        shell = XmlElement(tag=path[0], nsmap=nsmap).to_native()
+        declared = _declarations(_native_nsmap(nsmap), scope)
+
+        self._newline(depth, pretty)
+
+        with self.xf.element(shell.tag, nsmap=declared or None):
+            if len(path) > 1 or values:
+                self._write_slot(
+                    path[1:],
+                    nsmap,
+                    proxies,
+                    values,
+                    {**scope, **declared},
+                    depth + 1,
+                    pretty,
+                )
+                self._newline(depth, pretty)
+
+    def _write_element(
+        self,
+        element: etree._Element,
+        scope: Dict,
+        depth: int,
+        pretty: bool,
+        nsmap: Optional[Dict] = None,
+    ) -> None:
+        """Writes a serialized element without re-declaring namespaces in scope"""
+
+        declared = _declarations(element.nsmap if nsmap is None else nsmap, scope)
+        scope = {**scope, **declared}
+        pretty = pretty and not element.text
+
+        with self.xf.element(element.tag, dict(element.attrib), nsmap=declared or None):
+            if element.text:
+                self.xf.write(element.text)
+
+            for child in element:
+                self._newline(depth + 1, pretty)
+                self._write_element(child, scope, depth + 1, pretty)
+
+            if len(element):
+                self._newline(depth, pretty)
+
+    def _newline(self, depth: int, pretty: bool) -> None:
+        if pretty:
+            self.xf.write("\n" + _INDENT * depth)
+
+
+def _declarations(nsmap: Dict, scope: Dict) -> Dict:
+    """Returns the namespaces of an element that are not declared by its ancestors"""
+
+    return {prefix: uri for prefix, uri in nsmap.items() if scope.get(prefix) != uri}
+
+
+def _remove_json_ld(element: etree._Element) -> None:
+    for node in element.xpath(_LD_XPATH):
+        node.getparent().remove(node)
+
+
+def _native_nsmap(nsmap: Optional[Dict]) -> Dict:
+    """Converts a pydantic-xml namespace map, which denotes the default namespace by '', to lxml"""
+
+    return {prefix or None: uri for prefix, uri in (nsmap or {}).items()}
+
+
+def _object_slot(serializer) -> Optional[Tuple]:
+    """Returns the wrapper path, its namespaces and the model serializers of an object field.
+
+    Returns None for layouts that are not known, whose fields are serialized
+    by pydantic-xml instead. Relies on the serializers of pydantic-xml, which
+    is thus pinned to a minor version.
+    """
+
+    path, nsmap = (), None
+
+    if isinstance(serializer, wrapper.ElementPathSerializer):
+        path, nsmap = serializer._path, serializer._nsmap
+        serializer = serializer._inner_serializer
+
+    if isinstance(serializer, homogeneous.ElementSerializer):
+        serializer = serializer._inner_serializer
+
+    if isinstance(serializer, model.ModelProxySerializer):
+        return path, nsmap, (serializer,)
+    elif isinstance(serializer, union.ModelSerializer):
+        return path, nsmap, tuple(serializer._inner_serializers)
+
+    return None
+
+
+def _select_proxy(proxies: Tuple, obj) -> "model.ModelProxySerializer":
+    for proxy in proxies:
+        if type(obj) is proxy.model:
+            return proxy
+
+    for proxy in proxies:
+        if isinstance(obj, proxy.model):
+            return proxy
+
+    raise TypeError(f"Object of type '{type(obj).__name__}' is not expected here.")
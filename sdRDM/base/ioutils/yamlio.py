@@ -0,0 +1,160 @@
+import yaml
+
+from typing import IO, Any, Dict, Iterable, Iterator, Optional, Union
+
+from sdRDM.base.ioutils.sidecar import resolve_sidecars
+from sdRDM.tools.utils import YAMLDumper
+
+# Classes backed by libyaml, if PyYAML has been built against it
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+CDumper = getattr(yaml, "CDumper", None)
+
+# Line width beyond which scalars are folded
+WIDTH = 80
+
+_OPTIONS = dict(default_flow_style=False, sort_keys=False, width=WIDTH)
+
+
+def dump_yaml(data: Dict) -> str:
+    """Emits exported data as YAML, in which sequences are indented below their key.
+
+    If libyaml is available, the document is emitted by its C emitter and
+    sequences are indented afterwards, such that the output is identical to
+    the one of `YAMLDumper`. The C emitter does not call 'increase_indent',
+    thus the layout of `YAMLDumper` can't be set on a sub-class of it.
+    Since libyaml folds long scalars differently,
+    documents with lines exceeding the width are emitted by `YAMLDumper`.
+
+    Args:
+        data (Dict): Exported data.
+
+    Returns:
+        str: The YAML document.
+    """
+
+    if CDumper is not None and isinstance(data, dict):
+        text = _indent_sequences(yaml.dump(data, Dumper=CDumper, **_OPTIONS))
+
+        if text is not None:
+            return text
+
+    return yaml.dump(data, Dumper=YAMLDumper, **_OPTIONS)
+
+
+def load_yaml(content: Union[str, bytes, IO]) -> Any:
+    """Parses a YAML document, using libyaml if available"""
+
+    return yaml.load(content, Loader=SafeLoader)
+
+
+def iter_yaml(
+    cls,
+    handler: IO,
+    trusted: bool = False,
+    sidecar_dir: Optional[str] = None,
+) -> Iterator["DataModel"]:
+    """Yields an object per document of a multi-document YAML stream.
+
+    Documents are separated by '---' and parsed one after another, thus
+    only a single document is held in memory at a time.
+
+    Args:
+        cls (Type[DataModel]): Class of the objects.
+        handler (IO): Text or binary file handler to read from.
+        trusted (bool): Whether objects are constructed without validation.
+        sidecar_dir (Optional[str]): Directory referenced sidecar files are stored in.
+
+    Returns:
+        Iterator[DataModel]: An object per non-empty document.
+    """
+
+    for data in yaml.load_all(handler, Loader=SafeLoader):
+        if data is None:
+            continue
+
+        yield cls.from_dict(resolve_sidecars(data, sidecar_dir), trusted=trusted)
+
+
+def dump_yaml_all(
+    models: Iterable["DataModel"],
+    handler: IO,
+    **kwargs,
+) -> int:
+    """Writes objects as a multi-document YAML stream, one document per object.
+
+    Each document is written as soon as its object has been exported, such
+    that the objects may be generated lazily.
+
+    Args:
+        models (Iterable[DataModel]): Objects to write.
+        handler (IO): Text file handler to write to.
+        **kwargs: Keyword arguments passed to 'to_dict'.
+
+    Returns:
+        int: Number of written documents.
+    """
+
+    count = 0
+
+    for model in models:
+        if count:
+            handler.write("---\n")
+
+        handler.write(dump_yaml(model.to_dict(**kwargs)))
+        count += 1
+
+    return count
+
+
+def _indent_sequences(text: str) -> Optional[str]:
+    """Indents the block sequences libyaml writes at the level of their key.
+
+    The lines spanned by each such sequence are located by parsing the
+    document and are shifted by two spaces per enclosing sequence. Returns
+    None if a line exceeds the width, since the line folding of scalars
+    depends on the indentation.
+    """
+
+    lines = text.split("\n")
+    shifts = [0] * (len(lines) + 1)
+
+    # Open collections as (is mapping, is flow, first line of an indentless sequence)
+    stack = []
+    last_line = 0
+
+    for event in yaml.parse(text, Loader=SafeLoader):
+        kind = type(event)
+
+        if kind is yaml.ScalarEvent or kind is yaml.AliasEvent:
+            last_line = event.end_mark.line
+        elif kind is yaml.MappingStartEvent:
+            stack.append((True, bool(event.flow_style), None))
+        elif kind is yaml.SequenceStartEvent:
+            is_flow = bool(event.flow_style)
+            indentless = bool(stack) and stack[-1][0] and not is_flow
+            start = event.start_mark.line if indentless else None
+
+            stack.append((False, is_flow, start))
+        elif kind is yaml.SequenceEndEvent or kind is yaml.MappingEndEvent:
+            _, is_flow, start = stack.pop()
+
+            if is_flow:
+                last_line = event.end_mark.line
+
+            if start is not None:
+                shifts[start] += 1
+                shifts[last_line + 1] -= 1
+
+    level = 0
+
+    for index, line in enumerate(lines):
+        level += shifts[index]
+
+        if level and line:
+            line = "  " * level + line
+            lines[index] = line
+
+        if len(line) > WIDTH:
+            return None
+
+    return "\n".join(lines)
@@ -1,4 +1,9 @@
-from typing import Any, Callable, List, Optional, Union
+import weakref
+
+from types import GeneratorType
+from typing import Any, Callable, Iterable, List, Optional, Union
+
+from sdRDM.base.bulk import active_bulk
 
 
 class ListPlus(List[Any]):
@@ -8,7 +13,6 @@ class ListPlus(List[Any]):
     attributes.
     """
 
-    _parent: "DataModel"
     __types__: List["DataModel"]
     _attribute: Optional[str]
 
@@ -19,21 +23,130 @@ class ListPlus(List[Any]):
         self._attribute = None
 
         for arg in args:
-            if "generator object" in repr(arg):
+            if isinstance(arg, GeneratorType):
                 for element in list(arg):
                     self.append(element)
             else:
                 self.append(arg)
 
+    @classmethod
+    def _from_values(cls, values: Iterable) -> "ListPlus":
+        """Creates a list holding the given values at once.
+
+        Since a new list is not part of a model yet, there are no relations
+        to set up and the values are added in bulk instead of one by one.
+        """
+
+        instance = cls()
+        super(ListPlus, instance).extend(values)
+
+        return instance
+
     def append(self, *args):
         for arg in args:
-            if hasattr(arg, "model_fields") and self.is_part_of_model():
-                arg._parent = self._parent
-                arg._attribute = self._attribute
-                arg._check_references(self._attribute, arg)
-
+            self._add_model_relations(arg)
             super().append(arg)
 
+        self._invalidate_caches()
+
+    def extend(self, iterable):
+        self.append(*iterable)
+
+    def insert(self, index, arg):
+        self._add_model_relations(arg)
+        super().insert(index, arg)
+        self._invalidate_caches()
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            value = list(value)
+            for arg in value:
+                self._add_model_relations(arg)
+        else:
+            self._add_model_relations(value)
+
+        super().__setitem__(index, value)
+        self._invalidate_caches()
+
+    def __iadd__(self, other):
+        self.extend(other)
+        return self
+
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self._invalidate_caches()
+
+    def pop(self, *args):
+        value = super().pop(*args)
+        self._invalidate_caches()
+        return value
+
+    def remove(self, value):
+        super().remove(value)
+        self._invalidate_caches()
+
+    def clear(self):
+        super().clear()
+        self._invalidate_caches()
+
+    def sort(self, *args, **kwargs):
+        super().sort(*args, **kwargs)
+        self._invalidate_caches()
+
+    def reverse(self):
+        super().reverse()
+        self._invalidate_caches()
+
+    def _add_model_relations(self, arg):
+        """Links an object entry to the model this list is part of"""
+
+        if not hasattr(arg, "model_fields") or not self.is_part_of_model():
+            return
+
+        context = active_bulk()
+
+        if context is not None:
+            # Relations and checks are restored once the context exits
+            context.touch(self._parent, self._attribute, validate=False)
+        else:
+            arg._parent = self._parent
+            arg._attribute = self._attribute
+            arg._check_references(self._attribute, arg)
+
+    def _invalidate_caches(self):
+        """Signals a structural change to the model this list is part of"""
+
+        if self.is_part_of_model():
+            self._parent._invalidate_caches()
+
+    @property
+    def _parent(self) -> Optional["DataModel"]:
+        """Object this list is part of. It is held weakly to avoid reference cycles."""
+
+        ref = self.__dict__.get("_parent_ref")
+
+        return None if ref is None else ref()
+
+    @_parent.setter
+    def _parent(self, value: Optional["DataModel"]) -> None:
+        self.__dict__["_parent_ref"] = None if value is None else weakref.ref(value)
+
+    def _set_owner(self, parent: "DataModel", attribute: str) -> None:
+        """Links this list to the model it is part of, without visiting its entries.
+
+        Used for lists of primitives, which have no entries to link, such that
+        modifications still invalidate the caches of the model.
+        """
+
+        self.__dict__["_parent_ref"] = weakref.ref(parent)
+        self.__dict__["_attribute"] = attribute
+
+    def __getstate__(self):
+        # Weak references can't be pickled, the owning model restores them
+        return {
+            key: value for key, value in self.__dict__.items() if key != "_parent_ref"
+        }
+
     def is_part_of_model(self) -> bool:
         """Checks whether this list is already integrated"""
         return self._parent is not None
@@ -14,7 +14,7 @@ def process_term(
     field_info = obj.model_fields[attr]
     is_multiple = get_origin(field_info.annotation) == list
     is_identifier = any(dtype == Identifier for dtype in get_args(field_info.annotation))
-    attr_terms = obj._attribute_terms.get(attr, None)
+    attr_terms = (obj._attribute_terms or {}).get(attr, None)
 
     term = _get_object_uri(obj, attr)
     wrap = _get_term_wrap(
@@ -0,0 +1,57 @@
+import weakref
+
+from typing import Any, Dict, List, Tuple
+
+from sdRDM.base.tree import _digit_free_path
+from sdRDM.base.walker import walk
+
+
+class PathIndex:
+    """Maps the meta paths of an instantiated data model to the locations of their values.
+
+    Locations are stored as (container, key) pairs and values are read from
+    the live objects upon lookup. Thus, the index only has to be rebuilt if the
+    structure of the model changes, which is signaled by the owning DataModel
+    via its `_invalidate_caches` method. The root is held weakly, since the
+    index is cached on the root itself.
+    """
+
+    def __init__(self, root: "DataModel"):
+        self._root = weakref.ref(root)
+        self._locations: Dict[str, List[Tuple[Any, Any]]] = {}
+
+        for path, parent, attribute, _ in walk(root):
+            if isinstance(parent, list):
+                # List entries are located via the list itself
+                continue
+            elif parent is root:
+                parent = None
+
+            meta_path = _digit_free_path(path)
+            self._locations.setdefault(meta_path, []).append((parent, attribute))
+
+    def values(self, path: str) -> List[Any]:
+        """Returns all values found under the given meta path.
+
+        Args:
+            path (str): Meta path starting with a slash, e.g. '/a/b/c'.
+
+        Returns:
+            List[Any]: Values found at the path in document order. Unset values are skipped.
+        """
+
+        values = []
+
+        for container, key in self._locations.get(path, []):
+            if container is None:
+                container = self._root()
+
+            if isinstance(container, dict):
+                value = container[key]
+            else:
+                value = getattr(container, key)
+
+            if value is not None:
+                values.append(value)
+
+        return values
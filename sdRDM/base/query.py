@@ -0,0 +1,448 @@
+import ast
+import operator
+
+import numpy as np
+
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from sdRDM.base.fieldtable import unwrap_annotated
+from sdRDM.base.listplus import ListPlus
+from sdRDM.base.walker import walk_meta
+
+NUMERIC_TYPES = (int, float, bool)
+
+COMPARATORS = {
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+}
+
+MIRRORED = {
+    ast.Lt: ast.Gt,
+    ast.LtE: ast.GtE,
+    ast.Gt: ast.Lt,
+    ast.GtE: ast.LtE,
+    ast.Eq: ast.Eq,
+    ast.NotEq: ast.NotEq,
+}
+
+
+class MetaField:
+    """Describes a field of a data model class found at a meta path"""
+
+    def __init__(self, owner, name: str, dtype):
+        annotation = owner.model_fields[name].annotation
+
+        self.name = name
+        self.dtype = dtype
+        self.is_multiple = get_origin(annotation) is list
+        self.is_numeric = not self.is_multiple and any(
+            unwrap_annotated(subtype) in NUMERIC_TYPES
+            for subtype in (annotation, *get_args(annotation))
+        )
+
+
+@lru_cache(maxsize=32)
+def _meta_table(cls) -> Dict[str, MetaField]:
+    """Maps all meta paths of a class to their field descriptions"""
+
+    return {
+        path.lstrip("/"): MetaField(owner, name, dtype)
+        for path, owner, name, dtype in walk_meta(cls)
+    }
+
+
+class CompiledQuery:
+    """A query that has been compiled against the meta tree of a root class.
+
+    The query is executed in three steps. First, the rows are collected by
+    following the path up to the last wildcard ('*'). Second, the where clause
+    is evaluated for all rows at once as NumPy masks. Finally, the remainder
+    of the path is followed from the matching rows and, if given, the projected
+    attributes are extracted as arrays.
+    """
+
+    def __init__(
+        self,
+        cls,
+        path: str,
+        where: Optional[str] = None,
+        project: Union[str, Tuple[str, ...], None] = None,
+    ):
+        self.table = _meta_table(cls)
+
+        segments = [segment for segment in path.strip("/").split("/") if segment]
+
+        if not segments or segments == ["*"]:
+            raise ValueError(f"Query path '{path}' does not point to any attribute.")
+
+        if "*" in segments:
+            split = len(segments) - segments[::-1].index("*") - 1
+            row_segments = segments[:split]
+            tail_segments = segments[split + 1 :]
+        else:
+            row_segments, tail_segments = segments, []
+
+        row_segments = [segment for segment in row_segments if segment != "*"]
+
+        self.row_fields = self._resolve_path(row_segments, path)
+        self.tail_fields = self._resolve_path(
+            tail_segments, path, prefix=row_segments
+        )
+
+        row_type = self.row_fields[-1].dtype
+        result_field = (self.tail_fields or self.row_fields)[-1]
+
+        if "*" in segments and not self.row_fields[-1].is_multiple:
+            raise ValueError(
+                f"Wildcard in query path '{path}' must follow an attribute with multiple objects."
+            )
+
+        if where is not None and row_type is None:
+            raise ValueError(
+                f"Query path '{path}' does not select objects that can be filtered."
+            )
+
+        if project is not None and result_field.dtype is None:
+            raise ValueError(
+                f"Query path '{path}' does not select objects that can be projected."
+            )
+
+        self.result_field = result_field
+        self.mask = None if where is None else self._compile_where(where, row_segments)
+
+        if isinstance(project, str):
+            self.project = self._resolve_attribute(project, segments)
+            self.project_many = False
+        elif project is not None:
+            self.project = {
+                name: self._resolve_attribute(name, segments) for name in project
+            }
+            self.project_many = True
+        else:
+            self.project = None
+
+    def run(self, root: "DataModel"):
+        """Executes the query on an instance of the root class"""
+
+        rows = _follow([root], self.row_fields)
+
+        if self.mask is not None and rows:
+            mask = np.broadcast_to(self.mask(rows), (len(rows),))
+            rows = [rows[index] for index in np.flatnonzero(mask)]
+
+        results = _follow(rows, self.tail_fields)
+
+        if self.project is None:
+            if self.result_field.is_numeric:
+                return _to_array(results, numeric=True)
+
+            return ListPlus(*results)
+        elif self.project_many:
+            return {
+                name: _column(results, fields) for name, fields in self.project.items()
+            }
+
+        return _column(results, self.project)
+
+    # ! Compilation
+    def _resolve_path(
+        self,
+        segments: List[str],
+        path: str,
+        prefix: Optional[List[str]] = None,
+    ) -> List[MetaField]:
+        """Resolves path segments to field descriptions of the meta tree"""
+
+        fields = []
+        segments = [segment for segment in segments if segment != "*"]
+
+        for index, segment in enumerate(segments):
+            meta_path = "/".join([*(prefix or []), *segments[: index + 1]])
+
+            if meta_path not in self.table:
+                raise ValueError(
+                    f"Attribute '{segment}' of query path '{path}' does not exist in the model."
+                )
+
+            field = self.table[meta_path]
+
+            if index < len(segments) - 1 and field.dtype is None:
+                raise ValueError(
+                    f"Attribute '{segment}' of query path '{path}' has no sub-attributes."
+                )
+
+            fields.append(field)
+
+        return fields
+
+    def _resolve_attribute(self, name: str, prefix: List[str]) -> List[MetaField]:
+        """Resolves a dotted attribute relative to the objects found at prefix"""
+
+        prefix = [segment for segment in prefix if segment != "*"]
+        fields = self._resolve_path(name.split("."), name, prefix=prefix)
+
+        if any(field.is_multiple for field in fields[:-1]):
+            raise ValueError(
+                f"Attribute '{name}' must not pass through attributes with multiple values."
+            )
+
+        return fields
+
+    def _compile_where(self, where: str, prefix: List[str]) -> Callable:
+        """Compiles a where clause into a function that returns a boolean mask"""
+
+        try:
+            expression = ast.parse(where, mode="eval").body
+        except SyntaxError as e:
+            raise ValueError(f"Invalid where clause '{where}': {e.msg}")
+
+        return self._compile_node(expression, where, prefix)
+
+    def _compile_node(self, node: ast.AST, where: str, prefix: List[str]) -> Callable:
+        """Recursively compiles a node of a where clause"""
+
+        if isinstance(node, ast.BoolOp):
+            operands = [self._compile_node(value, where, prefix) for value in node.values]
+            combine = np.logical_and if isinstance(node.op, ast.And) else np.logical_or
+
+            def _bool_op(rows):
+                mask = operands[0](rows)
+                for operand in operands[1:]:
+                    mask = combine(mask, operand(rows))
+                return mask
+
+            return _bool_op
+
+        elif isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+            operand = self._compile_node(node.operand, where, prefix)
+            return lambda rows: np.logical_not(operand(rows))
+
+        elif isinstance(node, ast.Compare):
+            comparisons = []
+            left = node.left
+
+            for op, right in zip(node.ops, node.comparators):
+                comparisons.append(self._compile_comparison(left, op, right, where, prefix))
+                left = right
+
+            def _compare(rows):
+                mask = comparisons[0](rows)
+                for comparison in comparisons[1:]:
+                    mask = np.logical_and(mask, comparison(rows))
+                return mask
+
+            return _compare
+
+        elif isinstance(node, (ast.Name, ast.Attribute)):
+            column = self._compile_operand(node, where, prefix)
+
+            def _truth(rows):
+                values = column(rows)
+                return np.logical_and(np.asarray(values, dtype=bool), _is_set(values))
+
+            return _truth
+
+        raise ValueError(
+            f"Unsupported expression '{ast.unparse(node)}' in where clause '{where}'."
+        )
+
+    def _compile_comparison(self, left, op, right, where: str, prefix: List[str]):
+        """Compiles a single binary comparison"""
+
+        if isinstance(op, (ast.In, ast.NotIn)):
+            column = self._compile_operand(left, where, prefix)
+            values = _literal(right, where)
+
+            if not isinstance(values, (list, tuple, set)):
+                raise ValueError(
+                    f"Right side of 'in' must be a collection in where clause '{where}'."
+                )
+
+            invert = isinstance(op, ast.NotIn)
+            values = list(values)
+
+            def _membership(rows):
+                entries = column(rows)
+                return np.logical_and(np.isin(entries, values, invert=invert), _is_set(entries))
+
+            return _membership
+
+        if type(op) not in COMPARATORS:
+            raise ValueError(
+                f"Unsupported operator '{type(op).__name__}' in where clause '{where}'."
+            )
+
+        if _is_literal(left) and not _is_literal(right):
+            left, right, op = right, left, MIRRORED[type(op)]()
+
+        compare = COMPARATORS[type(op)]
+        lhs = self._compile_operand(left, where, prefix)
+        rhs = self._compile_operand(right, where, prefix)
+
+        def _comparison(rows):
+            left, right = lhs(rows), rhs(rows)
+            present = np.logical_and(_is_set(left), _is_set(right))
+
+            if np.all(present):
+                with np.errstate(invalid="ignore"):
+                    return np.asarray(compare(left, right), dtype=bool)
+
+            # Unset entries are not compared, such that they don't match any comparison
+            mask = np.zeros(len(present), dtype=bool)
+
+            with np.errstate(invalid="ignore"):
+                mask[present] = compare(_subset(left, present), _subset(right, present))
+
+            return mask
+
+        return _comparison
+
+    def _compile_operand(self, node, where: str, prefix: List[str]) -> Callable:
+        """Compiles an operand to a function returning a column or a constant"""
+
+        if _is_literal(node):
+            value = _literal(node, where)
+            return lambda rows: value
+
+        fields = self._resolve_attribute(_dotted_name(node, where), prefix)
+
+        return lambda rows: _column(rows, fields)
+
+
+def compile_query(
+    cls,
+    path: str,
+    where: Optional[str] = None,
+    project: Union[str, List[str], None] = None,
+) -> CompiledQuery:
+    """Compiles a query against the given root class.
+
+    Compiled queries are cached, thus repeated queries only pay for the execution.
+
+    Args:
+        cls (Type[DataModel]): Root class the query is executed on.
+        path (str): Meta path to the selected objects or values. A '*' marks the rows the where clause is applied to.
+        where (Optional[str]): Boolean expression over the attributes of the rows, e.g. 'temperature > 300'.
+        project (Union[str, List[str], None]): Attribute(s) of the selected objects to return as arrays.
+    """
+
+    if isinstance(project, list):
+        project = tuple(project)
+
+    return _compile_query(cls, path, where, project)
+
+
+@lru_cache(maxsize=256)
+def _compile_query(cls, path, where, project) -> CompiledQuery:
+    return CompiledQuery(cls, path, where, project)
+
+
+def _follow(objects: List[Any], fields: List[MetaField]) -> List[Any]:
+    """Follows fields from the given objects and flattens multiple objects"""
+
+    for field in fields:
+        values = []
+
+        for obj in objects:
+            value = obj.__dict__.get(field.name)
+
+            if value is None:
+                continue
+            elif field.is_multiple and field.dtype is not None:
+                values.extend(value)
+            else:
+                values.append(value)
+
+        objects = values
+
+    return objects
+
+
+def _column(objects: List[Any], fields: List[MetaField]) -> np.ndarray:
+    """Extracts the values of a (nested) attribute for all objects as an array"""
+
+    values = objects
+
+    for field in fields:
+        values = [
+            None if value is None else value.__dict__.get(field.name)
+            for value in values
+        ]
+
+    return _to_array(values, numeric=fields[-1].is_numeric)
+
+
+def _is_set(values: Any) -> Union[bool, np.ndarray]:
+    """Mask of the entries of a column that are set. Constants are always set."""
+
+    if not isinstance(values, np.ndarray):
+        return True
+    elif values.dtype == object:
+        return np.not_equal(values, None)
+
+    return ~np.isnan(values)
+
+
+def _subset(values: Any, mask: np.ndarray) -> Any:
+    """Selects the masked entries of a column, while constants are kept"""
+
+    return values[mask] if isinstance(values, np.ndarray) else values
+
+
+def _to_array(values: List[Any], numeric: bool) -> np.ndarray:
+    """Converts values into an array. Numeric values use NaN for unset entries."""
+
+    if numeric:
+        return np.array(
+            [np.nan if value is None else value for value in values],
+            dtype=float,
+        )
+
+    array = np.empty(len(values), dtype=object)
+    array[:] = values
+
+    return array
+
+
+def _is_literal(node) -> bool:
+    if isinstance(node, ast.UnaryOp):
+        return isinstance(node.op, (ast.USub, ast.UAdd)) and _is_literal(node.operand)
+
+    return isinstance(node, (ast.Constant, ast.List, ast.Tuple, ast.Set))
+
+
+def _literal(node, where: str) -> Any:
+    try:
+        return ast.literal_eval(node)
+    except ValueError:
+        raise ValueError(
+            f"Expected a literal, got '{ast.unparse(node)}' in where clause '{where}'."
+        )
+
+
+def _dotted_name(node, where: str) -> str:
+    """Turns a name or attribute access into a dotted attribute path"""
+
+    if isinstance(node, ast.Name):
+        return node.id
+    elif isinstance(node, ast.Attribute):
+        return f"{_dotted_name(node.value, where)}.{node.attr}"
+
+    raise ValueError(
+        f"Unsupported operand '{ast.unparse(node)}' in where clause '{where}'."
+    )
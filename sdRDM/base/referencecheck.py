@@ -1,5 +1,7 @@
 from typing import Tuple, Dict, Optional
 
+from sdRDM.base.fieldtable import get_field_table
+
 
 def object_is_compliant_to_references(obj) -> Dict:
     """Checks if individual fields that have been set are compliant to their references, if specified"""
@@ -67,16 +69,7 @@ def traverse_to_root_node(obj: "DataModel", root: str) -> Optional["DataModel"]:
 
 def get_fields_to_check(obj: "DataModel") -> Dict:
     """Extracts all fields and their corresponding compliance check"""
-    checks = {}
-    for name, field in obj.__class__.model_fields.items():
-        if not has_reference_check(field):
-            continue
-
-        root, path = get_field_reference_check(field)
-
-        checks[name] = (root, path)
-
-    return checks
+    return get_field_table(obj.__class__).reference_checks
 
 
 def has_reference_check(field) -> bool:
@@ -0,0 +1,282 @@
+import hashlib
+
+import numpy as np
+
+from typing import IO, Any, Dict, List, Tuple, Union, get_args, get_origin
+from enum import Enum
+from pydantic import ConfigDict, EmailStr, TypeAdapter
+
+from sdRDM.base.fieldtable import unwrap_annotated
+from sdRDM.base.listplus import ListPlus
+from sdRDM.base.tree import _is_data_model
+
+# Types whose JSON representation equals their Python representation
+NATIVE_TYPES = (str, int, float, bool, Any, type(None), EmailStr)
+
+# Name of the class attribute the construction plan is stored at
+PLAN_ATTRIBUTE = "__sdrdm_construction_plan__"
+
+
+def construct_trusted(cls, data: Dict) -> "DataModel":
+    """Constructs an object from previously exported data without validation.
+
+    The data is expected to be the output of an sdRDM export of the same
+    library, thus field values are assigned as they are. Only the internal
+    state that is usually created during validation is restored. Sub-objects,
+    'ListPlus' containers, parent relations, units and arrays are rebuilt
+    directly and values whose JSON representation differs from their Python
+    type (e.g. dates or URLs) are converted by their type only.
+
+    Args:
+        cls (Type[DataModel]): Class to construct.
+        data (Dict): Exported representation of the object.
+
+    Returns:
+        DataModel: The constructed object.
+    """
+
+    check_source(cls, data)
+
+    return _construct(cls, data)
+
+
+def verify_checksum(content: Union[str, bytes], checksum: str) -> None:
+    """Checks the SHA-256 checksum of a document before it is loaded.
+
+    Args:
+        content (Union[str, bytes]): Raw content of the document.
+        checksum (str): Expected hexadecimal SHA-256 digest of the content.
+    """
+
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+
+    _compare_digest(hashlib.sha256(content).hexdigest(), checksum)
+
+
+class ChecksumReader:
+    """Wraps a file handler to compute the SHA-256 checksum of its content while it is read.
+
+    Allows parsers that read in chunks to verify a checksum without holding
+    the whole content in memory. Text is hashed in its UTF-8 encoding.
+
+    Args:
+        handler (IO): Text or binary file handler to read from.
+    """
+
+    def __init__(self, handler: IO):
+        self.handler = handler
+        self.hasher = hashlib.sha256()
+
+    def read(self, size: int = -1) -> Union[str, bytes]:
+        chunk = self.handler.read(size)
+        self.hasher.update(chunk.encode("utf-8") if isinstance(chunk, str) else chunk)
+
+        return chunk
+
+    def verify(self, checksum: str) -> None:
+        """Reads the remaining content and compares its digest to the checksum"""
+
+        while self.read(1 << 16):
+            pass
+
+        _compare_digest(self.hasher.hexdigest(), checksum)
+
+
+def _compare_digest(given: str, checksum: str) -> None:
+    """Raises if a computed digest does not match the expected checksum"""
+
+    if given != checksum.lower():
+        raise ValueError(
+            f"Checksum mismatch: Expected '{checksum}', but content has '{given}'."
+        )
+
+
+def _construct(cls, data: Dict) -> "DataModel":
+    """Recursively constructs an object and its sub-objects"""
+
+    values = {}
+
+    for name, key, kind, payload in _get_construction_plan(cls):
+        if key in data:
+            value = data[key]
+        elif name in data:
+            value = data[name]
+        else:
+            continue
+
+        if value is not None:
+            value = _convert(value, kind, payload)
+
+        values[name] = value
+
+    obj = cls.model_construct(**values)
+    obj._setup_relations()
+
+    if _is_unit_class(cls):
+        obj.create_astropy_unit()
+
+    return obj
+
+
+def _convert(value: Any, kind: str, payload: Any) -> Any:
+    """Converts a single exported value according to its construction kind"""
+
+    if isinstance(value, list):
+        if kind == "ndarray":
+            return np.array(value)
+        elif kind == "raw":
+            return ListPlus._from_values(value)
+        elif kind == "adapt":
+            return ListPlus._from_values(payload.adapter.validate_python(value))
+
+        return ListPlus._from_values([_convert(element, kind, payload) for element in value])
+    elif kind == "object" and isinstance(value, dict):
+        return _construct(select_type(payload, value), value)
+    elif kind == "unit" and isinstance(value, str):
+        return payload.from_string(value) if value != "" else None
+    elif kind == "unit" and isinstance(value, dict):
+        return _construct(payload, value)
+    elif kind == "adapt" and type(value) not in payload.natives:
+        return payload.adapter.validate_python(value)
+
+    return value
+
+
+def select_type(candidates: Tuple, value: Dict):
+    """Selects the class of a sub-object by its exported JSON-LD type.
+
+    Args:
+        candidates (Tuple[Type[DataModel], ...]): Classes the field accepts.
+        value (Dict): Exported representation of the sub-object.
+
+    Returns:
+        Type[DataModel]: The class named by '@type' or the first candidate.
+    """
+
+    if len(candidates) == 1:
+        return candidates[0]
+
+    types = value.get("@type", [])
+
+    return next(
+        (dtype for dtype in candidates if types and dtype.__name__ == types[0]),
+        candidates[0],
+    )
+
+
+def _get_construction_plan(cls) -> List[Tuple[str, str, str, Any]]:
+    """Returns the construction plan of a class and determines it upon first use.
+
+    As the field table, the plan is stored on the class itself, such that it
+    is released along with dynamically generated libraries and not inherited
+    by sub-classes.
+    """
+
+    plan = cls.__dict__.get(PLAN_ATTRIBUTE)
+
+    if plan is None:
+        plan = _construction_plan(cls)
+        setattr(cls, PLAN_ATTRIBUTE, plan)
+
+    return plan
+
+
+def _construction_plan(cls) -> List[Tuple[str, str, str, Any]]:
+    """Determines how each field of a class is constructed"""
+
+    from sdRDM.base.datatypes import Unit
+
+    plan = []
+
+    for name, field in cls.model_fields.items():
+        annotation = field.annotation
+        subtypes = [
+            unwrap_annotated(dtype)
+            for dtype in (get_args(annotation) or (annotation,))
+        ]
+        dtypes = tuple(
+            dtype
+            for dtype in subtypes
+            if isinstance(dtype, type) and _is_data_model(dtype)
+        )
+
+        if Unit in subtypes:
+            kind, payload = "unit", Unit
+        elif dtypes:
+            kind, payload = "object", dtypes
+        elif any(getattr(dtype, "__name__", None) == "ndarray" for dtype in subtypes):
+            kind, payload = "ndarray", None
+        elif all(_is_native(dtype) for dtype in subtypes):
+            kind, payload = "raw", None
+        else:
+            kind, payload = "adapt", _Adapter(annotation, subtypes)
+
+        plan.append((name, field.alias or name, kind, payload))
+
+    return plan
+
+
+class _Adapter:
+    """Converts values of types that are not represented natively in JSON.
+
+    Values that already match a native member of a union are kept as they are,
+    analogous to pydantic's smart union mode.
+    """
+
+    def __init__(self, annotation, subtypes: List[Any]):
+        self.adapter = TypeAdapter(
+            annotation,
+            config=ConfigDict(arbitrary_types_allowed=True),
+        )
+        self.natives = tuple(dtype for dtype in subtypes if dtype in NATIVE_TYPES)
+
+
+def _is_unit_class(cls) -> bool:
+    from sdRDM.base.datatypes import Unit
+
+    return issubclass(cls, Unit)
+
+
+def _is_native(dtype) -> bool:
+    """Checks whether a type can be taken as is from its JSON representation"""
+
+    if dtype in NATIVE_TYPES:
+        return True
+    elif isinstance(dtype, type) and issubclass(dtype, Enum):
+        # Enums are stored by their value
+        return True
+    elif get_origin(dtype) in (list, List):
+        return all(_is_native(unwrap_annotated(arg)) for arg in get_args(dtype))
+
+    return False
+
+
+def check_source(cls, data: Dict) -> None:
+    """Ensures that data stamped with a source has been written by this library.
+
+    Args:
+        cls (Type[DataModel]): Class the data is loaded into.
+        data (Dict): Data holding the source under '__source__', if stamped.
+
+    Raises:
+        ValueError: If the repository or commit of the source does not match the class.
+    """
+
+    source = data.get("__source__")
+
+    if not isinstance(source, dict):
+        return
+
+    private = cls.__private_attributes__
+    expected = {
+        "repo": private["_repo"].default if "_repo" in private else None,
+        "commit": private["_commit"].default if "_commit" in private else None,
+    }
+
+    for key, value in expected.items():
+        if value is not None and source.get(key) not in (None, value):
+            raise ValueError(
+                f"Data has been written by {key} '{source[key]}', but '{cls.__name__}' "
+                f"stems from '{value}'. Trusted loading requires matching sources."
+            )
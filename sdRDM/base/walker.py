@@ -0,0 +1,128 @@
+from typing import Any, Iterator, List, Optional, Tuple, get_args
+
+from sdRDM.base.tree import _is_data_model
+
+
+def walk(
+    obj: "DataModel",
+    leaves: bool = False,
+    prefix: str = "",
+) -> Iterator[Tuple[str, Any, Any, Any]]:
+    """Lazily walks the object graph of an instantiated data model.
+
+    Unlike a walk over the output of `to_dict`, no intermediate representation
+    of the model is built. Unset values as well as empty lists and dictionaries
+    are skipped, analogous to the export.
+
+    Args:
+        obj (DataModel): Object to start the walk from.
+        leaves (bool): If True, only values that are not traversed any further are yielded.
+        prefix (str): Path that is prepended to all yielded paths.
+
+    Yields:
+        Tuple[str, Any, Any, Any]: The absolute path, the parent object, the attribute (or index) and the value.
+    """
+
+    for name in obj.model_fields:
+        value = obj.__dict__.get(name)
+
+        if _is_unset(value):
+            continue
+
+        yield from _walk_value(f"{prefix}/{name}", obj, name, value, leaves)
+
+
+def _walk_value(
+    path: str,
+    parent: Any,
+    attribute: Any,
+    value: Any,
+    leaves: bool,
+) -> Iterator[Tuple[str, Any, Any, Any]]:
+    """Yields a single value and descends into it, if it is a container"""
+
+    is_container = _is_container(value)
+
+    if not leaves or not is_container:
+        yield path, parent, attribute, value
+
+    if not is_container:
+        return
+
+    if _is_data_model(value):
+        yield from walk(value, leaves, path)
+    elif isinstance(value, dict):
+        for key, subvalue in value.items():
+            if not _is_unset(subvalue):
+                yield from _walk_value(f"{path}/{key}", value, key, subvalue, leaves)
+    else:
+        for index, element in enumerate(value):
+            yield from _walk_value(f"{path}/{index}", value, index, element, leaves)
+
+
+def _is_unset(value: Any) -> bool:
+    """Checks whether a value is skipped by the walker"""
+
+    return value is None or (isinstance(value, (list, dict)) and not value)
+
+
+def _is_container(value: Any) -> bool:
+    """Checks whether a value is traversed by the walker"""
+
+    if _is_data_model(value):
+        return True
+    elif isinstance(value, dict):
+        return True
+    elif isinstance(value, list):
+        return all(_is_data_model(element) for element in value)
+
+    return False
+
+
+def walk_meta(
+    cls,
+    prefix: str = "",
+    _ancestors: Tuple = (),
+) -> Iterator[Tuple[str, Any, str, Optional[Any]]]:
+    """Lazily walks the fields of a data model class and all of its sub-classes.
+
+    Args:
+        cls (Type[DataModel]): Class to start the walk from.
+        prefix (str): Meta path that is prepended to all yielded meta paths.
+
+    Yields:
+        Tuple[str, Any, str, Optional[Any]]: The meta path, the owning class, the attribute and
+        the class of the attribute, if the walk descends into it. Otherwise None.
+    """
+
+    ancestors = (*_ancestors, cls)
+
+    for name, field in cls.model_fields.items():
+        path = f"{prefix}/{name}"
+        dtype = _get_descendable_type(field, ancestors)
+
+        yield path, cls, name, dtype
+
+        if dtype is not None:
+            yield from walk_meta(dtype, path, ancestors)
+
+
+def _get_descendable_type(field, ancestors: Tuple) -> Optional[Any]:
+    """Returns the data model type of a field, if the walk should descend into it"""
+
+    extra = field.json_schema_extra
+
+    if extra and extra.get("reference"):
+        return None
+
+    candidates: List[Any] = [field.annotation, *get_args(field.annotation)]
+    dtypes = [
+        dtype
+        for dtype in candidates
+        if isinstance(dtype, type) and _is_data_model(dtype)
+    ]
+
+    if not dtypes or dtypes[0] in ancestors or not dtypes[0].model_fields:
+        return None
+
+    return dtypes[0]
@@ -5,7 +5,9 @@ from enum import Enum
 from typing import List, Optional
 import validators
 
+from pydantic_xml.element import SearchMode
 from sdRDM.base.datamodel import DataModel
+from sdRDM.base.ioutils.compression import split_compression
 from sdRDM.markdown.markdownparser import MarkdownParser
 from sdRDM.generator.codegen import generate_python_api
 from sdRDM.generator.schemagen import generate_mermaid_schema
@@ -48,6 +50,10 @@ def generate(
         default=False,
         help="Generate JSON schemes for the API",
     ),
+    search_mode: Optional[SearchMode] = typer.Option(
+        default=None,
+        help="XML search mode of the generated classes. Overrides 'xml-search-mode' of the frontmatter. Classes with an ambiguous element order and models without either use 'unordered'.",
+    ),
 ):
     """Generates a Python API based on the Markdown fiels found in the path.
 
@@ -55,6 +61,7 @@ def generate(
         path (str, optional): Path to the data model specifications.
         out (str, optional): Destination where the Software will be written.
         name (str, optional): Name of the resulting software model.
+        search_mode (Optional[SearchMode]): XML search mode of the generated classes.
     """
 
     if not all([url, commit]):
@@ -71,6 +78,7 @@ def generate(
         commit=commit,
         url=url,
         json_schemes=json_schemes,
+        search_mode=search_mode.value if search_mode else None,
     )
 
 
@@ -106,7 +114,7 @@ def validate(
     ),
     format: Optional[Dialects] = typer.Option(
         default=None,
-        help="Format of the file to validate. If not given, the format will be inferred from the file extension.",
+        help="Format of the file to validate. If not given, the format will be inferred from the file extension, which may be followed by '.gz', '.bz2' or '.xz'.",
     ),
 ):
     """Validates a given file against a schema.
@@ -149,7 +157,8 @@ def _validate_single_file(
         parse_fun = format.value
 
     try:
-        parse_fun(model)(open(file))
+        # Loaders open paths themselves and decompress them if necessary
+        parse_fun(model)(file)
         print(f"🎉 File '{file}' is valid.")
     except Exception as e:
         print(f"❌ File {file} is not valid.")
@@ -157,8 +166,9 @@ def _validate_single_file(
 
 
 def _infer_extension(file: str) -> str:
-    """Infers the extension of a file"""
-    _, ext = os.path.splitext(file)
+    """Infers the extension of a file, skipping compression extensions such as '.json.gz'"""
+    base, _ = split_compression(file)
+    _, ext = os.path.splitext(base)
     ext = ext.lower().lstrip(".")
 
     try:
@@ -2,7 +2,7 @@ import re
 import validators
 
 from copy import deepcopy
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 from jinja2 import Template
 from importlib import resources as pkg_resources
 
@@ -24,6 +24,7 @@ def render_object(
     commit: Optional[str] = None,
     small_types: Dict = {},
     add_id_field: bool = True,
+    search_mode: Optional[str] = None,
 ) -> str:
     """Renders a class of type object coming from a parsed Markdown model"""
 
@@ -43,6 +44,7 @@ def render_object(
                     commit=commit,
                     namespaces=namespaces,
                     add_id_field=add_id_field,
+                    search_mode=search_mode,
                 )
                 for subtype in small_types.values()
                 if subtype["origin"] == object["name"]
@@ -60,6 +62,7 @@ def render_object(
         commit=commit,
         namespaces=namespaces,
         add_id_field=add_id_field,
+        search_mode=search_mode,
     )
 
     methods_part = render_add_methods(
@@ -103,9 +106,18 @@ def render_class(
     add_id_field: bool,
     repo: Optional[str] = None,
     commit: Optional[str] = None,
+    search_mode: Optional[str] = None,
 ) -> str:
     """Takes an object definition and returns a rendered string"""
 
+    search_mode = infer_search_mode(object, objects, search_mode)
+
+    raw_xml_attributes = [
+        attribute["name"]
+        for _, attribute in _inherited_attributes(object, objects)
+        if "RawXML" in attribute["type"]
+    ]
+
     object = deepcopy(object)
     template = Template(
         pkg_resources.read_text(jinja_templates, "class_template.jinja2")
@@ -139,9 +151,77 @@ def render_class(
         commit=commit,
         namespaces=namespaces,
         add_id_field=add_id_field,
+        search_mode=search_mode,
+        raw_xml_attributes=raw_xml_attributes,
     )
 
 
+def infer_search_mode(
+    object: Dict,
+    objects: List[Dict],
+    requested: Optional[str] = None,
+) -> str:
+    """Returns the XML search mode the elements of an object are parsed with.
+
+    Defaults to 'unordered', since documents of other tools or older versions
+    may not follow the attribute order and pydantic-xml silently skips
+    elements out of order in the other modes. A requested mode such as
+    'ordered' or 'strict' is only applied if the attributes can be searched in
+    their order, inherited ones first. This does not hold if attributes
+    sharing a tag or wrapper element are separated by others, since wrappers
+    are then merged or split depending on the search mode.
+
+    Args:
+        object (Dict): Object to return the search mode for.
+        objects (List[Dict]): All objects of the model, to resolve parents.
+        requested (Optional[str]): Search mode requested for all objects.
+
+    Returns:
+        str: Search mode of the object.
+    """
+
+    if requested in (None, "unordered"):
+        return "unordered"
+
+    previous, closed = None, set()
+
+    for obj_name, attribute in _inherited_attributes(object, objects):
+        if _get_field_type(attribute) == "attr":
+            continue
+
+        tag = _extract_xml_alias(attribute)
+
+        if obj_name in (tag.split("/")[-1], "/".join(tag.split("/")[:-1])):
+            # Leaf attributes are the text of the element
+            continue
+
+        root = tag.split("/")[0]
+
+        if root in closed:
+            return "unordered"
+        elif root != previous:
+            closed.add(previous)
+            previous = root
+
+    return requested
+
+
+def _inherited_attributes(object: Dict, objects: List[Dict]) -> List[Tuple[str, Dict]]:
+    """Returns the attributes of an object and its parents along with the name of their owner"""
+
+    attributes, visited = [], set()
+    current = object
+
+    while current is not None and current["name"] not in visited:
+        visited.add(current["name"])
+        attributes = [(current["name"], attr) for attr in current["attributes"]] + attributes
+        current = next(
+            (obj for obj in objects if obj["name"] == current.get("parent")), None
+        )
+
+    return attributes
+
+
 def render_attribute(
     attribute: Dict,
     objects: List[Dict],
@@ -5,6 +5,7 @@ import sys
 
 from glob import glob
 from typing import List, Dict, Optional
+from pydantic_xml.element import SearchMode
 from sdRDM.generator.utils import extract_modules
 from sdRDM.markdown.markdownparser import MarkdownParser
 from sdRDM.tools.gitutils import _import_library
@@ -25,6 +26,7 @@ def generate_python_api(
     only_classes: bool = False,
     use_formatter: bool = True,
     json_schemes: bool = False,
+    search_mode: Optional[str] = None,
 ) -> Optional[MarkdownParser]:
     """Generates a Python API based on a markdown model, which is parsed
     and code generated based on the specifications.
@@ -33,6 +35,7 @@ def generate_python_api(
         path (str): Path to the markdown model.
         dirpath (str): Directory to which the library will be written
         libname (str): Name of the libary which will be used as directory name.
+        search_mode (Optional[str]): XML search mode of all classes whose element order is unambiguous. Overrides the 'xml-search-mode' of the frontmatter. Defaults to 'unordered'.
     """
 
     # Check if there are multiple models
@@ -43,6 +46,9 @@ def generate_python_api(
     else:
         parser = MarkdownParser.parse(open(path))
 
+    if search_mode is not None:
+        parser.search_mode = SearchMode(search_mode).value
+
     if only_classes:
         return parser
 
@@ -81,6 +87,7 @@ def generate_api_from_parser(
         namespaces=parser.namespaces,
         prefixes=parser.prefixes,
         add_id_field=parser.add_id_field,
+        search_mode=parser.search_mode,
     )
 
     # Write init files
@@ -116,6 +123,7 @@ def write_classes(
     repo: Optional[str] = None,
     commit: Optional[str] = None,
     add_id_field: bool = True,
+    search_mode: Optional[str] = None,
 ) -> None:
     """Renders classes that were parsed from a markdown model and creates a library."""
 
@@ -138,6 +146,7 @@ def write_classes(
             namespaces=namespaces,
             add_id_field=add_id_field,
             prefixes=prefixes,
+            search_mode=search_mode,
         )
         path = os.path.join(libpath, "core", f"{object['name'].lower()}.py")
         save_rendered_to_file(rendered, path, use_formatter)
@@ -2,10 +2,11 @@ from io import StringIO
 import re
 
 import frontmatter
-from typing import List, Tuple, Dict, IO
+from typing import List, Optional, Tuple, Dict, IO
 from markdown_it import MarkdownIt
 from markdown_it.token import Token
 from pydantic import BaseModel
+from pydantic_xml.element import SearchMode
 
 from sdRDM.generator.utils import camel_to_snake
 
@@ -22,6 +23,7 @@ class MarkdownParser(BaseModel):
     namespaces: Dict = {}
     prefixes: Dict = {}
     add_id_field: bool = True
+    search_mode: Optional[str] = None
 
     @classmethod
     def parse(cls, handle: IO):
@@ -37,6 +39,9 @@ class MarkdownParser(BaseModel):
         parser.add_id_field = metadata.get("id-field", True)  # type: ignore
         parser.prefixes = metadata.get("prefixes", {})  # type: ignore
 
+        if "xml-search-mode" in metadata:
+            parser.search_mode = SearchMode(metadata["xml-search-mode"]).value
+
         doc = MarkdownIt().parse(parser._remove_header(content))
         modules, enumerations = parser.get_objects_and_enumerations(doc)
 
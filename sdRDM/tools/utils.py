@@ -1,6 +1,11 @@
 import re
 import yaml
 
+from typing import Dict, Optional
+
+# Key of the validation context, which marks objects deserialized from XML
+XML_CONTEXT_KEY = "sdrdm_from_xml"
+
 
 class YAMLDumper(yaml.Dumper):
     def increase_indent(self, flow=False, indentless=False):
@@ -61,3 +66,15 @@ def elem2dict(node):
         result[key] = value
 
     return result
+
+
+def xml_context(context: Optional[Dict] = None) -> Dict:
+    """Returns a validation context that marks objects as deserialized from XML"""
+
+    return {**(context or {}), XML_CONTEXT_KEY: True}
+
+
+def is_xml_context(context: Optional[Dict]) -> bool:
+    """Checks whether a validation context belongs to objects deserialized from XML"""
+
+    return bool(context) and context.get(XML_CONTEXT_KEY, False)
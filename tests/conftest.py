@@ -1,6 +1,9 @@
 from datetime import date, datetime
 import pytest
 import json
+import numpy as np
+
+from types import SimpleNamespace
 
 from sdRDM.base.datamodel import DataModel
 from tests.fixtures.code.enumutils import (
@@ -8,6 +11,7 @@ from tests.fixtures.code.enumutils import (
     _correct_enum_tokens,
     _incorrect_mapping_enum_tokens,
 )
+from tests.fixtures.code.modelutils import Batch, Reading, Sample, Spectrum
 from tests.fixtures.code.objectutils import (
     _attribute_token,
     _attribute_token_wrong_type,
@@ -79,6 +83,50 @@ def model_all_dataset(model_all):
     return dataset
 
 
+@pytest.fixture
+def model_spectrum():
+    """Returns a nested model that holds arrays and bytes"""
+    return Spectrum
+
+
+@pytest.fixture
+def model_spectrum_dataset(model_spectrum):
+    """Creates a nested dataset that holds arrays and bytes"""
+    return model_spectrum(
+        name="root",
+        data=np.arange(12, dtype=float).reshape(3, 4),
+        raw=b"x" * 2048,
+        spectra=[
+            model_spectrum(name="child", data=np.arange(5, dtype=np.int32)),
+            model_spectrum(name="small", raw=b"small"),
+        ],
+    )
+
+
+@pytest.fixture
+def model_samples():
+    """Returns a model of batches holding samples, which hold readings"""
+    return SimpleNamespace(Batch=Batch, Sample=Sample, Reading=Reading)
+
+
+@pytest.fixture
+def model_samples_dataset(model_samples):
+    """Creates a batch of 25 samples with a reading each"""
+    return model_samples.Batch(
+        id="batch",
+        name="Batch",
+        samples=[
+            model_samples.Sample(
+                id=f"s{index}",
+                name=f"sample{index}",
+                value=index / 2,
+                readings=[model_samples.Reading(id=f"r{index}", value=float(index))],
+            )
+            for index in range(25)
+        ],
+    )
+
+
 ## Enumutils fixtures
 @pytest.fixture
 def correct_enum_tokens():
@@ -105,6 +105,14 @@ def test_ns_map(model_all):
     ), "Namespace map does not match expected values"
 
 
+@pytest.mark.e2e
+def test_search_mode(model_all):
+    """Tests whether classes search their elements regardless of the order by default"""
+
+    assert model_all.Root.__xml_search_mode__ == "unordered"
+    assert model_all.Nested.__xml_search_mode__ == "unordered"
+
+
 @pytest.mark.e2e
 def test_no_id_field(model_no_id):
     """
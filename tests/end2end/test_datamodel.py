@@ -1,4 +1,9 @@
+import json
+import numpy as np
+import pytest
+
 from sdRDM import DataModel
+from sdRDM.base.walker import walk
 
 
 class TestGetMethod:
@@ -24,3 +29,392 @@ class TestGetMethod:
         assert all(isinstance(obj, model_all.Nested) for obj in nested_multiple_obj[0])
         assert all(obj.float_value in [0.0, 2.0] for obj in nested_multiple_obj[0])
         assert nested_multiple_obj_floats == [0.0, 2.0]
+
+    def test_get_method_reflects_model_changes(self, model_all):
+        """Tests whether the path index is updated when the model is modified"""
+
+        # Arrange
+        dataset = model_all.Root(
+            nested_multiple_obj=[model_all.Nested(float_value=0.0)],
+        )
+
+        # Act
+        before = dataset.get("nested_multiple_obj/float_value")
+
+        dataset.nested_multiple_obj.append(model_all.Nested(float_value=2.0))
+        after_append = dataset.get("nested_multiple_obj/float_value")
+
+        dataset.nested_multiple_obj[0].float_value = 1.0
+        after_setattr = dataset.get("nested_multiple_obj/float_value")
+
+        dataset.nested_single_obj = model_all.Nested(str_value="single")
+        after_assign = dataset.get("nested_single_obj/str_value")
+
+        # Assert
+        assert before == [0.0]
+        assert after_append == [0.0, 2.0]
+        assert after_setattr == [1.0, 2.0]
+        assert after_assign == ["single"]
+
+    def test_get_method_by_absolute_path(self, model_all):
+        """Tests whether absolute paths are resolved on the instance"""
+
+        # Arrange
+        dataset = model_all.Root(
+            nested_multiple_obj=[
+                model_all.Nested(str_value="first"),
+                model_all.Nested(str_value="second"),
+            ],
+        )
+
+        # Act
+        value = dataset.get("/nested_multiple_obj/1/str_value")
+
+        # Assert
+        assert value == "second"
+
+        with pytest.raises(AssertionError):
+            dataset.get("/nested_multiple_obj/2/str_value")
+
+
+class TestPaths:
+
+    def test_paths_of_instance(self, model_all):
+        """Tests whether the paths of an instance are those of its export"""
+
+        # Arrange
+        dataset = model_all.Root(
+            id="root",
+            multiple_primitives=[1.0, 2.0],
+            nested_single_obj=None,
+            leaf_element=None,
+            nested_multiple_obj=[model_all.Nested(id="nested", float_value=1.0)],
+        )
+
+        # Act
+        leaves = [str(path) for path in dataset.paths(leaves=True)]
+        paths = [str(path) for path in dataset.paths()]
+
+        # Assert
+        assert leaves == [
+            "/@id",
+            "/multiple_primitives/0",
+            "/multiple_primitives/1",
+            "/nested_multiple_obj/0/@id",
+            "/nested_multiple_obj/0/float_value",
+            "/nested_multiple_obj/0/@type/0",
+            "/nested_multiple_obj/0/@context/Nested",
+            "/@type/0",
+            "/@context/Root",
+        ]
+
+        assert paths[:5] == [
+            "/",
+            "/@id",
+            "/multiple_primitives",
+            "/multiple_primitives/0",
+            "/multiple_primitives/1",
+        ]
+        assert set(leaves) < set(paths)
+
+    def test_walk_skips_empty_values(self, model_all, tmp_path):
+        """Tests whether the walker skips empty lists and every path resolves via 'get'"""
+
+        # Arrange
+        pytest.importorskip("h5py")
+
+        dataset = model_all.Root(
+            id="root",
+            str_value="value",
+            multiple_primitives=[],
+            nested_single_obj=None,
+            leaf_element=None,
+            nested_multiple_obj=[],
+        )
+
+        # Act
+        leaves = [path for path, *_ in walk(dataset, leaves=True)]
+        dataset.hdf5(str(tmp_path / "dataset.h5"))
+
+        # Assert
+        assert leaves == ["/id", "/str_value"]
+        assert [dataset.get(path)[0] for path in leaves] == ["root", "value"]
+
+    def test_meta_paths_of_class(self, model_all):
+        """Tests whether the meta paths of a class cover nested objects"""
+
+        # Act
+        meta_paths = model_all.Root.meta_paths()
+        leaves = model_all.Root.meta_paths(leaves=True)
+
+        # Assert
+        assert "nested_multiple_obj" in meta_paths
+        assert "nested_multiple_obj" not in leaves
+        assert "nested_multiple_obj/float_value" in leaves
+        assert "leaf_element/some_attribute" in leaves
+
+
+class TestSelectMethod:
+
+    def _dataset(self, model_all):
+        return model_all.Root(
+            nested_multiple_obj=[
+                model_all.Nested(str_value=f"obj{i}", float_value=float(i), int_value=i % 2)
+                for i in range(6)
+            ],
+        )
+
+    def test_select_with_where_clause(self, model_all):
+        """Tests whether rows are filtered by a where clause"""
+
+        # Arrange
+        dataset = self._dataset(model_all)
+
+        # Act
+        selected = dataset.select(
+            "nested_multiple_obj", where="float_value > 2 and int_value == 1"
+        )
+
+        # Assert
+        assert [obj.str_value for obj in selected] == ["obj3", "obj5"]
+        assert all(
+            any(obj is original for original in dataset.nested_multiple_obj)
+            for obj in selected
+        )
+
+    def test_select_numeric_leaf_and_projection(self, model_all):
+        """Tests whether numeric leaves and projections are returned as arrays"""
+
+        # Arrange
+        dataset = self._dataset(model_all)
+
+        # Act
+        floats = dataset.select(
+            "nested_multiple_obj/*/float_value", where="str_value in ['obj1', 'obj4']"
+        )
+        projected = dataset.select(
+            "nested_multiple_obj",
+            where="1 <= float_value < 3",
+            project=["str_value", "int_value"],
+        )
+
+        # Assert
+        assert isinstance(floats, np.ndarray)
+        assert floats.tolist() == [1.0, 4.0]
+        assert projected["str_value"].tolist() == ["obj1", "obj2"]
+        assert projected["int_value"].tolist() == [1.0, 0.0]
+
+    def test_select_skips_unset_values(self, model_all):
+        """Tests whether unset attributes never match a where clause"""
+
+        # Arrange
+        dataset = model_all.Root(
+            nested_multiple_obj=[
+                model_all.Nested(str_value="set", float_value=1.0, int_value=1),
+                model_all.Nested(str_value="unset"),
+                model_all.Nested(float_value=2.0),
+            ],
+        )
+
+        def names(where):
+            return [
+                obj.str_value
+                for obj in dataset.select("nested_multiple_obj", where=where)
+            ]
+
+        # Assert
+        assert names("float_value") == ["set", None]
+        assert names("int_value") == ["set"]
+        assert names("float_value != 2") == ["set"]
+        assert names("str_value") == ["set", "unset"]
+        assert names("str_value >= 'set'") == ["set", "unset"]
+        assert names("str_value not in ['unset']") == ["set"]
+
+    def test_select_invalid_query(self, model_all):
+        """Tests whether invalid queries are rejected at compile time"""
+
+        # Arrange
+        dataset = self._dataset(model_all)
+
+        # Assert
+        with pytest.raises(ValueError):
+            dataset.select("nested_multiple_obj/*/unknown")
+
+        with pytest.raises(ValueError):
+            dataset.select("nested_multiple_obj", where="unknown > 1")
+
+        with pytest.raises(ValueError):
+            dataset.select("nested_multiple_obj", where="__import__('os')")
+
+
+class TestDiffMethod:
+
+    def _dataset(self, model_all):
+        return model_all.Root(
+            id="root",
+            str_value="string",
+            nested_single_obj=model_all.Nested(id="single", float_value=1.0),
+            leaf_element=model_all.LeafElement(id="leaf"),
+            nested_multiple_obj=[
+                model_all.Nested(id=f"nested{i}", float_value=float(i))
+                for i in range(3)
+            ],
+        )
+
+    def test_diff_of_identical_models(self, model_all):
+        """Tests whether identical models result in an empty patch"""
+
+        assert self._dataset(model_all).diff(self._dataset(model_all)) == []
+
+    def test_diff_and_apply_patch(self, model_all):
+        """Tests whether a patch turns one model into the other"""
+
+        # Arrange
+        old = self._dataset(model_all)
+        new = self._dataset(model_all)
+
+        new.str_value = "changed"
+        new.nested_multiple_obj[1].float_value = 10.0
+        new.nested_multiple_obj.pop(0)
+        new.nested_multiple_obj.append(model_all.Nested(id="added", int_value=1))
+
+        # Act
+        operations = old.diff(new)
+        old.apply_patch(json.dumps(operations))
+
+        # Assert
+        assert {op["path"] for op in operations} == {
+            "/str_value",
+            "/nested_multiple_obj[nested0]",
+            "/nested_multiple_obj[nested1]/float_value",
+            "/nested_multiple_obj[added]",
+        }
+        assert old == new
+        assert old.to_dict() == new.to_dict()
+
+    def test_diff_of_reordered_list(self, model_all):
+        """Tests whether a reordered list is replaced as a whole only"""
+
+        # Arrange
+        old = self._dataset(model_all)
+        new = self._dataset(model_all)
+
+        new.nested_multiple_obj.reverse()
+        new.nested_multiple_obj[0].float_value = 10.0
+
+        # Act
+        operations = old.diff(new)
+        old.apply_patch(operations)
+
+        # Assert
+        assert [(op["op"], op["path"]) for op in operations] == [
+            ("replace", "/nested_multiple_obj")
+        ]
+        assert old == new
+
+    def test_diff_of_modified_primitives(self, model_all):
+        """Tests whether in-place modifications of lists of primitives are part of the patch"""
+
+        # Arrange
+        old = self._dataset(model_all)
+        new = self._dataset(model_all)
+        assert old.diff(new) == []
+
+        # Act
+        new.multiple_primitives.append(99.0)
+        operations = old.diff(new)
+        old.apply_patch(operations)
+
+        # Assert
+        assert [(op["op"], op["path"]) for op in operations] == [
+            ("replace", "/multiple_primitives")
+        ]
+        assert old == new
+        assert old.multiple_primitives == [99.0]
+
+
+class TestBulkMethod:
+
+    def test_bulk_defers_validation(self, model_all):
+        """Tests whether assignments within a bulk context are validated on exit"""
+
+        # Arrange
+        dataset = model_all.Root()
+        objects = dataset.nested_multiple_obj
+
+        # Act
+        with dataset.bulk() as context:
+            for i in range(10):
+                nested = model_all.Nested()
+                dataset.nested_multiple_obj.append(nested)
+                nested.int_value = str(i)
+
+            dataset.float_value = "1.5"
+
+        # Assert
+        assert context.report == {}
+        assert dataset.float_value == 1.5
+        assert objects is dataset.nested_multiple_obj
+        assert [obj.int_value for obj in dataset.nested_multiple_obj] == list(range(10))
+        assert all(obj._parent is dataset for obj in dataset.nested_multiple_obj)
+        assert dataset.get("nested_multiple_obj/int_value") == list(range(10))
+
+    def test_bulk_aggregates_errors(self, model_all):
+        """Tests whether all invalid assignments are reported at once"""
+
+        # Arrange
+        dataset = model_all.Root(nested_single_obj=model_all.Nested(id="nested"))
+
+        # Act
+        with pytest.raises(ValueError) as e:
+            with dataset.bulk():
+                dataset.float_value = "not a float"
+                dataset.nested_single_obj.int_value = "not an int"
+
+        # Assert
+        assert "float_value" in str(e.value)
+        assert "int_value" in str(e.value)
+
+    def test_bulk_restores_model_on_errors(self, model_all):
+        """Tests whether a failed bulk context leaves the model unchanged"""
+
+        # Arrange
+        dataset = model_all.Root(
+            float_value=1.0,
+            nested_single_obj=model_all.Nested(id="nested", int_value=1),
+            nested_multiple_obj=[model_all.Nested(id="first")],
+        )
+        objects = dataset.nested_multiple_obj
+        expected = dataset.to_dict()
+
+        # Act
+        with pytest.raises(ValueError):
+            with dataset.bulk():
+                dataset.float_value = 2.0
+                dataset.str_value = "set"
+                dataset.nested_single_obj.int_value = "not an int"
+                dataset.nested_multiple_obj.append(model_all.Nested(id="second"))
+
+        # Assert
+        assert dataset.to_dict() == expected
+        assert dataset.float_value == 1.0
+        assert dataset.nested_single_obj.int_value == 1
+        assert "str_value" not in dataset.model_fields_set
+        assert objects is dataset.nested_multiple_obj
+        assert [obj.id for obj in dataset.nested_multiple_obj] == ["first"]
+
+    def test_bulk_report_drops_invalid_values(self, model_all):
+        """Tests whether invalid values are not kept if errors are only reported"""
+
+        # Arrange
+        dataset = model_all.Root(float_value=1.0)
+
+        # Act
+        with dataset.bulk(raise_errors=False) as context:
+            dataset.float_value = "not a float"
+            dataset.int_value = 2
+
+        # Assert
+        assert [label.split(".")[-1] for label in context.report] == ["float_value"]
+        assert dataset.float_value == 1.0
+        assert dataset.int_value == 2
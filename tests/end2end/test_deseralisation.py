@@ -1,5 +1,13 @@
+import gc
+import hashlib
+import weakref
 import pytest
 
+from typing import Optional
+from sdRDM import DataModel
+from sdRDM.base.listplus import ListPlus
+from sdRDM.base.trusted import PLAN_ATTRIBUTE
+
 
 @pytest.mark.e2e
 def test_json_deserialisation(model_all, model_all_dataset):
@@ -35,3 +43,134 @@ def test_xml_deserialisation(model_all, model_all_dataset):
     ).to_dict()
 
     assert given == expected, "XML deserialisation does not match"
+
+
+@pytest.mark.e2e
+def test_trusted_json_deserialisation(model_all, model_all_dataset):
+    """Checks whether trusted deserialisation restores the same object and its relations"""
+
+    expected = model_all_dataset.to_dict()
+    given = model_all.Root.from_json(
+        open("tests/fixtures/static/model_all_expected.json"),
+        trusted=True,
+    )
+
+    assert given.to_dict() == expected, "Trusted JSON deserialisation does not match"
+    assert isinstance(given.nested_multiple_obj, ListPlus)
+    assert given.nested_single_obj._parent is given
+    assert all(obj._parent is given for obj in given.nested_multiple_obj)
+    assert given.nested_multiple_obj[0]._attribute == "nested_multiple_obj"
+
+
+@pytest.mark.e2e
+def test_trusted_plan_is_released_with_class():
+    """Checks whether classes loaded in trusted mode are not kept alive by their plan"""
+
+    class Sample(DataModel):
+        name: Optional[str] = None
+
+    sample = Sample.from_dict({"name": "sample"}, trusted=True)
+    ref = weakref.ref(Sample)
+
+    assert sample.name == "sample"
+    assert PLAN_ATTRIBUTE in Sample.__dict__
+
+    del Sample, sample
+    gc.collect()
+
+    assert ref() is None
+
+
+@pytest.mark.e2e
+def test_trusted_checksum_guard(model_all):
+    """Checks whether a trusted file with a mismatching checksum is rejected"""
+
+    content = open("tests/fixtures/static/model_all_expected.json").read()
+    checksum = hashlib.sha256(content.encode()).hexdigest()
+
+    dataset = model_all.Root.from_json_string(content, trusted=True, checksum=checksum)
+
+    assert dataset.id == "id"
+
+    with pytest.raises(ValueError):
+        model_all.Root.from_json_string(content + " ", trusted=True, checksum=checksum)
+
+
+@pytest.mark.e2e
+@pytest.mark.parametrize("chunk_size", [1, 7, 1 << 16])
+@pytest.mark.parametrize("mode", ["r", "rb"])
+def test_incremental_json_deserialisation(model_all, model_all_dataset, chunk_size, mode):
+    """Checks whether incremental deserialisation matches regardless of chunk boundaries"""
+
+    from sdRDM.base.ioutils.jsonreader import load_json
+
+    # Arrange
+    expected = model_all_dataset.to_dict()
+    path = "tests/fixtures/static/model_all_expected.json"
+
+    # Act
+    given = load_json(model_all.Root, open(path, mode), chunk_size=chunk_size)
+
+    # Assert
+    assert given.to_dict() == expected, "Incremental JSON deserialisation does not match"
+    assert given.nested_single_obj._parent is given
+    assert all(obj._parent is given for obj in given.nested_multiple_obj)
+
+
+@pytest.mark.e2e
+def test_incremental_checksum_guard(model_all):
+    """Checks whether the checksum is verified while reading incrementally"""
+
+    # Arrange
+    path = "tests/fixtures/static/model_all_expected.json"
+    checksum = hashlib.sha256(open(path, "rb").read()).hexdigest()
+
+    # Act
+    dataset = model_all.Root.from_json(open(path), incremental=True, checksum=checksum)
+
+    # Assert
+    assert dataset.id == "id"
+
+    with pytest.raises(ValueError):
+        model_all.Root.from_json(open(path), incremental=True, checksum=checksum[::-1])
+
+
+@pytest.mark.e2e
+def test_iter_json(model_all):
+    """Checks whether items at a meta path are yielded without loading the rest"""
+
+    # Arrange
+    path = "tests/fixtures/static/model_all_expected.json"
+
+    # Act
+    objects = list(model_all.Root.iter_json(open(path), "nested_multiple_obj"))
+    single = list(model_all.Root.iter_json(open(path), "nested_single_obj/str_value"))
+    primitives = list(model_all.Root.iter_json(open(path), "multiple_primitives"))
+
+    # Assert
+    assert [type(obj) for obj in objects] == [model_all.Nested]
+    assert objects[0].str_value == "string"
+    assert single == ["string"]
+    assert primitives == [1.5, 1.7, 1.9]
+
+    with pytest.raises(ValueError):
+        list(model_all.Root.iter_json(open(path), "does_not_exist"))
+
+
+@pytest.mark.e2e
+@pytest.mark.parametrize("trusted", [False, True])
+def test_binary_deserialisation(model_all, model_all_dataset, trusted):
+    """Checks whether the binary format restores the same object"""
+
+    # Arrange
+    expected = model_all_dataset.to_dict()
+
+    # Act
+    given = model_all.Root.from_binary(model_all_dataset.to_binary(), trusted=trusted)
+
+    # Assert
+    assert given.to_dict() == expected, "Binary deserialisation does not match"
+    assert given.nested_single_obj._parent is given
+
+    with pytest.raises(ValueError):
+        model_all.Nested.from_binary(model_all_dataset.to_binary())
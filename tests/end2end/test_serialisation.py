@@ -1,6 +1,17 @@
+import io
 import pytest
 import json, yaml
 
+from lxml import etree
+
+from sdRDM.base.ioutils import jsonbackends
+from sdRDM.base.ioutils.jsonbackends import (
+    JSONBackend,
+    get_json_backend,
+    register_json_backend,
+    set_json_backend,
+)
+
 
 @pytest.mark.e2e
 def test_json_serialisation(model_all_dataset):
@@ -12,6 +23,80 @@ def test_json_serialisation(model_all_dataset):
     assert given == expected, "JSON serialisation does not match"
 
 
+@pytest.mark.e2e
+@pytest.mark.parametrize("backend", ["stdlib", "orjson", "pydantic"])
+def test_json_backends(model_all, model_all_dataset, backend):
+    """Checks whether all JSON backends export and load the same data"""
+
+    if backend == "orjson":
+        pytest.importorskip("orjson")
+
+    expected = json.load(open("tests/fixtures/static/model_all_expected.json"))
+    given = model_all_dataset.json(backend=backend)
+    loaded = model_all.Root.from_json_string(given, backend=backend)
+
+    assert json.loads(given) == expected, "JSON serialisation does not match"
+    assert loaded == model_all_dataset, "JSON deserialisation does not match"
+
+
+@pytest.mark.e2e
+def test_json_default_backend(model_all_dataset):
+    """Checks whether the default JSON backend can be set globally"""
+
+    expected = model_all_dataset.json(backend="pydantic")
+
+    try:
+        set_json_backend("pydantic")
+        given = model_all_dataset.json()
+    finally:
+        set_json_backend("stdlib")
+
+    assert given == expected
+
+    with pytest.raises(ValueError):
+        get_json_backend("unknown")
+
+
+@pytest.mark.e2e
+def test_json_backend_interface(model_all_dataset, monkeypatch):
+    """Checks whether backends have to implement both methods of the interface"""
+
+    monkeypatch.setattr(jsonbackends, "_FACTORIES", dict(jsonbackends._FACTORIES))
+    monkeypatch.setattr(jsonbackends, "_INSTANCES", dict(jsonbackends._INSTANCES))
+
+    class Incomplete(JSONBackend):
+        name = "incomplete"
+
+        def loads(self, content):
+            return json.loads(content)
+
+    class Compact(Incomplete):
+        name = "compact"
+
+        def dumps(self, data, indent=2):
+            return json.dumps(data, default=str, separators=(",", ":"))
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+    register_json_backend(Compact.name, Compact)
+
+    assert "\n" not in model_all_dataset.json(backend="compact")
+
+
+@pytest.mark.e2e
+@pytest.mark.parametrize("options", [{}, {"indent": None}, {"exclude_none": False}])
+def test_json_streaming(model_all, model_all_dataset, options):
+    """Checks whether the streamed JSON matches the JSON export byte by byte"""
+
+    model_all_dataset.nested_multiple_obj.append(model_all.Nested(id="other"))
+
+    handler = io.StringIO()
+    model_all_dataset.dump_json(handler, **options)
+
+    assert handler.getvalue() == model_all_dataset.json(**options)
+
+
 @pytest.mark.e2e
 def test_yaml_serialisation(model_all_dataset):
     """Checks the yaml serialisation of the model"""
@@ -30,3 +115,19 @@ def test_xml_serialisation(model_all_dataset):
     given = model_all_dataset.xml()
 
     assert given.strip() == expected.strip(), "XML serialisation does not match"
+
+
+@pytest.mark.e2e
+def test_xml_streaming_serialisation(model_all_dataset):
+    """Checks whether the streamed xml serialisation matches the expected document"""
+
+    expected = open("tests/fixtures/static/model_all_expected.xml").read()
+    handler = io.BytesIO()
+
+    model_all_dataset.dump_xml(handler)
+
+    # Namespace declarations may be ordered differently
+    given = etree.tostring(etree.fromstring(handler.getvalue()), method="c14n")
+    expected = etree.tostring(etree.fromstring(expected.encode()), method="c14n")
+
+    assert given == expected, "XML serialisation does not match"
@@ -0,0 +1,49 @@
+from typing import List, Optional
+from numpy.typing import NDArray
+from pydantic import PrivateAttr
+from pydantic_xml import attr, element
+
+from sdRDM import DataModel
+from sdRDM.base.listplus import ListPlus
+
+
+class Spectrum(DataModel):
+    """Nested model holding arrays and bytes"""
+
+    name: Optional[str] = None
+    value: Optional[float] = None
+    data: Optional[NDArray] = None
+    raw: Optional[bytes] = None
+    spectra: List["Spectrum"] = element(tag="spectra", default_factory=ListPlus)
+
+    _repo: str = PrivateAttr(default="https://www.github.com/spectrum")
+
+
+class Reading(DataModel):
+    """Leaf model of a batch"""
+
+    id: Optional[str] = attr(name="id", default=None)
+    value: Optional[float] = element(tag="value", default=None)
+
+    _repo: str = PrivateAttr(default="https://www.github.com/samples")
+
+
+class Sample(DataModel):
+    """Model holding a list of readings"""
+
+    id: Optional[str] = attr(name="id", default=None)
+    name: Optional[str] = element(tag="name", default=None)
+    value: Optional[float] = element(tag="value", default=None)
+    readings: List[Reading] = element(tag="readings", default_factory=ListPlus)
+
+    _repo: str = PrivateAttr(default="https://www.github.com/samples")
+
+
+class Batch(DataModel):
+    """Root model holding a list of samples"""
+
+    id: Optional[str] = attr(name="id", default=None)
+    name: Optional[str] = element(tag="name", default=None)
+    samples: List[Sample] = element(tag="samples", default_factory=ListPlus)
+
+    _repo: str = PrivateAttr(default="https://www.github.com/samples")
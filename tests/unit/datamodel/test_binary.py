@@ -0,0 +1,130 @@
+import datetime
+import numpy as np
+import pytest
+
+from typing import List, Optional
+from numpy.typing import NDArray
+from pydantic import PrivateAttr
+from pydantic_xml import element
+from sdRDM import DataModel
+from sdRDM.base.ioutils.binary import ALIGNMENT, decode_binary, encode_binary
+from sdRDM.base.listplus import ListPlus
+
+
+class Trace(DataModel):
+    name: Optional[str] = None
+    data: Optional[NDArray] = None
+    raw: Optional[bytes] = None
+    count: Optional[int] = None
+    traces: List["Trace"] = element(tag="traces", default_factory=ListPlus)
+
+    _repo: str = PrivateAttr(default="https://www.github.com/trace")
+    _commit: str = PrivateAttr(default="abc")
+
+
+class TestBinary:
+
+    @pytest.mark.unit
+    def test_arrays_are_not_copied(self):
+        """Tests whether arrays are decoded as aligned views on the buffer"""
+
+        # Arrange
+        trace = Trace(
+            name="root",
+            data=np.arange(12, dtype=np.float32).reshape(3, 4).T,
+            raw=b"\x00\x01",
+            count=2**70,
+            traces=[Trace(data=np.arange(3)), Trace(data=np.array([]))],
+        )
+
+        # Act
+        buffer = bytearray(trace.to_binary())
+        given = Trace.from_binary(buffer)
+
+        # Assert
+        assert np.array_equal(given.data, trace.data)
+        assert given.data.dtype == np.float32
+        assert given.raw == b"\x00\x01"
+        assert given.count == 2**70
+        assert given.traces[1].data.size == 0
+        assert np.shares_memory(given.traces[0].data, np.frombuffer(buffer, np.uint8))
+        assert given.traces[0].data.__array_interface__["data"][0] % ALIGNMENT == (
+            np.frombuffer(buffer, np.uint8).__array_interface__["data"][0] % ALIGNMENT
+        )
+
+    @pytest.mark.unit
+    def test_header_and_data(self):
+        """Tests whether the source is embedded and the data is decoded without objects"""
+
+        # Arrange
+        trace = Trace(
+            traces=[Trace(name="repeated", data=np.arange(2)) for _ in range(100)]
+        )
+
+        # Act
+        buffer = trace.to_binary()
+        header, data = decode_binary(buffer)
+
+        # Assert
+        assert header == {
+            "root": "Trace",
+            "repo": "https://www.github.com/trace",
+            "commit": "abc",
+        }
+        assert [sub["name"] for sub in data["traces"]] == ["repeated"] * 100
+        assert all(isinstance(sub["data"], np.ndarray) for sub in data["traces"])
+
+    @pytest.mark.unit
+    def test_keys_are_interned(self):
+        """Tests whether keys are stored once, regardless of how often they occur"""
+
+        # Arrange
+        trace = Trace(traces=[Trace(name=f"trace{index}", count=index) for index in range(50)])
+
+        # Act
+        buffer = trace.to_binary()
+
+        # Assert
+        assert buffer.count(b"name") == 1
+        assert buffer.count(b"count") == 1
+
+    @pytest.mark.unit
+    def test_columns_roundtrip(self):
+        """Tests whether lists of all kinds of values are restored"""
+
+        # Arrange
+        data = {
+            "floats": [0.5, float("inf"), -1.0],
+            "ints": [1, -(2**63), 2**63 - 1],
+            "big": [1, 2**64],
+            "bools": [True, False],
+            "mixed": [1, 1.5, "one", None, b"\x00", [], {}],
+            "strings": ["ä", "", "a\udc80b"],
+            "repeated": ["K", "K", "K", "mol"],
+            "nested": [[1.0, 2.0], [], [3.0]],
+            "records": [{"a": 1, "b": ["x"]}, {"a": 2, "b": []}],
+            "uneven": [{"a": 1}, {"b": 2}, {"b": 3, "a": 4}],
+            "empty": [{}, {}],
+            "date": datetime.date(2024, 1, 2),
+        }
+
+        # Act
+        header, given = decode_binary(encode_binary({"root": "Data"}, data))
+
+        # Assert
+        assert header == {"root": "Data"}
+        assert given == {**data, "date": "2024-01-02"}
+        assert list(given["uneven"][2]) == ["b", "a"]
+
+    @pytest.mark.unit
+    def test_trusted_source_mismatch(self):
+        """Tests whether trusted decoding rejects documents of another library"""
+
+        # Arrange
+        buffer = Trace(name="root").to_binary().replace(b"abc", b"xyz")
+
+        # Act & Assert
+        assert Trace.from_binary(buffer).name == "root"
+
+        with pytest.raises(ValueError):
+            Trace.from_binary(buffer, trusted=True)
@@ -0,0 +1,177 @@
+import hashlib
+import pytest
+
+from sdRDM.base.ioutils.compression import open_file, split_compression
+from sdRDM.cli import Dialects, _infer_extension
+
+# Leading bytes of each compression format
+MAGIC_BYTES = {
+    ".gz": b"\x1f\x8b",
+    ".bz2": b"BZh",
+    ".xz": b"\xfd7zXZ",
+}
+
+
+class TestCompression:
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("compression", [".gz", ".bz2", ".xz"])
+    @pytest.mark.parametrize(
+        "ext,dump,load",
+        [
+            (".json", "dump_json", "from_json"),
+            (".yaml", "dump_yaml", "from_yaml"),
+            (".xml", "dump_xml", "from_xml"),
+        ],
+    )
+    def test_roundtrip(
+        self, tmp_path, model_samples, model_samples_dataset, compression, ext, dump, load
+    ):
+        """Tests whether compressed paths are written and read transparently"""
+
+        # Arrange
+        path = tmp_path / f"batch{ext}{compression}"
+
+        # Act
+        getattr(model_samples_dataset, dump)(str(path))
+        loaded = getattr(model_samples.Batch, load)(str(path))
+
+        # Assert
+        assert path.read_bytes().startswith(MAGIC_BYTES[compression])
+        assert loaded.name == "Batch"
+        assert len(loaded.samples) == 25
+        assert loaded.samples[3].value == 1.5
+        assert loaded.samples[3].readings[0].value == 3.0
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("compression", ["", ".gz"])
+    def test_output_matches_strings(self, tmp_path, model_samples_dataset, compression):
+        """Tests whether written files hold the same content as the exported strings"""
+
+        # Act
+        for ext in ["json", "yaml", "xml"]:
+            getattr(model_samples_dataset, f"dump_{ext}")(
+                tmp_path / f"batch.{ext}{compression}"
+            )
+
+        # Assert
+        for ext in ["json", "yaml", "xml"]:
+            with open_file(tmp_path / f"batch.{ext}{compression}") as file:
+                assert file.read() == getattr(model_samples_dataset, ext)()
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("incremental", [False, True])
+    def test_json_options(
+        self, tmp_path, model_samples, model_samples_dataset, incremental
+    ):
+        """Tests whether checksums and incremental reading apply to the decompressed content"""
+
+        # Arrange
+        path = tmp_path / "batch.json.xz"
+        model_samples_dataset.dump_json(str(path))
+        checksum = hashlib.sha256(model_samples_dataset.json().encode()).hexdigest()
+
+        # Act
+        loaded = model_samples.Batch.from_json(
+            path, checksum=checksum, incremental=incremental
+        )
+        values = [
+            sample.value for sample in model_samples.Batch.iter_json(path, "samples")
+        ]
+
+        # Assert
+        assert len(loaded.samples) == 25
+        assert values == [index / 2 for index in range(25)]
+
+        with pytest.raises(ValueError):
+            model_samples.Batch.from_json(
+                path, checksum="0" * 64, incremental=incremental
+            )
+
+    @pytest.mark.unit
+    def test_compressed_json_is_streamed(
+        self, tmp_path, monkeypatch, model_samples, model_samples_dataset
+    ):
+        """Tests whether compressed JSON files are read incrementally by default"""
+
+        # Arrange
+        path = tmp_path / "batch.json.gz"
+        model_samples_dataset.dump_json(str(path))
+
+        def read_whole(*args, **kwargs):
+            raise AssertionError("Compressed file was read into memory")
+
+        monkeypatch.setattr(model_samples.Batch, "from_json_string", read_whole)
+
+        # Act
+        loaded = model_samples.Batch.from_json(path)
+
+        # Assert
+        assert len(loaded.samples) == 25
+
+    @pytest.mark.unit
+    def test_yaml_is_streamed(self, tmp_path, model_samples, model_samples_dataset):
+        """Tests whether YAML files are parsed from the stream with a checksum"""
+
+        # Arrange
+        path = tmp_path / "batch.yaml.bz2"
+        model_samples_dataset.dump_yaml(str(path))
+        checksum = hashlib.sha256(model_samples_dataset.yaml().encode()).hexdigest()
+
+        # Act
+        loaded = model_samples.Batch.from_yaml(path, checksum=checksum)
+
+        # Assert
+        assert len(loaded.samples) == 25
+
+        with pytest.raises(ValueError):
+            model_samples.Batch.from_yaml(path, checksum="0" * 64)
+
+    @pytest.mark.unit
+    def test_ndjson(self, tmp_path, model_samples, model_samples_dataset):
+        """Tests whether NDJSON records are written to and read from compressed paths"""
+
+        # Arrange
+        path = tmp_path / "samples.ndjson.gz"
+
+        # Act
+        count = model_samples_dataset.to_ndjson(str(path), path="samples")
+        loaded = model_samples.Batch.from_ndjson(str(path))
+
+        # Assert
+        assert count == 25
+        assert [sample.id for sample in loaded.samples] == [
+            f"s{index}" for index in range(25)
+        ]
+
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "file,expected",
+        [
+            ("data.json", Dialects.json),
+            ("data.JSON.GZ", Dialects.json),
+            ("data.yaml.bz2", Dialects.yaml),
+            ("archive.v2.xml.xz", Dialects.xml),
+        ],
+    )
+    def test_infer_extension(self, file, expected):
+        """Tests whether the dialect is inferred behind compression extensions"""
+
+        # Act
+        dialect = _infer_extension(file)
+
+        # Assert
+        assert dialect is expected
+
+    @pytest.mark.unit
+    def test_infer_unknown_extension(self):
+        """Tests whether a compressed file without known format is rejected"""
+
+        # Act
+        with pytest.raises(ValueError):
+            _infer_extension("data.gz")
+
+        # Assert
+        assert split_compression("data.tar.gz") == ("data.tar", ".gz")
+        assert split_compression("data.json") == ("data.json", None)
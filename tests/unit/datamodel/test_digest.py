@@ -0,0 +1,107 @@
+import pytest
+
+from typing import List, Optional
+from pydantic import Field
+from pydantic_xml import element
+from sdRDM import DataModel
+from sdRDM.base.listplus import ListPlus
+
+
+class TestDigest:
+
+    def _setup(self):
+        """Creates a simple nested model"""
+
+        class Child(DataModel):
+            value: Optional[float] = None
+
+        class Parent(DataModel):
+            name: str
+            child: Optional[Child] = None
+            children: List[Child] = Field(default_factory=ListPlus)
+
+        return Parent, Child
+
+    @pytest.mark.unit
+    def test_equal_objects_share_hash(self):
+        """Tests whether structurally equal objects are equal and hashable"""
+
+        # Arrange
+        Parent, Child = self._setup()
+
+        # Act
+        first = Parent(name="A", children=[Child(value=1.0)])
+        second = Parent(name="A", children=[Child(value=1.0)])
+        other = Parent(name="B", children=[Child(value=1.0)])
+
+        # Assert
+        assert first == second
+        assert hash(first) == hash(second)
+        assert first != other
+        assert len({first, second, other}) == 2
+        assert first != "A"
+
+    @pytest.mark.unit
+    def test_digest_is_invalidated_upwards(self):
+        """Tests whether modifications of sub-objects change the digest of the parent"""
+
+        # Arrange
+        Parent, Child = self._setup()
+        parent = Parent(name="A", child=Child(value=1.0))
+        before = hash(parent)
+
+        # Act
+        parent.child.value = 2.0
+        after_setattr = hash(parent)
+
+        parent.children.append(Child(value=3.0))
+        after_append = hash(parent)
+
+        parent.children[0].value = 4.0
+        after_nested = hash(parent)
+
+        # Assert
+        assert before != after_setattr
+        assert after_setattr != after_append
+        assert after_append != after_nested
+
+    @pytest.mark.unit
+    def test_digest_tracks_primitive_lists(self):
+        """Tests whether modifications of lists of primitives change the digest"""
+
+        # Arrange
+        class Series(DataModel):
+            values: List[float] = element(tag="values", default_factory=ListPlus)
+
+        first = Series(values=[1.0, 2.0])
+        second = Series(values=[1.0, 2.0])
+        assert first == second
+
+        # Act
+        first.values.append(99.0)
+
+        # Assert
+        assert first != second
+        assert first.values._parent is first
+
+    @pytest.mark.unit
+    def test_digest_tracks_shared_objects(self):
+        """Tests whether all owners of a shared or moved sub-object are invalidated"""
+
+        # Arrange
+        Parent, Child = self._setup()
+        child = Child(value=1.0)
+        first = Parent(name="A", child=child)
+        second = Parent(name="A", children=[child])
+        reference = Parent(name="A", child=Child(value=1.0))
+        assert first == reference
+        assert hash(second)
+
+        # Act
+        child.value = 2.0
+
+        # Assert
+        assert child._parent is second
+        assert first != reference
+        assert second.children[0].value == 2.0
+        assert hash(second) != hash(Parent(name="A", children=[Child(value=1.0)]))
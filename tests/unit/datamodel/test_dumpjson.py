@@ -0,0 +1,31 @@
+import io
+import numpy as np
+import pytest
+
+
+class TestDumpJSON:
+
+    @pytest.mark.unit
+    def test_arrays_are_written_in_chunks(self, model_spectrum):
+        """Tests whether chunked arrays result in the same output as the JSON export"""
+
+        # Arrange
+        series = model_spectrum(
+            data=np.arange(10, dtype=float).reshape(2, 5),
+            spectra=[
+                model_spectrum(data=np.arange(3), value=1.0),
+                model_spectrum(data=np.array([])),
+            ],
+        )
+        expected = series.json(mode="python")
+
+        # Act
+        text_handler = io.StringIO()
+        series.dump_json(text_handler, mode="python", chunk_size=2)
+
+        binary_handler = io.BytesIO()
+        series.dump_json(binary_handler, mode="python")
+
+        # Assert
+        assert text_handler.getvalue() == expected
+        assert binary_handler.getvalue().decode() == expected
@@ -0,0 +1,184 @@
+import numpy as np
+import pytest
+
+from typing import List, Optional, Union
+from numpy.typing import NDArray
+from pydantic_xml import element
+from sdRDM import DataModel
+from sdRDM.base.fieldpipeline import _AfterStep, _BeforeStep, _is_open, compile_pipeline
+from sdRDM.base.listplus import ListPlus
+
+
+def _steps(cls, name: str) -> List[type]:
+    return [
+        type(entry)
+        for entry in cls.model_fields[name].metadata
+        if isinstance(entry, (_BeforeStep, _AfterStep))
+    ]
+
+
+class TestFieldPipeline:
+
+    def _setup(self):
+        """Creates a model with fields of each kind and a sub-class of it"""
+
+        class Sample(DataModel):
+            name: Optional[str] = None
+            value: Optional[float] = None
+            values: List[float] = element(tag="values", default_factory=ListPlus)
+            data: Optional[NDArray] = None
+            extra: Optional[List[str]] = element(tag="extra", default=None)
+
+        class Subsample(Sample):
+            labels: List[str] = element(tag="labels", default_factory=ListPlus)
+
+        return Sample, Subsample
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "name,expected",
+        [
+            ("name", []),
+            ("value", [_BeforeStep]),
+            ("values", [_BeforeStep, _AfterStep]),
+            ("data", [_BeforeStep]),
+            ("extra", [_AfterStep]),
+        ],
+    )
+    def test_steps_depend_on_type(self, name, expected):
+        """Tests whether fields are only given the steps relevant to their type"""
+
+        # Arrange
+        Sample, _ = self._setup()
+
+        # Assert
+        assert _steps(Sample, name) == expected
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "annotation,expected",
+        [
+            (Optional[str], False),
+            (Union[int, float], False),
+            (Optional[List[str]], True),
+            (List[float], True),
+        ],
+    )
+    def test_open_annotations(self, annotation, expected):
+        """Tests whether unions are inspected on all supported Python versions"""
+
+        # Assert
+        assert _is_open(annotation) is expected
+
+    @pytest.mark.unit
+    def test_inherited_steps_are_replaced(self):
+        """Tests whether sub-classes do not accumulate the steps of their parent"""
+
+        # Arrange
+        Sample, Subsample = self._setup()
+
+        # Assert
+        assert _steps(Subsample, "values") == [_BeforeStep, _AfterStep]
+        assert _steps(Subsample, "labels") == [_AfterStep]
+        assert _steps(Sample, "values") == [_BeforeStep, _AfterStep]
+
+    @pytest.mark.unit
+    def test_values_are_converted(self):
+        """Tests whether lists, arrays and NumPy strings are converted"""
+
+        # Arrange
+        _, Subsample = self._setup()
+
+        # Act
+        sample = Subsample(
+            name=np.str_("sample"),
+            value=np.array([1.5]),
+            values=np.arange(3, dtype=float),
+            data=[1, 2],
+            extra=[np.str_("a")],
+            labels=[np.str_("b")],
+        )
+
+        # Assert
+        assert type(sample.name) is str
+        assert sample.value == 1.5
+        assert isinstance(sample.values, ListPlus)
+        assert sample.values == [0.0, 1.0, 2.0]
+        assert isinstance(sample.data, np.ndarray)
+        assert isinstance(sample.extra, ListPlus)
+        assert type(sample.extra[0]) is str
+        assert isinstance(sample.labels, ListPlus)
+
+    @pytest.mark.unit
+    def test_assignment_is_validated(self):
+        """Tests whether the pipeline also runs upon assignment"""
+
+        # Arrange
+        Sample, _ = self._setup()
+        sample = Sample()
+
+        # Act
+        sample.values = np.array([1.0, 2.0])
+        sample.extra = ["extra"]
+
+        # Assert
+        assert isinstance(sample.values, ListPlus)
+        assert isinstance(sample.extra, ListPlus)
+
+    @pytest.mark.unit
+    def test_list_elements_are_checked(self):
+        """Tests whether list elements of unexpected types are rejected"""
+
+        # Arrange
+        Sample, _ = self._setup()
+
+        class Holder(DataModel):
+            samples: List[Union[int, str]] = element(tag="samples", default_factory=ListPlus)
+
+        # Act
+        holder = Holder(samples=["one", 1])
+
+        # Assert
+        assert isinstance(holder.samples, ListPlus)
+
+        with pytest.raises(ValueError):
+            Holder(samples=[Sample()])
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "annotation,values",
+        [
+            (List[float], [0.5, 1.5]),
+            (List[int], [1, True, 2**70]),
+            (List[bool], [True, False]),
+            (List[Union[int, float]], [1, 2.5]),
+            (List[int], []),
+        ],
+    )
+    def test_numeric_lists_are_checked_in_bulk(self, annotation, values):
+        """Tests whether valid numeric lists pass the bulk check"""
+
+        # Arrange
+        _, after = compile_pipeline(annotation)
+
+        # Act
+        result = after(values)
+
+        # Assert
+        assert isinstance(result, ListPlus)
+        assert result == values
+
+    @pytest.mark.unit
+    def test_numeric_list_failure_names_element(self):
+        """Tests whether invalid elements of numeric lists are reported"""
+
+        # Arrange
+        _, after = compile_pipeline(List[int])
+
+        # Act
+        with pytest.raises(TypeError) as error:
+            after([1, 2.5])
+
+        # Assert
+        assert "<class 'float'>" in str(error.value)
+        assert "Expected type '<class 'int'>'" in str(error.value)
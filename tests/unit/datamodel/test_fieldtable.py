@@ -0,0 +1,85 @@
+import pytest
+
+from typing import List, Optional
+from pydantic import Field
+from pydantic_xml import element
+from sdRDM import DataModel
+from sdRDM.base.datatypes import Unit
+from sdRDM.base.listplus import ListPlus
+
+
+class TestFieldTable:
+
+    def _setup(self):
+        """Creates a model with objects, units and reference checks"""
+
+        class Child(DataModel):
+            value: Optional[float] = None
+
+        class Parent(DataModel):
+            name: Optional[str] = None
+            unit: Optional[Unit] = None
+            values: List[float] = element(tag="values", default_factory=ListPlus)
+            child: Optional[Child] = None
+            children: List[Child] = Field(default_factory=ListPlus)
+            child_name: Optional[str] = Field(
+                default=None,
+                json_schema_extra=dict(references="Parent.name"),
+            )
+
+        return Parent, Child
+
+    @pytest.mark.unit
+    def test_table_describes_fields(self):
+        """Tests whether the table holds the relevant field descriptions"""
+
+        # Arrange
+        Parent, Child = self._setup()
+
+        # Act
+        table = Parent._get_field_table()
+
+        # Assert
+        assert table.object_fields == ("unit", "child", "children")
+        assert table.unit_fields == {"unit"}
+        assert table.multiple_fields == {"values", "children"}
+        assert table.numeric_fields == {"values"}
+        assert table.reference_checks == {"child_name": ("Parent", "name")}
+        assert table.types["child"] == (Child,)
+
+    @pytest.mark.unit
+    def test_table_is_shared_by_instances(self):
+        """Tests whether instances share the table computed for their class"""
+
+        # Arrange
+        Parent, Child = self._setup()
+
+        # Act
+        first = Parent(unit="m", child=Child(), children=[Child()])
+        second = Parent()
+
+        # Assert
+        assert first._get_field_table() is second._get_field_table()
+        assert Child._get_field_table() is not Parent._get_field_table()
+        assert first.child._parent is first
+        assert first.children[0]._parent is first
+        assert first.unit._unit is not None
+
+    @pytest.mark.unit
+    def test_types_are_not_shared(self):
+        """Tests whether modifying the types of an instance leaves the class untouched"""
+
+        # Arrange
+        Parent, Child = self._setup()
+        parent = Parent()
+
+        # Act
+        types = parent._types
+        types["name"] = Child
+
+        # Assert
+        assert Parent()._types["name"] == ()
+        assert types.child == (Child,)
+
+        with pytest.raises(TypeError):
+            parent._get_field_table().types["name"] = Child
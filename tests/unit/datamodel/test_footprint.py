@@ -0,0 +1,110 @@
+import gc
+import pickle
+import tracemalloc
+import pytest
+
+from typing import List, Optional
+from pydantic import BaseModel, Field
+from sdRDM import DataModel
+from sdRDM.base.listplus import ListPlus
+
+# Upper bound of bytes allocated per small instance, relative to a plain pydantic model
+BYTE_FACTOR = 2.0
+
+
+# Defined on module level to be picklable
+class Child(DataModel):
+    name: Optional[str] = None
+    value: Optional[float] = None
+
+
+class Parent(DataModel):
+    child: Optional[Child] = None
+    children: List[Child] = Field(default_factory=ListPlus)
+
+
+class PlainChild(BaseModel):
+    name: Optional[str] = None
+    value: Optional[float] = None
+
+
+def _bytes_per_instance(cls, n_objects: int) -> float:
+    """Measures the bytes allocated per instance of a class"""
+
+    cls(name="warmup", value=0.0)
+    gc.collect()
+
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    objects = [cls(name="child", value=float(i)) for i in range(n_objects)]
+    allocated = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+
+    assert len(objects) == n_objects
+
+    return allocated / n_objects
+
+
+class TestFootprint:
+
+    def _setup(self):
+        """Returns a simple nested model"""
+
+        return Parent, Child
+
+    @pytest.mark.unit
+    def test_instance_byte_budget(self):
+        """Tests whether small instances stay close to plain pydantic models in size"""
+
+        # Arrange
+        _, Child = self._setup()
+        n_objects = 2000
+
+        # Act
+        baseline = _bytes_per_instance(PlainChild, n_objects)
+        allocated = _bytes_per_instance(Child, n_objects)
+
+        # Assert
+        assert allocated < BYTE_FACTOR * baseline
+
+    @pytest.mark.unit
+    def test_parent_links_are_cycle_free(self):
+        """Tests whether a dropped tree is freed without the cyclic garbage collector"""
+
+        # Arrange
+        Parent, Child = self._setup()
+        parent = Parent(child=Child(), children=[Child() for _ in range(10)])
+        parent.children.append(Child())
+        parent.get("children/name")
+        gc.collect()
+
+        # Act
+        assert parent.child._parent is parent
+        assert parent.children[-1]._parent is parent
+
+        gc.disable()
+        try:
+            del parent
+            collected = gc.collect()
+        finally:
+            gc.enable()
+
+        # Assert
+        assert collected == 0
+
+    @pytest.mark.unit
+    def test_relations_survive_pickling(self):
+        """Tests whether parent links are restored after pickling"""
+
+        # Arrange
+        Parent, Child = self._setup()
+        parent = Parent(child=Child(name="single"), children=[Child(name="multiple")])
+
+        # Act
+        loaded = pickle.loads(pickle.dumps(parent))
+
+        # Assert
+        assert loaded == parent
+        assert loaded.child._parent is loaded
+        assert loaded.children[0]._parent is loaded
+        assert loaded.children._parent is loaded
@@ -0,0 +1,126 @@
+import io
+import json
+import pytest
+
+from typing import List
+from pydantic_xml import element
+from sdRDM import DataModel
+from sdRDM.base.listplus import ListPlus
+
+
+class TestNDJSON:
+
+    @pytest.mark.unit
+    def test_records_are_written_per_line(self, model_samples_dataset):
+        """Tests whether each list element is written as a record with its location"""
+
+        # Arrange
+        handler = io.StringIO()
+
+        # Act
+        count = model_samples_dataset.to_ndjson(handler, path="samples/readings")
+        lines = handler.getvalue().splitlines()
+
+        # Assert
+        assert count == 25
+        assert len(lines) == 25
+        assert json.loads(lines[2])["__parent__"] == 2
+        assert json.loads(lines[2])["__path__"] == "samples/readings"
+        assert json.loads(lines[2])["id"] == "r2"
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("trusted", [False, True])
+    def test_roundtrip(self, model_samples, model_samples_dataset, trusted):
+        """Tests whether top-level and nested lists are rebuilt in batches"""
+
+        # Arrange
+        batch = model_samples_dataset
+        samples, readings = io.BytesIO(), io.BytesIO()
+
+        batch.to_ndjson(samples, path="samples", exclude={"readings"})
+        batch.to_ndjson(readings, path="samples/readings")
+
+        # Act
+        given = model_samples.Batch.from_ndjson(
+            io.BytesIO(samples.getvalue()),
+            obj=model_samples.Batch(id="batch", name="Batch"),
+            batch_size=2,
+            trusted=trusted,
+        )
+        given = model_samples.Batch.from_ndjson(
+            io.BytesIO(readings.getvalue()),
+            obj=given,
+            trusted=trusted,
+        )
+
+        # Assert
+        assert given.to_dict() == batch.to_dict()
+        assert isinstance(given.samples, ListPlus)
+        assert all(sample._parent is given for sample in given.samples)
+        assert given.samples[3].readings[0]._parent is given.samples[3]
+
+    @pytest.mark.unit
+    def test_invalid_paths(self, model_samples, model_samples_dataset):
+        """Tests whether paths not pointing to lists of objects are rejected"""
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            model_samples_dataset.to_ndjson(io.StringIO(), path="samples/value")
+
+        with pytest.raises(ValueError):
+            model_samples.Batch.from_ndjson(
+                io.StringIO('{"__path__": "samples/readings", "__parent__": "unknown"}\n')
+            )
+
+    @pytest.mark.unit
+    def test_parents_without_unique_ids(self, model_samples):
+        """Tests whether nested records are assigned to parents by position rather than ID"""
+
+        # Arrange
+        batch = model_samples.Batch(
+            samples=[
+                model_samples.Sample(
+                    id="same", readings=[model_samples.Reading(id="first")]
+                ),
+                model_samples.Sample(
+                    id="same", readings=[model_samples.Reading(id="second")]
+                ),
+            ]
+        )
+        samples, readings = io.StringIO(), io.StringIO()
+
+        batch.to_ndjson(samples, path="samples", exclude={"readings"})
+        batch.to_ndjson(readings, path="samples/readings")
+
+        # Act
+        given = model_samples.Batch.from_ndjson(
+            io.StringIO(samples.getvalue() + readings.getvalue())
+        )
+
+        # Assert
+        assert [sample.readings[0].id for sample in given.samples] == [
+            "first",
+            "second",
+        ]
+
+    @pytest.mark.unit
+    def test_root_with_required_fields(self, model_samples):
+        """Tests whether a root object is required if the class cannot be created empty"""
+
+        # Arrange
+        class Strict(DataModel):
+            name: str
+            samples: List[model_samples.Sample] = element(
+                tag="samples", default_factory=ListPlus
+            )
+
+        content = '{"__path__": "samples", "__parent__": 0, "value": 1.0}\n'
+
+        # Act
+        given = Strict.from_ndjson(io.StringIO(content), obj=Strict(name="strict"))
+
+        # Assert
+        assert given.samples[0].value == 1.0
+
+        with pytest.raises(ValueError, match="name"):
+            Strict.from_ndjson(io.StringIO(content))
@@ -0,0 +1,98 @@
+import gc
+import pytest
+
+from sdRDM.base.ioutils.sharded import _PENDING_ROOTS, ShardedList
+
+
+class TestSharded:
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("format", ["json", "binary"])
+    @pytest.mark.parametrize("processes", [None, 2])
+    def test_roundtrip(
+        self, tmp_path, model_samples, model_samples_dataset, format, processes
+    ):
+        """Tests whether a sharded dataset restores the same object"""
+
+        # Arrange
+        batch = model_samples_dataset
+
+        # Act
+        manifest = batch.to_sharded(
+            str(tmp_path), shard_size=10, format=format, processes=processes
+        )
+        given = model_samples.Batch.open_sharded(str(tmp_path))
+
+        # Assert
+        assert manifest["shards"]["samples"]["counts"] == [10, 10, 5]
+        assert manifest["__source__"]["root"] == "Batch"
+        assert "samples" not in manifest["root"]
+        assert given.to_dict() == batch.to_dict()
+        assert given.samples[0]._parent is given
+
+    @pytest.mark.unit
+    def test_shards_are_loaded_lazily(
+        self, tmp_path, model_samples, model_samples_dataset
+    ):
+        """Tests whether shards are only read once their objects are accessed"""
+
+        # Arrange
+        model_samples_dataset.to_sharded(str(tmp_path), shard_size=10)
+        given = model_samples.Batch.open_sharded(str(tmp_path))
+
+        # Act
+        length = len(given.samples)
+        sample = given.samples[-3]
+
+        # Assert
+        assert isinstance(given.samples, ShardedList)
+        assert length == 25
+        assert sample.id == "s22"
+        assert sample._parent is given
+        assert list(given.samples.__dict__["_shards"]) == [2]
+
+        given.samples.append(model_samples.Sample(id="new"))
+
+        assert [sample.id for sample in given.samples][-3:] == ["s23", "s24", "new"]
+        assert given.samples[22] is sample
+
+    @pytest.mark.unit
+    def test_root_mismatch(self, tmp_path, model_samples, model_samples_dataset):
+        """Tests whether datasets of other classes are rejected"""
+
+        # Arrange
+        model_samples_dataset.to_sharded(str(tmp_path), shard_size=10)
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            model_samples.Sample.open_sharded(str(tmp_path))
+
+    @pytest.mark.unit
+    def test_pending_roots_are_released(
+        self, tmp_path, model_samples, model_samples_dataset
+    ):
+        """Tests whether only roots with unread shards are tracked for exports"""
+
+        # Arrange
+        model_samples_dataset.to_sharded(str(tmp_path), shard_size=10)
+        exported = model_samples.Batch.open_sharded(str(tmp_path))
+        dropped = model_samples.Batch.open_sharded(str(tmp_path))
+
+        keys = [id(exported), id(dropped)]
+
+        # Act
+        data = exported.to_dict()
+        del dropped
+        gc.collect()
+
+        # Assert
+        assert len(data["samples"]) == 25
+        assert all(key not in _PENDING_ROOTS for key in keys)
+
+    @pytest.mark.unit
+    def test_hdf5_shards_are_rejected(self, tmp_path, model_samples_dataset):
+        """Tests whether unsupported shard formats are rejected"""
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            model_samples_dataset.to_sharded(str(tmp_path), format="hdf5")
@@ -0,0 +1,118 @@
+import json
+import numpy as np
+import pytest
+
+from sdRDM.base.ioutils.sidecar import SIDECAR_KEY, has_sidecar
+
+
+class TestSidecar:
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("sidecar", ["arrays.npz", "arrays"])
+    @pytest.mark.parametrize("format", ["json", "yaml"])
+    def test_sidecar_roundtrip(
+        self, tmp_path, model_spectrum, model_spectrum_dataset, sidecar, format
+    ):
+        """Tests whether arrays and large bytes are stored externally and memory-mapped upon loading"""
+
+        # Arrange
+        spectrum = model_spectrum_dataset
+        path = tmp_path / f"spectrum.{format}"
+
+        # Act
+        content = getattr(spectrum, format)(sidecar=str(tmp_path / sidecar))
+        path.write_text(content)
+
+        loader = (
+            model_spectrum.from_json if format == "json" else model_spectrum.from_yaml
+        )
+        given = loader(open(path))
+
+        # Assert
+        assert SIDECAR_KEY in content
+        assert "small" in content
+        assert isinstance(given.data, np.memmap)
+        assert np.array_equal(given.data, spectrum.data)
+        assert np.array_equal(given.spectra[0].data, spectrum.spectra[0].data)
+        assert given.spectra[0].data.dtype == np.int32
+        assert given.raw == spectrum.raw
+        assert given.spectra[1].raw == b"small"
+
+    @pytest.mark.unit
+    def test_sidecar_incremental(self, tmp_path, model_spectrum, model_spectrum_dataset):
+        """Tests whether the incremental reader resolves sidecar references"""
+
+        # Arrange
+        spectrum = model_spectrum_dataset
+        path = tmp_path / "spectrum.json"
+        path.write_text(spectrum.json(sidecar=str(tmp_path / "arrays.npz")))
+
+        # Act
+        given = model_spectrum.from_json(open(path), incremental=True)
+        children = list(model_spectrum.iter_json(open(path), "spectra"))
+
+        # Assert
+        assert np.array_equal(given.data, spectrum.data)
+        assert np.array_equal(children[0].data, spectrum.spectra[0].data)
+
+    @pytest.mark.unit
+    def test_sidecar_references(self, tmp_path, model_spectrum_dataset):
+        """Tests whether references only hold the name of the sidecar"""
+
+        # Arrange
+        spectrum = model_spectrum_dataset
+
+        # Act
+        data = json.loads(spectrum.json(sidecar=str(tmp_path / "arrays.npz")))
+
+        # Assert
+        assert data["data"] == {SIDECAR_KEY: "arrays.npz", "key": "data.npy"}
+        assert data["spectra"][0]["data"] == {
+            SIDECAR_KEY: "arrays.npz",
+            "key": "spectra.0.data.npy",
+        }
+        assert data["raw"]["bytes"] is True
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("format", ["json", "yaml"])
+    @pytest.mark.parametrize("name", ["../secret.npy", "arrays/../../secret.npy", "/tmp/secret.npy"])
+    def test_sidecar_outside_directory(self, tmp_path, model_spectrum, format, name):
+        """Tests whether references to files outside the directory of the document are rejected"""
+
+        # Arrange
+        directory = tmp_path / "documents"
+        directory.mkdir()
+        np.save(tmp_path / "secret.npy", np.arange(3))
+        path = directory / f"spectrum.{format}"
+        path.write_text(json.dumps({"name": "spectrum", "data": {SIDECAR_KEY: name}}))
+
+        loader = (
+            model_spectrum.from_json if format == "json" else model_spectrum.from_yaml
+        )
+
+        # Act
+        with pytest.raises(ValueError):
+            loader(str(path))
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("format", ["json", "yaml"])
+    def test_sidecar_key_in_values(self, model_spectrum, format):
+        """Tests whether only objects holding the key are treated as references"""
+
+        # Arrange
+        spectrum = model_spectrum(
+            name=f'{{"{SIDECAR_KEY}": "arrays.npz"}}', raw=SIDECAR_KEY.encode()
+        )
+        content = getattr(spectrum, format)()
+
+        loader = (
+            model_spectrum.from_json_string if format == "json" else model_spectrum.from_yaml_string
+        )
+
+        # Act
+        given = loader(content)
+
+        # Assert
+        assert has_sidecar(spectrum.json()) is False
+        assert given.name == spectrum.name
+        assert given.raw == spectrum.raw
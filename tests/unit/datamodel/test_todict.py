@@ -0,0 +1,58 @@
+import pytest
+
+from typing import Optional
+from pydantic import PrivateAttr
+from sdRDM import DataModel
+from sdRDM.base.listplus import ListPlus
+
+
+class Level(DataModel):
+    value: Optional[int] = None
+    child: Optional["Level"] = None
+
+    _repo: str = PrivateAttr(default="https://www.github.com/level")
+
+
+class TestToDict:
+
+    @pytest.mark.unit
+    def test_deep_models_are_exported(self):
+        """Tests whether deeply nested models are exported in linear time"""
+
+        # Arrange
+        depth = 40
+        root = Level(value=0)
+        current = root
+
+        for index in range(1, depth):
+            current.child = Level(value=index)
+            current = current.child
+
+        # Act
+        data = root.to_dict()
+
+        # Assert
+        for index in range(depth):
+            assert data["value"] == index
+            data = data.get("child")
+
+        assert data is None
+
+    @pytest.mark.unit
+    def test_empty_dicts_are_removed(self):
+        """Tests whether empty dictionaries are pruned, while others are kept"""
+
+        # Arrange
+        level = Level(value=1)
+        data = {
+            "empty": {},
+            "unset": {"id": "x", "values": [], "nested": {"value": None}},
+            "kept": {"id": "x", "nested": {"value": 1}},
+            "items": ListPlus(),
+        }
+
+        # Act
+        pruned = level._convert_types_and_remove_empty_objects(data, True, True)
+
+        # Assert
+        assert pruned == {"kept": {"id": "x", "nested": {"value": 1}}}
@@ -0,0 +1,148 @@
+import io
+import pytest
+
+from lxml import etree
+from typing import List, Optional
+from pydantic import PrivateAttr
+from pydantic_xml import attr, element, wrapped
+from sdRDM import DataModel
+from sdRDM.base.listplus import ListPlus
+
+
+class TestXMLReader:
+
+    def _setup(self):
+        """Creates a run of spectra, each with wrapped peaks and a reference peak"""
+
+        class Peak(DataModel):
+            id: Optional[str] = attr(name="id", default=None)
+            position: Optional[float] = element(tag="position", default=None)
+
+            _repo: str = PrivateAttr(default="https://www.github.com/lab")
+
+        class Spectrum(DataModel):
+            id: Optional[str] = attr(name="id", default=None)
+            name: Optional[str] = element(tag="name", default=None)
+            peaks: List[Peak] = wrapped(
+                "analysis/peaks", element(tag="peak", default_factory=ListPlus)
+            )
+            reference: Optional[Peak] = element(tag="reference", default=None)
+            comment: Optional[str] = element(tag="comment", default=None)
+
+            _repo: str = PrivateAttr(default="https://www.github.com/lab")
+
+        class Run(DataModel):
+            id: Optional[str] = attr(name="id", default=None)
+            spectra: List[Spectrum] = wrapped(
+                "spectra", element(tag="spectrum", default_factory=ListPlus)
+            )
+
+            _repo: str = PrivateAttr(default="https://www.github.com/lab")
+
+        return Run(
+            id="run",
+            spectra=[
+                Spectrum(
+                    id=f"s{index}",
+                    name=f"Spectrum {index}",
+                    peaks=[
+                        Peak(id=f"s{index}p{number}", position=number)
+                        for number in range(3)
+                    ],
+                    reference=Peak(id=f"ref{index}"),
+                    comment="after the peaks",
+                )
+                for index in range(4)
+            ],
+        )
+
+    @pytest.mark.unit
+    def test_load_matches_tree(self):
+        """Tests whether the incrementally read object equals the one read from a tree"""
+
+        # Arrange
+        run = self._setup()
+        xml = run.xml()
+
+        # Act
+        loaded = type(run).from_xml_string(xml)
+        expected = type(run).from_xml_tree(etree.fromstring(xml.encode()))
+
+        # Assert
+        assert loaded.to_dict() == expected.to_dict()
+        assert loaded.spectra[2].comment == "after the peaks"
+        assert loaded.spectra[1]._parent is loaded
+        assert loaded.spectra[1].peaks[0]._parent is loaded.spectra[1]
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "path,expected",
+        [
+            ("spectra", ["s0", "s1", "s2", "s3"]),
+            ("spectra/reference", ["ref0", "ref1", "ref2", "ref3"]),
+            ("/spectra/peaks/", [f"s{i}p{j}" for i in range(4) for j in range(3)]),
+        ],
+    )
+    def test_iter_xml(self, path, expected):
+        """Tests whether objects at a path are yielded one after another"""
+
+        # Arrange
+        run = self._setup()
+        handler = io.BytesIO(run.xml().encode())
+
+        # Act
+        ids = [obj.id for obj in type(run).iter_xml(handler, path)]
+
+        # Assert
+        assert ids == expected
+
+    @pytest.mark.unit
+    def test_iter_xml_file(self, tmp_path):
+        """Tests whether objects are streamed from compressed paths"""
+
+        # Arrange
+        run = self._setup()
+        path = tmp_path / "run.xml.gz"
+        run.dump_xml(path)
+
+        # Act
+        spectra = list(type(run).iter_xml(path, "spectra"))
+
+        # Assert
+        assert [len(spectrum.peaks) for spectrum in spectra] == [3, 3, 3, 3]
+        assert spectra[3].peaks[2].position == 2.0
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("path", ["", "unknown", "spectra/name"])
+    def test_iter_xml_invalid_path(self, path):
+        """Tests whether paths not pointing to objects are rejected"""
+
+        # Arrange
+        run = self._setup()
+        handler = io.BytesIO(run.xml().encode())
+
+        # Act
+        with pytest.raises(ValueError):
+            list(type(run).iter_xml(handler, path))
+
+    @pytest.mark.unit
+    def test_errors_state_source_line(self):
+        """Tests whether validation errors of streamed objects name the line of the element"""
+
+        # Arrange
+        run = self._setup()
+        xml = run.xml().replace(
+            "<position>1.0</position>", "<position>high</position>", 1
+        )
+        line = next(
+            number
+            for number, content in enumerate(xml.splitlines(), start=1)
+            if "high" in content
+        )
+
+        # Act
+        with pytest.raises(ValueError) as error:
+            type(run).from_xml_string(xml)
+
+        # Assert
+        assert f"[line {line}]" in str(error.value)
@@ -0,0 +1,118 @@
+import io
+import pytest
+
+from lxml import etree
+from typing import List, Optional, Union
+from pydantic import PrivateAttr
+from pydantic_xml import attr, element, wrapped
+from sdRDM import DataModel
+from sdRDM.base.listplus import ListPlus
+
+NSMAP = {"": "http://www.example.com/lab", "unit": "http://www.example.com/unit"}
+
+
+def _canonical(xml: bytes) -> bytes:
+    return etree.tostring(etree.fromstring(xml), method="c14n")
+
+
+class TestXMLStream:
+
+    def _setup(self, size: int = 3):
+        """Creates a namespaced spectrum with wrapped lists, a union list and a sub-object"""
+
+        class Peak(DataModel, nsmap=NSMAP):
+            id: Optional[str] = attr(name="id", default=None)
+            position: Optional[float] = element(tag="position", default=None)
+            labels: List[str] = wrapped(
+                "labels", element(tag="label", default_factory=ListPlus)
+            )
+
+            _repo: str = PrivateAttr(default="https://www.github.com/lab")
+
+        class Note(DataModel, nsmap=NSMAP):
+            author: Optional[str] = attr(name="author", default=None)
+            content: Optional[str] = None
+
+            _repo: str = PrivateAttr(default="https://www.github.com/lab")
+
+        class Spectrum(DataModel, nsmap=NSMAP):
+            id: Optional[str] = attr(name="id", default=None)
+            name: Optional[str] = element(tag="name", default=None)
+            peaks: List[Peak] = wrapped(
+                "analysis/peaks", element(tag="peak", default_factory=ListPlus)
+            )
+            notes: List[Note] = element(tag="note", default_factory=ListPlus)
+            reference: Optional[Peak] = element(tag="reference", default=None)
+            extras: List[Union[Peak, Note]] = wrapped(
+                "extras", element(tag="extra", default_factory=ListPlus)
+            )
+            empty: List[Peak] = wrapped(
+                "empty", element(tag="peak", default_factory=ListPlus)
+            )
+
+            _repo: str = PrivateAttr(default="https://www.github.com/lab")
+
+        return Spectrum(
+            id="spectrum",
+            name="Spectrum",
+            peaks=[
+                Peak(id=f"p{index}", position=index * 0.5, labels=["a", "b"])
+                for index in range(size)
+            ],
+            notes=[Note(author="me", content="first & <second>")],
+            reference=Peak(id="ref", position=1.0),
+            extras=[Note(content="extra"), Peak(id="x")],
+        )
+
+    @pytest.mark.unit
+    def test_output_matches_tree(self):
+        """Tests whether the streamed document is equivalent to the one built as tree"""
+
+        # Arrange
+        spectrum = self._setup()
+        handler = io.BytesIO()
+
+        # Act
+        spectrum.dump_xml(handler)
+
+        # Assert
+        assert _canonical(handler.getvalue()) == _canonical(spectrum.xml().encode())
+
+    @pytest.mark.unit
+    def test_json_ld_elements_are_not_created(self, monkeypatch):
+        """Tests whether the JSON-LD context is neither computed nor written"""
+
+        # Arrange
+        spectrum = self._setup()
+        handler = io.BytesIO()
+
+        def fail(self):
+            raise AssertionError("JSON-LD context has been computed")
+
+        monkeypatch.setattr(DataModel, "json_ld_context", property(fail))
+
+        # Act
+        spectrum.dump_xml(handler)
+
+        # Assert
+        assert b"ld_context" not in handler.getvalue()
+        assert b"ld_type" not in handler.getvalue()
+
+    @pytest.mark.unit
+    def test_roundtrip(self):
+        """Tests whether the streamed document is read back to an equal object"""
+
+        # Arrange
+        spectrum = self._setup(size=50)
+        handler = io.BytesIO()
+
+        # Act
+        spectrum.dump_xml(handler)
+        loaded = type(spectrum).from_xml_string(handler.getvalue())
+
+        # Assert
+        assert len(loaded.peaks) == 50
+        assert loaded.peaks[10].labels == ["a", "b"]
+        assert loaded.notes[0].content == "first & <second>"
+        assert isinstance(loaded.extras[1], type(spectrum.reference))
+        assert loaded.reference.id == "ref"
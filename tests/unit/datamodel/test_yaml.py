@@ -0,0 +1,131 @@
+import io
+import pytest
+import yaml
+
+from typing import List, Optional
+from pydantic import PrivateAttr
+from pydantic_xml import attr, element
+from sdRDM import DataModel
+from sdRDM.base.ioutils.yamlio import _indent_sequences, dump_yaml
+from sdRDM.base.listplus import ListPlus
+from sdRDM.tools.utils import YAMLDumper
+
+
+class Sample(DataModel):
+    id: Optional[str] = attr(name="id", default=None)
+    label: Optional[str] = None
+    values: List[float] = element(tag="values", default_factory=ListPlus)
+
+    _repo: str = PrivateAttr(default="https://www.github.com/samples")
+
+
+class Plate(DataModel):
+    id: Optional[str] = attr(name="id", default=None)
+    description: Optional[str] = None
+    samples: List[Sample] = element(tag="samples", default_factory=ListPlus)
+
+    _repo: str = PrivateAttr(default="https://www.github.com/samples")
+
+
+def _build_plate(index: int = 0, description: Optional[str] = None) -> Plate:
+    return Plate(
+        id=f"plate{index}",
+        description=description,
+        samples=[
+            Sample(id=f"s{index}_{number}", label=f"Sample {number}", values=[0.5, 1.5])
+            for number in range(3)
+        ],
+    )
+
+
+def _python_dump(data) -> str:
+    return yaml.dump(data, Dumper=YAMLDumper, default_flow_style=False, sort_keys=False)
+
+
+class TestYAML:
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "data",
+        [
+            {"a": [{"b": [1, 2], "c": {"d": ["x", "y"]}}, {"e": []}], "f": {}},
+            {"a": [[1, [2, 3]], {"b": None}], "c": "multi\n\nline - text: here"},
+            {"a": {"b": {"c": ["'quoted'", '"double"', "- dash", "key: value"]}}},
+            {"a": ["word " * 30, {"b": "x" * 100}]},
+        ],
+    )
+    def test_output_matches_dumper(self, data):
+        """Tests whether the output equals the one of the pure-Python dumper"""
+
+        # Act
+        text = dump_yaml(data)
+
+        # Assert
+        assert text == _python_dump(data)
+        assert yaml.safe_load(text) == data
+
+    @pytest.mark.unit
+    def test_long_lines_are_not_indented(self):
+        """Tests whether documents with folded scalars are left to the pure-Python dumper"""
+
+        # Arrange
+        data = {"a": ["word " * 30]}
+
+        # Act
+        text = _indent_sequences(yaml.dump(data, Dumper=yaml.Dumper, sort_keys=False))
+
+        # Assert
+        assert text is None
+
+    @pytest.mark.unit
+    def test_model_output(self):
+        """Tests whether exported objects keep the indentation of sequences"""
+
+        # Arrange
+        plate = _build_plate(description="A plate " * 20)
+
+        # Act
+        text = plate.yaml()
+
+        # Assert
+        assert text == _python_dump(plate.to_dict())
+        assert "\n  - id: s0_0\n" in text
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("trusted", [False, True])
+    def test_multi_document_roundtrip(self, trusted):
+        """Tests whether multiple objects are written to and read from a single stream"""
+
+        # Arrange
+        plates = [_build_plate(index) for index in range(4)]
+        handler = io.StringIO()
+
+        # Act
+        count = DataModel.dump_yaml_all((plate for plate in plates), handler)
+        handler.seek(0)
+        loaded = list(Plate.iter_yaml(handler, trusted=trusted))
+
+        # Assert
+        assert count == 4
+        assert handler.getvalue() == yaml.dump_all(
+            [plate.to_dict() for plate in plates],
+            Dumper=YAMLDumper,
+            default_flow_style=False,
+            sort_keys=False,
+        )
+        assert [plate.id for plate in loaded] == [f"plate{index}" for index in range(4)]
+        assert loaded[2].samples[1].values == [0.5, 1.5]
+
+    @pytest.mark.unit
+    def test_multi_document_file(self, tmp_path):
+        """Tests whether multi-document files are streamed from compressed paths"""
+
+        # Arrange
+        path = tmp_path / "plates.yaml.gz"
+        DataModel.dump_yaml_all([_build_plate(index) for index in range(3)], path)
+
+        # Act
+        ids = [plate.id for plate in Plate.iter_yaml(path)]
+
+        # Assert
+        assert ids == ["plate0", "plate1", "plate2"]
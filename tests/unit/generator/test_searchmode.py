@@ -0,0 +1,129 @@
+import pytest
+
+from sdRDM import DataModel
+from sdRDM.generator.classrender import infer_search_mode, render_class
+from sdRDM.markdown.markdownparser import MarkdownParser
+
+
+def _attribute(name: str, xml: str = None) -> dict:
+    attribute = {"name": name, "type": ["str"], "required": False}
+
+    if xml is not None:
+        attribute["xml"] = xml
+
+    return attribute
+
+
+class TestInferSearchMode:
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "attributes,expected",
+        [
+            ([_attribute("a"), _attribute("b")], "ordered"),
+            ([_attribute("a", "data/a"), _attribute("b", "data/b")], "ordered"),
+            ([_attribute("a", "@a"), _attribute("b"), _attribute("c", "@c")], "ordered"),
+            ([_attribute("text", "Object"), _attribute("b")], "ordered"),
+            (
+                [_attribute("a", "data/a"), _attribute("b"), _attribute("c", "data/c")],
+                "unordered",
+            ),
+            ([_attribute("a", "v"), _attribute("b"), _attribute("c", "v")], "unordered"),
+        ],
+    )
+    def test_element_order(self, attributes, expected):
+        # Arrange
+        object = {"name": "Object", "attributes": attributes}
+
+        # Act
+        search_mode = infer_search_mode(object, [object], "ordered")
+
+        # Assert
+        assert search_mode == expected
+
+    @pytest.mark.unit
+    def test_unordered_by_default(self):
+        # Arrange
+        object = {"name": "Object", "attributes": [_attribute("a"), _attribute("b")]}
+
+        # Act
+        search_mode = infer_search_mode(object, [object])
+
+        # Assert
+        assert search_mode == "unordered"
+
+    @pytest.mark.unit
+    def test_inherited_attributes(self):
+        # Arrange
+        parent = {"name": "Parent", "attributes": [_attribute("a", "data/a"), _attribute("b")]}
+        child = {"name": "Child", "parent": "Parent", "attributes": [_attribute("c", "data/c")]}
+
+        # Act
+        search_mode = infer_search_mode(child, [parent, child], "strict")
+
+        # Assert
+        assert search_mode == "unordered"
+
+    @pytest.mark.unit
+    def test_forced_search_mode(self):
+        # Arrange
+        object = {"name": "Object", "docstring": None, "attributes": [_attribute("a")]}
+
+        # Act
+        rendered = render_class(
+            object=object,
+            inherits=[],
+            objects=[object],
+            namespaces={},
+            add_id_field=False,
+            search_mode="strict",
+        )
+
+        # Assert
+        assert 'search_mode="strict"' in rendered
+
+
+class TestGeneratedClasses:
+    @pytest.mark.unit
+    def test_elements_out_of_order_are_read(self, tmp_path):
+        # Arrange
+        path = tmp_path / "model.md"
+        path.write_text(
+            "# Model\n\n## Objects\n\n### Object\n\n- name\n  - Type: string\n- value\n  - Type: float\n"
+        )
+        lib = DataModel.from_markdown(str(path))
+
+        # Act
+        obj = lib.Object.from_xml_string(
+            "<Object><value>2.0</value><name>n</name></Object>"
+        )
+
+        # Assert
+        assert lib.Object.__xml_search_mode__ == "unordered"
+        assert obj.name == "n"
+        assert obj.value == 2.0
+
+
+class TestFrontmatter:
+    @pytest.mark.unit
+    def test_search_mode(self, tmp_path):
+        # Arrange
+        path = tmp_path / "model.md"
+        path.write_text(
+            "---\nxml-search-mode: strict\n---\n\n# Model\n\n### Object\n\n- value\n  - Type: string\n"
+        )
+
+        # Act
+        parser = MarkdownParser.parse(open(path))
+
+        # Assert
+        assert parser.search_mode == "strict"
+
+    @pytest.mark.unit
+    def test_invalid_search_mode(self, tmp_path):
+        # Arrange
+        path = tmp_path / "model.md"
+        path.write_text("---\nxml-search-mode: sorted\n---\n\n# Model\n")
+
+        # Act
+        with pytest.raises(ValueError):
+            MarkdownParser.parse(open(path))
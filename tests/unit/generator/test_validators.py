@@ -0,0 +1,116 @@
+import pytest
+
+from lxml import etree
+from sdRDM import DataModel
+from sdRDM.generator.classrender import render_class, render_reference_validator
+
+MODEL = """# Model
+
+## Objects
+
+### Dataset
+
+- name
+  - Type: string
+- measurements
+  - Type: Measurement[]
+  - XML: measurements/measurement
+
+### Measurement
+
+- value
+  - Type: float
+- raw
+  - Type: RawXML
+  - XML: raw
+
+### Extended [_Measurement_]
+
+- note
+  - Type: string
+"""
+
+
+def _object(name: str, attributes: list, parent: str = None) -> dict:
+    object = {"name": name, "docstring": None, "attributes": attributes}
+
+    if parent is not None:
+        object["parent"] = parent
+
+    return object
+
+
+class TestGeneratedValidators:
+    @pytest.mark.unit
+    def test_reference_validator_without_import(self):
+        # Arrange
+        species = _object("Species", [{"name": "name", "type": ["str"], "required": False}])
+        measurement = _object(
+            "Measurement",
+            [
+                {
+                    "name": "species_id",
+                    "type": ["Species"],
+                    "required": False,
+                    "reference": "Species.id",
+                }
+            ],
+        )
+
+        # Act
+        rendered = render_reference_validator(measurement, [species, measurement])
+
+        # Assert
+        assert "import" not in rendered
+        assert "isinstance(value, Species)" in rendered
+
+    @pytest.mark.unit
+    def test_raw_xml_hook_is_rendered_for_raw_attributes(self):
+        # Arrange
+        raw = {"name": "raw", "type": ["RawXML"], "required": False}
+        value = {"name": "value", "type": ["float"], "required": False}
+        parent = _object("Parent", [raw])
+        child = _object("Child", [value], parent="Parent")
+        plain = _object("Plain", [value])
+        objects = [parent, child, plain]
+
+        # Act
+        rendered = {
+            object["name"]: render_class(
+                object=object,
+                inherits=[],
+                objects=objects,
+                namespaces={},
+                add_id_field=False,
+            )
+            for object in objects
+        }
+
+        # Assert
+        assert "_parse_raw_xml_data" in rendered["Parent"]
+        assert "_parse_raw_xml_data" in rendered["Child"]
+        assert '"raw"' in rendered["Child"]
+        assert "_parse_raw_xml_data" not in rendered["Plain"]
+
+    @pytest.mark.unit
+    def test_raw_xml_is_captured_from_xml_only(self, tmp_path):
+        # Arrange
+        path = tmp_path / "model.md"
+        path.write_text(MODEL)
+        lib = DataModel.from_markdown(str(path))
+
+        measurement = lib.Extended(
+            value=1.0,
+            raw=etree.fromstring("<raw><x>1</x></raw>"),
+            note="note",
+        )
+        xml = lib.Dataset(name="dataset", measurements=[measurement]).xml()
+
+        # Act
+        from_string = lib.Dataset.from_xml_string(xml)
+        from_tree = lib.Dataset.from_xml_tree(etree.fromstring(xml.encode()))
+
+        # Assert
+        assert measurement._raw_xml_data is None
+        assert from_string.measurements[0]._raw_xml_data == {"raw": {"x": "1"}}
+        assert from_tree.measurements[0]._raw_xml_data == {"raw": {"x": "1"}}